@@ -0,0 +1,72 @@
+"""
+BENCHMARK : scaling of StateVectorCircuit with the number of threads
+
+USAGE :
+$ python benchmark/state_vector_circuit_num_threads.py \
+    --num-qubit 22 --num-layer 10 --max-num-threads 8
+"""
+
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+
+
+def create_layered_circuit(num_qubit: int, num_layer: int, seed: int) \
+        -> StateVectorCircuit:
+    """Each layer applies random rotations to all the qubits followed by a
+    ladder of cx gates.
+    """
+    rng = np.random.default_rng(seed)
+    circ = StateVectorCircuit(num_qubit)
+    for _ in range(num_layer):
+        for qubit in range(num_qubit):
+            for name in ["rx", "rz"]:
+                circ.add_gate({"name": name, "target_qubit": [qubit],
+                               "control_qubit": [], "control_value": [],
+                               "parameter": [float(rng.uniform(0, np.pi))]})
+        for qubit in range(num_qubit - 1):
+            circ.add_gate({"name": "x", "target_qubit": [qubit + 1],
+                           "control_qubit": [qubit], "control_value": [1],
+                           "parameter": []})
+    return circ
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-qubit", type=int, default=20)
+    parser.add_argument("--num-layer", type=int, default=10)
+    parser.add_argument("--max-num-threads", type=int,
+                        default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    circ = create_layered_circuit(args.num_qubit, args.num_layer, seed=0)
+    print(f"{args.num_qubit} qubits, {len(circ.gates)} gates, "
+          f"{os.cpu_count()} cpus")
+    print("threads  time [s]  speedup")
+
+    expect = None
+    for num_threads in range(1, args.max_num_threads + 1):
+        circ.set_num_threads(num_threads)
+        elapsed = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            state_vec = circ._get_state_vector()
+            elapsed.append(time.perf_counter() - start)
+
+        if expect is None:
+            expect = state_vec
+            base = min(elapsed)
+        assert np.allclose(state_vec, expect)
+
+        print(f"{num_threads:7d}  {min(elapsed):8.3f}  "
+              f"{base / min(elapsed):7.2f}")
+
+
+if __name__ == "__main__":
+    main()
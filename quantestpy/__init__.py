@@ -7,6 +7,8 @@ from .assertion.get_tgt_val import assert_get_tgt_val
 from .assertion.assert_circuit_equivalent_to_output_qubit_state \
     import assert_circuit_equivalent_to_output_qubit_state
 from .assertion.assert_unary_iteration import assert_unary_iteration
+from .assertion.assert_circuit_equivalent_to_truth_table import \
+    assert_circuit_equivalent_to_truth_table
 
 from .assertion.assert_circuit_equivalent_to_operator import \
     assert_circuit_equivalent_to_operator
@@ -1,83 +1,115 @@
-import itertools
-import re
-import traceback
 import unittest
 from typing import Union
 
-from quantestpy import QuantestPyCircuit
+import numpy as np
+
+from quantestpy import QuantestPyCircuit, StateVectorCircuit
 from quantestpy.assertion.assert_qubit_reset_to_zero_state import \
-    assert_qubit_reset_to_zero_state
+    _get_non_zero_qubits
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.state_vector_circuit import \
+    cvt_quantestpy_circuit_to_state_vector_circuit
 
 ut_test_case = unittest.TestCase()
 
+_METHODS = ("exhaustive", "superposition")
+_NUM_TRIAL_FOR_SUPERPOSITION = 2
+_SEED_FOR_SUPERPOSITION = 0
+
+
+def _get_input_indices(svc: StateVectorCircuit,
+                       ancilla_qubits: list) -> np.ndarray:
+    """Returns the computational basis indices in which all the ancilla
+    qubits are |0>, i.e. one index per state of the system qubits.
+    """
+    index = np.arange(2**svc.num_qubit)
+    is_input = np.ones(len(index), dtype=bool)
+    for qubit in ancilla_qubits:
+        is_input &= svc._get_bit_of_qubit(index, qubit) == 0
+    return index[is_input]
+
+
+def _get_error_qubits_by_exhaustive_search(svc: StateVectorCircuit,
+                                           ancilla_qubits: list,
+                                           atol: float) -> list:
+    """Runs the circuit for each computational basis state of the system
+    qubits, i.e. 2**(number of system qubits) times.
+    """
+    error_qubits = set()
+    for input_index in _get_input_indices(svc, ancilla_qubits):
+        state_vec = np.zeros(2**svc.num_qubit, dtype=np.complex128)
+        state_vec[input_index] = 1.
+        svc._apply_all_gates_to_state_vector(state_vec)
+        error_qubits.update(_get_non_zero_qubits(
+            svc, state_vec, ancilla_qubits, atol))
+
+    return sorted(error_qubits)
+
+
+def _get_error_qubits_by_superposition(svc: StateVectorCircuit,
+                                       ancilla_qubits: list,
+                                       atol: float) -> list:
+    """Runs the circuit once for a few superpositions of all the
+    computational basis states of the system qubits with random phases.
+    By linearity the amplitudes of the ancilla qubits on |1> are then
+    random combinations of those for the basis states, which vanish only
+    if all of them vanish (up to an accidental cancellation, the
+    probability of which the independent trials make negligible).
+    """
+    input_indices = _get_input_indices(svc, ancilla_qubits)
+
+    # with unit amplitudes, a leak of a single basis state is compared
+    # with atol as in the exhaustive search. Leaks of several basis states
+    # into the same output add up with the random phases instead, so that
+    # near atol the two methods may disagree in either direction.
+    rng = np.random.default_rng(_SEED_FOR_SUPERPOSITION)
+    phase = rng.random((len(input_indices), _NUM_TRIAL_FOR_SUPERPOSITION))
+    state_vec = np.zeros((2**svc.num_qubit, _NUM_TRIAL_FOR_SUPERPOSITION),
+                         dtype=np.complex128)
+    state_vec[input_indices] = np.exp(2j * np.pi * phase)
+    svc._apply_all_gates_to_state_vector(state_vec)
+
+    return _get_non_zero_qubits(svc, state_vec, sorted(ancilla_qubits), atol)
+
 
 def assert_ancilla_reset(circuit: Union[QuantestPyCircuit, str],
                          ancilla_qubits: list,
                          atol: float = 1e-8,
-                         msg=None) -> None:
+                         msg=None,
+                         method: str = "exhaustive") -> None:
 
     if not isinstance(ancilla_qubits, list):
         raise QuantestPyError(
             "ancilla_qubits must be a list of integer(s) as qubit's ID(s)."
         )
 
+    if method not in _METHODS:
+        raise QuantestPyError(
+            f"method must be one of {list(_METHODS)}."
+        )
+
     quantestpy_circuit = cvt_input_circuit_to_quantestpy_circuit(circuit)
+    svc = cvt_quantestpy_circuit_to_state_vector_circuit(quantestpy_circuit)
 
     num_qubit = quantestpy_circuit.num_qubit
 
-    # system qubits <=> ancilla qubits
-    system_qubits = [qubit for qubit in range(num_qubit)
-                     if qubit not in ancilla_qubits]
-
-    def _add_x_gate_in_front(gates: list, qubit: int) -> dict:
-        x_gate = {"name": "x",
-                  "target_qubit": [qubit],
-                  "control_qubit": [],
-                  "control_value": [],
-                  "parameter": []}
-        gates.insert(0, x_gate)
-
-    all_combinations_of_system_qubits = []
-    for size in range(len(system_qubits)+1):
-        c = list(itertools.combinations(system_qubits, size))
-        all_combinations_of_system_qubits += c
-
-    error_msgs_from_assert_is_zero = []
-    for comb_of_sys_qubits in all_combinations_of_system_qubits:
-
-        # add x gate(s) in quantestpy_circuit
-        for system_qubit in comb_of_sys_qubits:
-            _add_x_gate_in_front(quantestpy_circuit._gates, system_qubit)
-
-        # assertion using assert_is_zero
-        try:
-            assert_qubit_reset_to_zero_state(circuit=quantestpy_circuit,
-                                             qubits=ancilla_qubits,
-                                             atol=atol)
-
-        except QuantestPyAssertionError as e:
-            t = traceback.format_exception_only(type(e), e)[0]
-            error_msgs_from_assert_is_zero.append(t)
-
-        # remove x gate(s) from quantestpy_circuit,
-        # i.e. reset quantestpy_circuit.
-        for _ in comb_of_sys_qubits:
-            del quantestpy_circuit._gates[0]
-
-    if len(error_msgs_from_assert_is_zero) == 0:
-        return None  # = assertion non-error
-
-    error_qubits = []
-    for err_m_from_assert_is_zero in list(set(error_msgs_from_assert_is_zero)):
-        error_qubits_str_list = re.findall(r'\d+', err_m_from_assert_is_zero)
+    for qubit in ancilla_qubits:
+        if qubit > num_qubit-1:
+            raise QuantestPyError(
+                f"qubit {qubit} is out of range for the given circuit."
+            )
 
-        for error_qubit_str in error_qubits_str_list:
-            error_qubits.append(int(error_qubit_str))
+    if method == "exhaustive":
+        error_qubits = _get_error_qubits_by_exhaustive_search(
+            svc, ancilla_qubits, atol)
+    else:
+        error_qubits = _get_error_qubits_by_superposition(
+            svc, ancilla_qubits, atol)
 
-    error_qubits = list(set(error_qubits))
+    if len(error_qubits) == 0:
+        return None  # = assertion non-error
 
     error_msg = f"qubit(s) {error_qubits} are either non-zero or " \
         + "entangled with other qubits."
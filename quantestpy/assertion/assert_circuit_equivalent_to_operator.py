@@ -6,10 +6,15 @@ import numpy as np
 from quantestpy import QuantestPyCircuit
 from quantestpy.assertion.assert_equivalent_operators import \
     assert_equivalent_operators
+from quantestpy.assertion.result_cache import (_get_array_digest,
+                                               _get_whole_gates_with_cache,
+                                               _run_with_result_cache)
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
-from quantestpy.simulator.state_vector_circuit import \
-    cvt_quantestpy_circuit_to_state_vector_circuit
+from quantestpy.exceptions import QuantestPyError
+from quantestpy.simulator.state_vector_circuit import (
+    _DTYPE_TO_DEFAULT_ATOL, _is_supported_dtype,
+    cvt_quantestpy_circuit_to_state_vector_circuit)
 
 ut_test_case = unittest.TestCase()
 
@@ -19,10 +24,19 @@ def assert_circuit_equivalent_to_operator(
         operator_: Union[np.ndarray, np.matrix],
         from_right_to_left_for_qubit_ids: bool = False,
         rtol: float = 0.,
-        atol: float = 1e-8,
+        atol: Union[float, None] = None,
         up_to_global_phase: bool = False,
         matrix_norm_type: Union[str, None] = None,
-        msg=None) -> None:
+        msg=None,
+        dtype=np.complex128) -> None:
+
+    if not _is_supported_dtype(dtype):
+        raise QuantestPyError(
+            "dtype must be complex64 or complex128."
+        )
+
+    if atol is None:
+        atol = _DTYPE_TO_DEFAULT_ATOL[np.dtype(dtype)]
 
     quantestpy_circuit = cvt_input_circuit_to_quantestpy_circuit(circuit)
     state_vector_circuit = cvt_quantestpy_circuit_to_state_vector_circuit(
@@ -31,16 +45,30 @@ def assert_circuit_equivalent_to_operator(
 
     state_vector_circuit._from_right_to_left_for_qubit_ids = \
         from_right_to_left_for_qubit_ids
+    state_vector_circuit.set_dtype(dtype)
 
-    operator_from_state_vector_circuit = \
-        state_vector_circuit._get_whole_gates()
-
-    assert_equivalent_operators(
-        operator_from_state_vector_circuit,
-        operator_,
-        rtol,
-        atol,
-        up_to_global_phase,
-        matrix_norm_type,
-        msg
-    )
+    # the circuit is hashed once for both caches
+    structural_hash = quantestpy_circuit._get_structural_hash()
+
+    def assert_by_simulation() -> None:
+        operator_from_state_vector_circuit = \
+            _get_whole_gates_with_cache(state_vector_circuit, structural_hash)
+
+        assert_equivalent_operators(
+            operator_from_state_vector_circuit,
+            operator_,
+            rtol,
+            atol,
+            up_to_global_phase,
+            matrix_norm_type,
+            msg,
+            state_vector_circuit._operator_tile_size
+        )
+
+    _run_with_result_cache(
+        ("assert_circuit_equivalent_to_operator",
+         structural_hash, _get_array_digest(operator_),
+         from_right_to_left_for_qubit_ids,
+         rtol, atol, up_to_global_phase, matrix_norm_type, msg,
+         np.dtype(dtype).str),
+        assert_by_simulation)
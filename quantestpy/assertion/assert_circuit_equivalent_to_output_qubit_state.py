@@ -1,4 +1,3 @@
-import copy
 import re
 import sys
 
@@ -8,7 +7,8 @@ from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
 from quantestpy.simulator.pauli_circuit import (
-    PauliCircuit, cvt_quantestpy_circuit_to_pauli_circuit)
+    PauliCircuit, _map_in_process_pool, _split_into_shards,
+    cvt_quantestpy_circuit_to_pauli_circuit)
 from quantestpy.visualization.pauli_circuit_drawer import PauliCircuitDrawer
 
 
@@ -76,23 +76,31 @@ class PauliCircuitDrawerColorErrorQubit(PauliCircuitDrawer):
             self.add_obj_in_line_id_to_text(line_id, obj)
 
 
-def _assert_internal(pauli_circuit_org: PauliCircuit,
-                     input_reg: list,
-                     output_reg: list,
-                     in_bitstring: str,
-                     out_bitstring: str,
-                     out_phase: list):
-    # define the circuit object
-    pc = copy.deepcopy(pauli_circuit_org)
-    pc.set_qubit_value(input_reg, [int(i) for i in in_bitstring])
-    pc._execute_all_gates()
+def _get_outputs_in_batch(pauli_circuit_org: PauliCircuit,
+                          input_reg: list,
+                          output_reg: list,
+                          in_bitstrings: list) -> tuple:
+    """Executes the circuit for all the input bitstrings at once and
+    returns the output bitstrings and the output phases in unit of pi.
+    """
+    qubit_value, qubit_phase = \
+        pauli_circuit_org._get_qubit_value_and_phase_in_batch(
+            input_reg, in_bitstrings)
+    pauli_circuit_org._execute_all_gates_in_batch(qubit_value, qubit_phase)
 
     # get output
-    out_bitstring_actual = \
-        "".join([str(i) for i in pc.qubit_value[output_reg]])
-    out_phase_actual = (pc.qubit_phase[output_reg] / np.pi).tolist()
-    del pc
+    out_bitstrings_actual = [
+        "".join([str(i) for i in qubit_val])
+        for qubit_val in qubit_value[:, output_reg].tolist()]
+    out_phases_actual = (qubit_phase[:, output_reg] / np.pi).tolist()
+
+    return out_bitstrings_actual, out_phases_actual
 
+
+def _assert_output(out_bitstring: str,
+                   out_phase: list,
+                   out_bitstring_actual: str,
+                   out_phase_actual: list):
     if out_bitstring_actual != out_bitstring:
         return out_bitstring_actual, out_phase_actual
     elif len(out_phase) > 0 and out_phase_actual != out_phase:
@@ -101,6 +109,49 @@ def _assert_internal(pauli_circuit_org: PauliCircuit,
         return None
 
 
+def _assert_internal(pauli_circuit_org: PauliCircuit,
+                     input_reg: list,
+                     output_reg: list,
+                     in_bitstring: str,
+                     out_bitstring: str,
+                     out_phase: list):
+    out_bitstrings_actual, out_phases_actual = _get_outputs_in_batch(
+        pauli_circuit_org, input_reg, output_reg, [in_bitstring])
+
+    return _assert_output(out_bitstring,
+                          out_phase,
+                          out_bitstrings_actual[0],
+                          out_phases_actual[0])
+
+
+def _create_error_with_failures(err_msgs: list,
+                                failures: list,
+                                num_input: int) -> QuantestPyAssertionError:
+    """Returns a QuantestPyAssertionError reporting all the failures at once.
+    The table of the failures, one dict per failing input, and the number
+    of failing inputs per output qubit, most frequent first, are attached
+    as the attributes failures and qubit_to_num_failures.
+    """
+    qubit_to_num_failures = dict()
+    for failure in failures:
+        for qubit in failure["error_qubits"]:
+            qubit_to_num_failures[qubit] = \
+                qubit_to_num_failures.get(qubit, 0) + 1
+    qubit_to_num_failures = dict(sorted(qubit_to_num_failures.items(),
+                                        key=lambda item: (-item[1], item[0])))
+
+    err_msg = f"{len(failures)} of {num_input} inputs failed.\n" \
+        + "\n".join(err_msgs) + "\n" \
+        + "Failures per qubit: " \
+        + ", ".join([f"qubit {qubit}: {num_failures}"
+                     for qubit, num_failures in qubit_to_num_failures.items()])
+
+    error = QuantestPyAssertionError(err_msg)
+    error.failures = failures
+    error.qubit_to_num_failures = qubit_to_num_failures
+    return error
+
+
 def _draw_circuit(pauli_circuit_org: PauliCircuit,
                   input_reg: list,
                   output_reg: list,
@@ -110,7 +161,7 @@ def _draw_circuit(pauli_circuit_org: PauliCircuit,
                   color_phase: bool,
                   phase_err_reg: list) -> None:
     # define the circuit
-    pc = copy.deepcopy(pauli_circuit_org)
+    pc = pauli_circuit_org._create_execution_context()
     pc.set_qubit_value(input_reg, [int(i) for i in in_bitstring])
 
     # create an instance of CircuitDrawer
@@ -138,7 +189,9 @@ def assert_circuit_equivalent_to_output_qubit_state(
         input_reg: list,
         output_reg: list,
         input_to_output: dict,
-        draw_circuit: bool = False):
+        draw_circuit: bool = False,
+        n_jobs: int = 1,
+        collect_failures: bool = False):
     """
     e.g.
     input_to_output = {
@@ -156,10 +209,15 @@ def assert_circuit_equivalent_to_output_qubit_state(
         raise QuantestPyError("input_to_output must be a dict.")
     if not isinstance(draw_circuit, bool):
         raise QuantestPyError("draw_circuit must be bool type.")
+    if not isinstance(n_jobs, int) or n_jobs < 1:
+        raise QuantestPyError("n_jobs must be a positive integer.")
+    if not isinstance(collect_failures, bool):
+        raise QuantestPyError("collect_failures must be bool type.")
 
     len_input_reg = len(input_reg)
     len_output_reg = len(output_reg)
 
+    expected_outputs = []
     for in_bitstring, output in input_to_output.items():
         # check input type
         if not isinstance(in_bitstring, str):
@@ -189,13 +247,40 @@ def assert_circuit_equivalent_to_output_qubit_state(
         if len(out_bitstring) != len_output_reg:
             raise QuantestPyError("Output bitstring has an invalid length.")
 
+        expected_outputs.append((in_bitstring, out_bitstring, out_phase))
+
+    # execute the circuit for all inputs at once, or for a shard of the
+    # inputs in each process
+    in_bitstrings = list(input_to_output.keys())
+    if n_jobs == 1:
+        out_bitstrings_actual, out_phases_actual = _get_outputs_in_batch(
+            pc_org,
+            input_reg,
+            output_reg,
+            in_bitstrings
+        )
+    else:
+        out_bitstrings_actual, out_phases_actual = [], []
+        for out_bitstrings_shard, out_phases_shard in _map_in_process_pool(
+                pc_org,
+                _get_outputs_in_batch,
+                [(input_reg, output_reg, shard)
+                 for shard in _split_into_shards(in_bitstrings, n_jobs)],
+                n_jobs):
+            out_bitstrings_actual += out_bitstrings_shard
+            out_phases_actual += out_phases_shard
+
+    err_msgs, failures = [], []
+    for (in_bitstring, out_bitstring, out_phase), out_bitstring_actual, \
+            out_phase_actual in zip(expected_outputs,
+                                    out_bitstrings_actual,
+                                    out_phases_actual):
+
         # check equalness
-        return_from_assert_internal = _assert_internal(pc_org,
-                                                       input_reg,
-                                                       output_reg,
-                                                       in_bitstring,
-                                                       out_bitstring,
-                                                       out_phase)
+        return_from_assert_internal = _assert_output(out_bitstring,
+                                                     out_phase,
+                                                     out_bitstring_actual,
+                                                     out_phase_actual)
 
         if return_from_assert_internal is not None:
             out_bitstring_actual, out_phase_actual \
@@ -209,23 +294,23 @@ def assert_circuit_equivalent_to_output_qubit_state(
                 err_msg += f"\nOut phase expect: {out_phase}\n" \
                     + f"Out phase actual: {out_phase_actual}"
 
-            if draw_circuit:
-                # collect err qubit ids
-                val_err_reg, phase_err_reg = [], []
+            # collect err qubit ids
+            val_err_reg, phase_err_reg = [], []
+            for i, (j, k) in enumerate(
+                    zip(out_bitstring, out_bitstring_actual)):
+                if j != k:
+                    val_err_reg.append(output_reg[i])
+
+            if len(out_phase) > 0:
+                color_phase = True
                 for i, (j, k) in enumerate(
-                        zip(out_bitstring, out_bitstring_actual)):
+                        zip(out_phase, out_phase_actual)):
                     if j != k:
-                        val_err_reg.append(output_reg[i])
-
-                if len(out_phase) > 0:
-                    color_phase = True
-                    for i, (j, k) in enumerate(
-                            zip(out_phase, out_phase_actual)):
-                        if j != k:
-                            phase_err_reg.append(output_reg[i])
-                else:
-                    color_phase = False
+                        phase_err_reg.append(output_reg[i])
+            else:
+                color_phase = False
 
+            if draw_circuit:
                 _draw_circuit(pc_org,
                               input_reg,
                               output_reg,
@@ -235,5 +320,20 @@ def assert_circuit_equivalent_to_output_qubit_state(
                               color_phase,
                               phase_err_reg)
 
+            elif collect_failures:
+                err_msgs.append(err_msg)
+                failures.append({
+                    "in_bitstring": in_bitstring,
+                    "out_bitstring_expect": out_bitstring,
+                    "out_bitstring_actual": out_bitstring_actual,
+                    "out_phase_expect": out_phase,
+                    "out_phase_actual": out_phase_actual,
+                    "error_qubits": sorted(set(val_err_reg + phase_err_reg))
+                })
+
             else:
                 raise QuantestPyAssertionError(err_msg)
+
+    if len(failures) > 0:
+        raise _create_error_with_failures(
+            err_msgs, failures, len(expected_outputs))
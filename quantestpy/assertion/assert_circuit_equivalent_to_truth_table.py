@@ -0,0 +1,181 @@
+import unittest
+from typing import Callable, Union
+
+import numpy as np
+
+from quantestpy import PauliCircuit, QuantestPyCircuit
+from quantestpy.converter.converter_to_quantestpy_circuit import \
+    cvt_input_circuit_to_quantestpy_circuit
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.pauli_circuit import \
+    cvt_quantestpy_circuit_to_pauli_circuit
+
+ut_test_case = unittest.TestCase()
+
+_MAX_REG_LENGTH = 62
+# 2**30 inputs take minutes to simulate even for a few gates
+_MAX_INPUT_QUBITS = 30
+# inputs simulated in one batch, which bounds the memory
+_INPUT_CHUNK_SIZE = 2**16
+# failing inputs shown in the error message
+_MAX_FAILURES_IN_MSG = 20
+
+
+def _get_reg_val_from_qubit_vals(qubit_vals: np.ndarray) -> np.ndarray:
+    """Converts qubit values of shape (num_input, len(reg)) into the
+    integer value of reg, where the first qubit of reg is the most
+    significant bit.
+    """
+    len_reg = qubit_vals.shape[1]
+    weights = 1 << np.arange(len_reg - 1, -1, -1, dtype=np.int64)
+    return qubit_vals.astype(np.int64) @ weights
+
+
+def _get_qubit_vals_from_reg_val(reg_val: np.ndarray,
+                                 len_reg: int) -> np.ndarray:
+    """Inverse of _get_reg_val_from_qubit_vals."""
+    shifts = np.arange(len_reg - 1, -1, -1, dtype=np.int64)
+    return ((reg_val[:, np.newaxis] >> shifts) & 1).astype(np.uint8)
+
+
+def _get_output_vals(pc: PauliCircuit, input_reg: dict, input_qubits: list,
+                     output_reg: list, expected: Callable, vectorized: bool,
+                     input_val: np.ndarray) -> tuple:
+    """Executes the circuit for the inputs given by input_val, the values
+    of input_qubits read as one register. Returns the values of the input
+    registers and the expected and actual values of output_reg.
+    """
+    num_input = len(input_val)
+    qubit_vals = _get_qubit_vals_from_reg_val(input_val, len(input_qubits))
+    name_to_reg_val = dict()
+    col = 0
+    for name, reg in input_reg.items():
+        name_to_reg_val[name] = _get_reg_val_from_qubit_vals(
+            qubit_vals[:, col:col+len(reg)])
+        col += len(reg)
+
+    # execute the circuit for all the inputs at once
+    qubit_value, qubit_phase = pc._get_qubit_value_and_phase_for_qubit_vals(
+        input_qubits, qubit_vals)
+    pc._execute_all_gates_in_batch(qubit_value, qubit_phase)
+    out_val_actual = _get_reg_val_from_qubit_vals(qubit_value[:, output_reg])
+
+    # expected outputs
+    if vectorized:
+        out_val_expect = np.asarray(expected(**name_to_reg_val))
+    else:
+        out_val_expect = np.array([
+            expected(**{name: int(reg_val[i])
+                        for name, reg_val in name_to_reg_val.items()})
+            for i in range(num_input)])
+    try:
+        out_val_expect = np.broadcast_to(out_val_expect, (num_input,))
+    except ValueError:
+        raise QuantestPyError(
+            "expected must return one integer per input."
+        )
+    if not np.issubdtype(out_val_expect.dtype, np.integer):
+        raise QuantestPyError("expected must return integers.")
+    # the output register holds the expected value modulo 2**len(output_reg)
+    out_val_expect = out_val_expect % 2**len(output_reg)
+
+    return name_to_reg_val, out_val_expect, out_val_actual
+
+
+def assert_circuit_equivalent_to_truth_table(
+        circuit: Union[QuantestPyCircuit, str],
+        input_reg: dict,
+        output_reg: list,
+        expected: Callable,
+        vectorized: bool = True,
+        msg=None) -> None:
+    """
+    e.g.
+    input_reg = {"a": [12, 9, 6, 3, 0], "b": [13, 10, 7, 4, 1]}
+    output_reg = [13, 10, 7, 4, 1]
+    expected = lambda a, b: a + b
+    """
+    quantestpy_circuit = cvt_input_circuit_to_quantestpy_circuit(circuit)
+    pc = cvt_quantestpy_circuit_to_pauli_circuit(quantestpy_circuit)
+
+    # check inputs
+    if not isinstance(input_reg, dict):
+        raise QuantestPyError(
+            "input_reg must be a dict from register names to lists of "
+            "qubit ids."
+        )
+    input_qubits = []
+    for name, reg in input_reg.items():
+        if not isinstance(name, str) or not name.isidentifier():
+            raise QuantestPyError(
+                "Register names in input_reg must be valid identifiers."
+            )
+        pc._assert_is_correct_reg(reg)
+        if len(reg) > _MAX_REG_LENGTH:
+            raise QuantestPyError(
+                f"Register {name} is longer than {_MAX_REG_LENGTH} qubits."
+            )
+        input_qubits += reg
+    if len(input_qubits) != len(set(input_qubits)):
+        raise QuantestPyError(
+            "Registers in input_reg must not share qubits."
+        )
+    if len(input_qubits) > _MAX_INPUT_QUBITS:
+        raise QuantestPyError(
+            f"input_reg has more than {_MAX_INPUT_QUBITS} qubits in total."
+        )
+    pc._assert_is_correct_reg(output_reg)
+    if len(output_reg) > _MAX_REG_LENGTH:
+        raise QuantestPyError(
+            f"output_reg is longer than {_MAX_REG_LENGTH} qubits."
+        )
+    if not callable(expected):
+        raise QuantestPyError("expected must be callable.")
+    if not isinstance(vectorized, bool):
+        raise QuantestPyError("vectorized must be bool type.")
+
+    # all the inputs, a chunk at a time: the first register takes the most
+    # significant bits
+    num_input = 2**len(input_qubits)
+    err_reg_vals = {name: [] for name in input_reg}
+    err_out_val_expect, err_out_val_actual = [], []
+    for chunk_start in range(0, num_input, _INPUT_CHUNK_SIZE):
+        input_val = np.arange(
+            chunk_start, min(chunk_start + _INPUT_CHUNK_SIZE, num_input),
+            dtype=np.int64)
+        name_to_reg_val, out_val_expect, out_val_actual = \
+            _get_output_vals(pc, input_reg, input_qubits, output_reg,
+                             expected, vectorized, input_val)
+
+        err_index = np.nonzero(out_val_expect != out_val_actual)[0]
+        for name, reg_val in name_to_reg_val.items():
+            err_reg_vals[name].append(reg_val[err_index])
+        err_out_val_expect.append(out_val_expect[err_index])
+        err_out_val_actual.append(out_val_actual[err_index])
+
+    failures = {
+        "input_reg": {name: np.concatenate(reg_vals)
+                      for name, reg_vals in err_reg_vals.items()},
+        "out_expect": np.concatenate(err_out_val_expect),
+        "out_actual": np.concatenate(err_out_val_actual)
+    }
+    num_failure = len(failures["out_expect"])
+    if num_failure == 0:
+        return None
+
+    # report the first failing inputs, all of them are attached to the error
+    error_msg = f"{num_failure} of {num_input} inputs failed."
+    for i in range(min(num_failure, _MAX_FAILURES_IN_MSG)):
+        in_vals = ", ".join([f"{name}={reg_val[i]}"
+                             for name, reg_val
+                             in failures["input_reg"].items()])
+        error_msg += f"\nIn: {in_vals}\n" \
+            + f"Out expect: {failures['out_expect'][i]}\n" \
+            + f"Out actual: {failures['out_actual'][i]}"
+    if num_failure > _MAX_FAILURES_IN_MSG:
+        error_msg += f"\n... and {num_failure - _MAX_FAILURES_IN_MSG} " \
+            + "more failing inputs, see the attribute failures."
+    msg = ut_test_case._formatMessage(msg, error_msg)
+    error = QuantestPyAssertionError(msg)
+    error.failures = failures
+    raise error
@@ -1,26 +1,103 @@
 import unittest
 from typing import Union
 
-from quantestpy import QuantestPyCircuit
+import numpy as np
+
+from quantestpy import QuantestPyCircuit, StateVectorCircuit
 from quantestpy.assertion.assert_equivalent_operators import \
     assert_equivalent_operators
+from quantestpy.assertion.result_cache import (_get_whole_gates_with_cache,
+                                               _run_with_result_cache)
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
-from quantestpy.exceptions import QuantestPyError
-from quantestpy.simulator.state_vector_circuit import \
-    cvt_quantestpy_circuit_to_state_vector_circuit
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.state_vector_circuit import (
+    _DTYPE_TO_DEFAULT_ATOL, _is_supported_dtype,
+    cvt_quantestpy_circuit_to_state_vector_circuit)
 
 ut_test_case = unittest.TestCase()
 
 
+def _assert_equivalent_circuits_by_streaming(
+        state_vector_circuit_a: StateVectorCircuit,
+        state_vector_circuit_b: StateVectorCircuit,
+        rtol: float,
+        atol: float,
+        up_to_global_phase: bool,
+        block_size: int,
+        msg: Union[str, None]) -> None:
+    """Compares the operators of the two circuits block_size columns at a
+    time. Each block of basis vectors is pushed through both circuits and
+    the comparison stops at the first block with a mismatch. With
+    up_to_global_phase, the global phases are those of the largest element
+    of the first block rather than of the whole operator as in
+    assert_equivalent_operators, so that for differences near atol the
+    verdict may depend on streaming and on block_size.
+    """
+    if state_vector_circuit_a.num_qubit != state_vector_circuit_b.num_qubit:
+        raise QuantestPyError(
+            "The shapes of the operators must be the same."
+        )
+
+    dim = 2**state_vector_circuit_a.num_qubit
+    global_phase_a, global_phase_b = None, None
+
+    for col_start in range(0, dim, block_size):
+        col_end = min(col_start + block_size, dim)
+
+        # basis vectors for the columns col_start, ..., col_end-1
+        cols_a = np.zeros((dim, col_end - col_start),
+                          dtype=state_vector_circuit_a._dtype)
+        cols_a[np.arange(col_start, col_end),
+               np.arange(col_end - col_start)] = 1.
+        cols_b = cols_a.copy()
+
+        state_vector_circuit_a._apply_all_gates_to_state_vector(cols_a)
+        state_vector_circuit_b._apply_all_gates_to_state_vector(cols_b)
+
+        # remove global phase, which is fixed by the largest element of
+        # the first block.
+        if up_to_global_phase:
+            if global_phase_a is None:
+                abs_cols_a = np.abs(cols_a)
+                max_index_abs_cols_a = np.unravel_index(
+                    np.argmax(abs_cols_a), abs_cols_a.shape)
+                global_phase_a = cols_a[max_index_abs_cols_a] \
+                    / abs_cols_a[max_index_abs_cols_a]
+                global_phase_b = cols_b[max_index_abs_cols_a] \
+                    / abs(cols_b[max_index_abs_cols_a])
+
+            cols_a = cols_a * global_phase_a.conj()
+            cols_b = cols_b * global_phase_b.conj()
+
+        # assert equal
+        try:
+            np.testing.assert_allclose(
+                actual=cols_a,
+                desired=cols_b,
+                rtol=rtol,
+                atol=atol,
+                err_msg=f"Up to global phase: {up_to_global_phase}\n"
+                f"Columns: {col_start} to {col_end - 1}"
+            )
+
+        except AssertionError as e:
+            error_msg = e.args[0]
+            msg = ut_test_case._formatMessage(msg, error_msg)
+            raise QuantestPyAssertionError(msg)
+
+
 def assert_equivalent_circuits(
         circuit_a: Union[QuantestPyCircuit, str],
         circuit_b: Union[QuantestPyCircuit, str],
         rtol: float = 0.,
-        atol: float = 1e-8,
+        atol: Union[float, None] = None,
         up_to_global_phase: bool = False,
         matrix_norm_type: Union[str, None] = None,
-        msg: Union[str, None] = None):
+        msg: Union[str, None] = None,
+        streaming: bool = False,
+        block_size: Union[int, None] = None,
+        dtype=np.complex128):
 
     if matrix_norm_type is not None and matrix_norm_type not in \
         ["operator_norm_1", "operator_norm_2",
@@ -32,7 +109,7 @@ def assert_equivalent_circuits(
             "'Frobenius_norm' and 'max_norm'."
         )
 
-    if not isinstance(atol, float):
+    if atol is not None and not isinstance(atol, float):
         raise QuantestPyError(
             "Type of atol must be float."
         )
@@ -42,6 +119,30 @@ def assert_equivalent_circuits(
             "Type of rtol must be float."
         )
 
+    if not isinstance(streaming, bool):
+        raise QuantestPyError(
+            "Type of streaming must be bool."
+        )
+
+    if streaming and matrix_norm_type is not None:
+        raise QuantestPyError(
+            "matrix_norm_type is not supported in streaming mode."
+        )
+
+    if block_size is not None and \
+            (not isinstance(block_size, int) or block_size < 1):
+        raise QuantestPyError(
+            "block_size must be an integer greater than 0 or None."
+        )
+
+    if not _is_supported_dtype(dtype):
+        raise QuantestPyError(
+            "dtype must be complex64 or complex128."
+        )
+
+    if atol is None:
+        atol = _DTYPE_TO_DEFAULT_ATOL[np.dtype(dtype)]
+
     quantestpy_circuit_a = cvt_input_circuit_to_quantestpy_circuit(circuit_a)
     quantestpy_circuit_b = cvt_input_circuit_to_quantestpy_circuit(circuit_b)
 
@@ -51,17 +152,58 @@ def assert_equivalent_circuits(
     state_vector_circuit_b = cvt_quantestpy_circuit_to_state_vector_circuit(
         quantestpy_circuit_b
     )
+    state_vector_circuit_a.set_dtype(dtype)
+    state_vector_circuit_b.set_dtype(dtype)
 
-    whole_gates_a = state_vector_circuit_a._get_whole_gates()
-    whole_gates_b = state_vector_circuit_b._get_whole_gates()
-
-    # call operator.assert_equal
-    assert_equivalent_operators(
-        whole_gates_a,
-        whole_gates_b,
-        rtol,
-        atol,
-        up_to_global_phase,
-        matrix_norm_type,
-        msg
-    )
+    # columns are compared in the same tiles as the operators
+    tile_size = min(state_vector_circuit_a._operator_tile_size,
+                    state_vector_circuit_b._operator_tile_size)
+    if block_size is None:
+        block_size = tile_size
+
+    # each circuit is hashed once for the comparison and the caches
+    structural_hash_a = quantestpy_circuit_a._get_structural_hash()
+    structural_hash_b = quantestpy_circuit_b._get_structural_hash()
+
+    # identical circuits are equivalent without simulating them, as for
+    # quantestpy_circuit_a == quantestpy_circuit_b
+    if type(quantestpy_circuit_a) is type(quantestpy_circuit_b) \
+            and structural_hash_a == structural_hash_b:
+        return
+
+    def assert_by_simulation() -> None:
+        if streaming:
+            _assert_equivalent_circuits_by_streaming(
+                state_vector_circuit_a,
+                state_vector_circuit_b,
+                rtol,
+                atol,
+                up_to_global_phase,
+                block_size,
+                msg
+            )
+            return
+
+        whole_gates_a = _get_whole_gates_with_cache(
+            state_vector_circuit_a, structural_hash_a)
+        whole_gates_b = _get_whole_gates_with_cache(
+            state_vector_circuit_b, structural_hash_b)
+
+        # call operator.assert_equal
+        assert_equivalent_operators(
+            whole_gates_a,
+            whole_gates_b,
+            rtol,
+            atol,
+            up_to_global_phase,
+            matrix_norm_type,
+            msg,
+            tile_size
+        )
+
+    _run_with_result_cache(
+        ("assert_equivalent_circuits",
+         structural_hash_a, structural_hash_b,
+         rtol, atol, up_to_global_phase, matrix_norm_type, msg, streaming,
+         block_size, np.dtype(dtype).str),
+        assert_by_simulation)
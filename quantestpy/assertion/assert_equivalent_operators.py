@@ -6,6 +6,8 @@ import numpy as np
 from quantestpy.assertion.assert_equivalent_state_vectors import \
     _remove_global_phase_from_two_vectors
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.state_vector_circuit import \
+    _get_default_operator_tile_size
 
 ut_test_case = unittest.TestCase()
 
@@ -53,6 +55,73 @@ def _get_matrix_norm(
     return matrix_norm_value
 
 
+def _get_global_phases_by_tiles(a: np.ndarray,
+                                b: np.ndarray,
+                                tile_size: int) -> tuple:
+    """Returns the global phases of a and b removed by
+    _remove_global_phase_from_two_vectors, i.e. those of their elements at
+    the first largest element of a in row major order, reading the
+    operators tile_size columns at a time.
+    """
+    max_abs_a, max_index = -1., None
+    num_col = a.shape[1]
+    for col_start in range(0, num_col, tile_size):
+        abs_a = np.abs(a[:, col_start:col_start + tile_size])
+        max_abs_tile = abs_a.max()
+        if max_abs_tile < max_abs_a:
+            continue
+        row, col = np.nonzero(abs_a == max_abs_tile)
+        index = min(zip(row.tolist(), (col + col_start).tolist()))
+        if max_abs_tile > max_abs_a or index < max_index:
+            max_abs_a, max_index = max_abs_tile, index
+
+    global_phase_a = a[max_index] / max_abs_a
+    global_phase_b = b[max_index] / abs(b[max_index])
+    return global_phase_a, global_phase_b
+
+
+def _assert_equivalent_operators_by_tiles(
+        a: np.ndarray,
+        b: np.ndarray,
+        rtol: float,
+        atol: float,
+        up_to_global_phase: bool,
+        tile_size: int,
+        msg: Union[str, None]) -> None:
+    """Compares the operators tile_size columns at a time so that neither
+    of them is read into memory as a whole, e.g. when it is numpy.memmap.
+    The comparison stops at the first tile with a mismatch.
+    """
+    if up_to_global_phase:
+        global_phase_a, global_phase_b = \
+            _get_global_phases_by_tiles(a, b, tile_size)
+
+    num_col = a.shape[1]
+    for col_start in range(0, num_col, tile_size):
+        col_end = min(col_start + tile_size, num_col)
+        cols_a = np.asarray(a[:, col_start:col_end])
+        cols_b = np.asarray(b[:, col_start:col_end])
+
+        if up_to_global_phase:
+            cols_a = cols_a * global_phase_a.conj()
+            cols_b = cols_b * global_phase_b.conj()
+
+        try:
+            np.testing.assert_allclose(
+                actual=cols_a,
+                desired=cols_b,
+                rtol=rtol,
+                atol=atol,
+                err_msg=f"Up to global phase: {up_to_global_phase}\n"
+                f"Columns: {col_start} to {col_end - 1}"
+            )
+
+        except AssertionError as e:
+            error_msg = e.args[0]
+            msg = ut_test_case._formatMessage(msg, error_msg)
+            raise QuantestPyAssertionError(msg)
+
+
 def assert_equivalent_operators(
         operator_a: Union[np.ndarray, np.matrix],
         operator_b: Union[np.ndarray, np.matrix],
@@ -60,7 +129,14 @@ def assert_equivalent_operators(
         atol: float = 1e-8,
         up_to_global_phase: bool = False,
         matrix_norm_type: Union[str, None] = None,
-        msg=None) -> None:
+        msg=None,
+        tile_size: Union[int, None] = None) -> None:
+
+    if tile_size is not None and \
+            (not isinstance(tile_size, int) or tile_size < 1):
+        raise QuantestPyError(
+            "tile_size must be a positive integer or None."
+        )
 
     a = operator_a
     b = operator_b
@@ -78,6 +154,15 @@ def assert_equivalent_operators(
             "The shapes of the operators must be the same."
         )
 
+    # memory-mapped operators are compared without reading them as a whole
+    if matrix_norm_type is None and a.ndim == 2 \
+            and (isinstance(a, np.memmap) or isinstance(b, np.memmap)):
+        if tile_size is None:
+            tile_size = _get_default_operator_tile_size()
+        _assert_equivalent_operators_by_tiles(
+            a, b, rtol, atol, up_to_global_phase, tile_size, msg)
+        return
+
     # remove global phase
     if up_to_global_phase:
         a_shape = a.shape
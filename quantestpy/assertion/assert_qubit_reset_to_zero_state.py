@@ -3,7 +3,7 @@ from typing import Union
 
 import numpy as np
 
-from quantestpy import QuantestPyCircuit
+from quantestpy import QuantestPyCircuit, StateVectorCircuit
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
@@ -13,6 +13,48 @@ from quantestpy.simulator.state_vector_circuit import \
 ut_test_case = unittest.TestCase()
 
 
+def _get_non_zero_qubits(svc: StateVectorCircuit,
+                         state_vec: np.ndarray,
+                         qubits: list,
+                         atol: float) -> list:
+    """Returns the qubits in qubits having an amplitude larger than atol on
+    |1> in state_vec of shape (2**num_qubit,) or (2**num_qubit, k).
+    The state vector is scanned once: the qubits in |1> for some
+    amplitude larger than atol are the set bits of the bitwise OR of the
+    indices of all such amplitudes.
+    """
+    index = np.nonzero(np.abs(state_vec) > atol)[0]
+    if len(index) == 0:
+        return []
+    index_or = int(np.bitwise_or.reduce(index))
+
+    return [qubit for qubit in qubits
+            if svc._get_bit_of_qubit(index_or, qubit) == 1]
+
+
+def _get_reduced_state_diagnostics(svc: StateVectorCircuit,
+                                   state_vec: np.ndarray,
+                                   qubits: list) -> tuple:
+    """Returns the probabilities of |1> and the purities of the reduced
+    density matrices of qubits in state_vec of shape (2**num_qubit,).
+    A purity less than 1 indicates that the qubit is entangled with the
+    other qubits.
+    """
+    state_tensor = state_vec.reshape((2,) * svc.num_qubit)
+
+    prob_one = np.empty(len(qubits))
+    purity = np.empty(len(qubits))
+    for i, qubit in enumerate(qubits):
+        axis = svc._get_axis_of_qubit(qubit)
+        amplitudes = np.moveaxis(state_tensor, axis, 0).reshape(2, -1)
+        reduced_density_matrix = amplitudes @ amplitudes.conj().T
+        reduced_density_matrix /= np.trace(reduced_density_matrix).real
+        prob_one[i] = reduced_density_matrix[1, 1].real
+        purity[i] = np.sum(np.abs(reduced_density_matrix)**2)
+
+    return prob_one, purity
+
+
 def assert_qubit_reset_to_zero_state(circuit: Union[QuantestPyCircuit, str],
                                      qubits: list = None,
                                      atol: float = 1e-8,
@@ -28,39 +70,28 @@ def assert_qubit_reset_to_zero_state(circuit: Union[QuantestPyCircuit, str],
         quantestpy_circuit
     )
 
-    state_vec = state_vector_circuit._get_state_vector()
     num_qubit = state_vector_circuit.num_qubit
     if qubits is None:
         qubits = [i for i in range(num_qubit)]
 
-    def _assert_is_zero_for_one_qubit(qubit: int) -> bool:
-
+    for qubit in qubits:
         if qubit > num_qubit-1:
             raise QuantestPyError(
                 f"qubit {qubit} is out of range for the given circuit."
             )
 
-        dim_reg_front = 2**qubit
-        dim_reg_rear = 2**(num_qubit - qubit - 1)
-
-        for i in range(dim_reg_front):
-            clipped_state_vec = \
-                state_vec[i*dim_reg_rear*2: (i+1)*dim_reg_rear*2]
-            clipped_state_vec = clipped_state_vec[dim_reg_rear:]
-            clipped_state_vec = np.abs(clipped_state_vec)
-
-            if not np.all(clipped_state_vec <= atol):
-                return True  # = assertion error
-
-        return False  # = assertion non-error
-
-    error_qubits = []
-    for qubit in qubits:
-        if _assert_is_zero_for_one_qubit(qubit):
-            error_qubits.append(qubit)
+    state_vec = state_vector_circuit._get_state_vector()
+    error_qubits = _get_non_zero_qubits(
+        state_vector_circuit, state_vec, qubits, atol)
 
     if len(error_qubits) > 0:
+        prob_one, purity = _get_reduced_state_diagnostics(
+            state_vector_circuit, state_vec, error_qubits)
+
         error_msg = f"qubit(s) {error_qubits} are either non-zero or " \
             + "entangled with other qubits."
+        for qubit, p, r in zip(error_qubits, prob_one, purity):
+            error_msg += f"\nqubit {qubit}: probability of |1> = {p:.6g}, " \
+                + f"purity = {r:.6g}"
         msg = ut_test_case._formatMessage(msg, error_msg)
         raise QuantestPyAssertionError(msg)
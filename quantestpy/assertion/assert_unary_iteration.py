@@ -1,4 +1,4 @@
-import copy
+import itertools
 import re
 import sys
 from typing import Union
@@ -6,12 +6,13 @@ from typing import Union
 import numpy as np
 
 from quantestpy.assertion.assert_circuit_equivalent_to_output_qubit_state \
-    import PauliCircuitDrawerColorErrorQubit
+    import PauliCircuitDrawerColorErrorQubit, _create_error_with_failures
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
 from quantestpy.simulator.pauli_circuit import (
-    PauliCircuit, cvt_quantestpy_circuit_to_pauli_circuit)
+    PauliCircuit, _map_in_process_pool, _split_into_shards,
+    cvt_quantestpy_circuit_to_pauli_circuit)
 
 
 def _is_a_in_b(a: list, b: list) -> bool:
@@ -21,22 +22,41 @@ def _is_a_in_b(a: list, b: list) -> bool:
     return False
 
 
+def _create_circuit_replacing_gates_in_reg_with_x_gates(
+        pauli_circuit_org: PauliCircuit,
+        reg: list) -> PauliCircuit:
+    """Returns a circuit where the gates acting on reg are x-gates.
+    Gates of the original circuit are left untouched.
+    """
+    pc = pauli_circuit_org._create_execution_context()
+    pc._gates = []
+    for gate in pauli_circuit_org.gates:
+        tgt_qubit_idx = gate["target_qubit"]
+        if _is_a_in_b(a=tgt_qubit_idx, b=reg):
+            gate = dict(gate, name="x")
+        pc._gates.append(gate)
+    pc._program = None
+    return pc
+
+
 def _assert_equal_qubit_state_replacing_gates_in_sys_reg_with_x_gates(
         pauli_circuit_org: PauliCircuit,
         index_reg: list,
         system_reg: list,
         in_bitstring: str,
-        out_bitstring: str) -> Union[str, None]:
-    # define the circuit object
-    pc = copy.deepcopy(pauli_circuit_org)
+        out_bitstring: str,
+        context: Union[PauliCircuit, None] = None) -> Union[str, None]:
+    # define the circuit object, where the gates in system register are
+    # replaced with x-gates. Passing a context made by
+    # _create_circuit_replacing_gates_in_reg_with_x_gates avoids building
+    # it for every input.
+    if context is None:
+        context = _create_circuit_replacing_gates_in_reg_with_x_gates(
+            pauli_circuit_org, system_reg)
+    pc = context
+    pauli_circuit_org._reset_execution_context(pc)
     pc.set_qubit_value(index_reg, [int(i) for i in in_bitstring])
 
-    # replace gates in system register to x-gates
-    for gate_id, gate in enumerate(pc.gates):
-        tgt_qubit_idx = gate["target_qubit"]
-        if _is_a_in_b(a=tgt_qubit_idx, b=system_reg):
-            pc.gates[gate_id]["name"] = "x"
-
     # execute all gates
     pc._execute_all_gates()
 
@@ -54,9 +74,14 @@ def _assert_equal_qubit_state_replacing_gates_in_sys_reg_with_x_gates(
 def _assert_ancilla_reset(pauli_circuit_org: PauliCircuit,
                           index_reg: list,
                           ancilla_reg: list,
-                          in_bitstring: str) -> Union[list, None]:
+                          in_bitstring: str,
+                          context: Union[PauliCircuit, None] = None
+                          ) -> Union[list, None]:
     # define the circuit object
-    pc = copy.deepcopy(pauli_circuit_org)
+    if context is None:
+        context = pauli_circuit_org._create_execution_context()
+    pc = context
+    pauli_circuit_org._reset_execution_context(pc)
     pc.set_qubit_value(index_reg, [int(i) for i in in_bitstring])
 
     # execute all gates
@@ -71,6 +96,88 @@ def _assert_ancilla_reset(pauli_circuit_org: PauliCircuit,
         return None
 
 
+def _iterate_results(pauli_circuit_org: PauliCircuit,
+                     index_reg: list,
+                     system_reg: list,
+                     ancilla_reg: list,
+                     cases: list):
+    """Yields the results of _assert_equal_qubit_state_replacing_gates_
+    in_sys_reg_with_x_gates and _assert_ancilla_reset (None if ancilla_reg
+    is empty) for each (in_bitstring, out_bitstring) in cases, reusing
+    the execution contexts for all of them.
+    """
+    context_sys = _create_circuit_replacing_gates_in_reg_with_x_gates(
+        pauli_circuit_org, system_reg)
+    context_org = pauli_circuit_org._create_execution_context()
+
+    for in_bitstring, out_bitstring in cases:
+        return_from_assert_equal = \
+            _assert_equal_qubit_state_replacing_gates_in_sys_reg_with_x_gates(
+                pauli_circuit_org,
+                index_reg,
+                system_reg,
+                in_bitstring,
+                out_bitstring,
+                context_sys
+            )
+
+        return_from_assert_ancilla_reset = None
+        if len(ancilla_reg) > 0:
+            return_from_assert_ancilla_reset = _assert_ancilla_reset(
+                pauli_circuit_org,
+                index_reg,
+                ancilla_reg,
+                in_bitstring,
+                context_org
+            )
+
+        yield return_from_assert_equal, return_from_assert_ancilla_reset
+
+
+def _get_results(pauli_circuit_org: PauliCircuit,
+                 index_reg: list,
+                 system_reg: list,
+                 ancilla_reg: list,
+                 cases: list) -> list:
+    """Same as list(_iterate_results(...)) but executes the circuits for
+    all the cases at once.
+    """
+    in_bitstrings = [in_bitstring for in_bitstring, _ in cases]
+
+    pc = _create_circuit_replacing_gates_in_reg_with_x_gates(
+        pauli_circuit_org, system_reg)
+    qubit_value, qubit_phase = pc._get_qubit_value_and_phase_in_batch(
+        index_reg, in_bitstrings)
+    pc._execute_all_gates_in_batch(qubit_value, qubit_phase)
+    out_bitstrings_actual = [
+        "".join([str(i) for i in qubit_val])
+        for qubit_val in qubit_value[:, system_reg].tolist()]
+
+    if len(ancilla_reg) > 0:
+        qubit_value, qubit_phase = \
+            pauli_circuit_org._get_qubit_value_and_phase_in_batch(
+                index_reg, in_bitstrings)
+        pauli_circuit_org._execute_all_gates_in_batch(
+            qubit_value, qubit_phase)
+        is_ancilla_err = qubit_value[:, ancilla_reg] != 0
+
+    results = []
+    for i, (_, out_bitstring) in enumerate(cases):
+        return_from_assert_equal = None
+        if out_bitstrings_actual[i] != out_bitstring:
+            return_from_assert_equal = out_bitstrings_actual[i]
+
+        return_from_assert_ancilla_reset = None
+        if len(ancilla_reg) > 0 and np.any(is_ancilla_err[i]):
+            return_from_assert_ancilla_reset = \
+                np.array(ancilla_reg)[is_ancilla_err[i]].tolist()
+
+        results.append(
+            (return_from_assert_equal, return_from_assert_ancilla_reset))
+
+    return results
+
+
 def _draw_circuit(pauli_circuit_org: PauliCircuit,
                   index_reg: list,
                   output_reg: list,
@@ -80,15 +187,13 @@ def _draw_circuit(pauli_circuit_org: PauliCircuit,
                   val_err_reg: list,
                   replace_gate: bool = True) -> None:
     # define the circuit
-    pc = copy.deepcopy(pauli_circuit_org)
-    pc.set_qubit_value(index_reg, [int(i) for i in in_bitstring])
-
-    # replace gates in system register to x-gates
     if replace_gate:
-        for gate_id, gate in enumerate(pc.gates):
-            tgt_qubit_idx = gate["target_qubit"]
-            if _is_a_in_b(a=tgt_qubit_idx, b=output_reg):
-                pc.gates[gate_id]["name"] = "x"
+        # replace gates in system register to x-gates
+        pc = _create_circuit_replacing_gates_in_reg_with_x_gates(
+            pauli_circuit_org, output_reg)
+    else:
+        pc = pauli_circuit_org._create_execution_context()
+    pc.set_qubit_value(index_reg, [int(i) for i in in_bitstring])
 
     # create an instance of PauliCircuitDrawerColorErrorQubit
     gc = PauliCircuitDrawerColorErrorQubit(
@@ -121,7 +226,9 @@ def assert_unary_iteration(
         system_reg: list,
         input_to_output: dict,
         ancilla_reg: list = [],
-        draw_circuit: bool = False):
+        draw_circuit: bool = False,
+        n_jobs: int = 1,
+        collect_failures: bool = False):
     """
     e.g.
     input_to_output = {
@@ -140,6 +247,10 @@ def assert_unary_iteration(
         raise QuantestPyError("input_to_output must be a dict.")
     if not isinstance(draw_circuit, bool):
         raise QuantestPyError("draw_circuit must be bool type.")
+    if not isinstance(n_jobs, int) or n_jobs < 1:
+        raise QuantestPyError("n_jobs must be a positive integer.")
+    if not isinstance(collect_failures, bool):
+        raise QuantestPyError("collect_failures must be bool type.")
 
     len_index_reg = len(index_reg)
     len_system_reg = len(system_reg)
@@ -156,15 +267,28 @@ def assert_unary_iteration(
         if len(out_bitstring) != len_system_reg:
             raise QuantestPyError("Output bitstring has an invalid length.")
 
-        # check actual == expect
-        return_from_assert_equal = \
-            _assert_equal_qubit_state_replacing_gates_in_sys_reg_with_x_gates(
-                pc_org,
-                index_reg,
-                system_reg,
-                in_bitstring,
-                out_bitstring
-            )
+    # run the inputs one by one, stopping at the first failure, or all of
+    # them at once, or a shard of them in each process
+    cases = list(input_to_output.items())
+    if n_jobs == 1 and not collect_failures:
+        results = _iterate_results(
+            pc_org, index_reg, system_reg, ancilla_reg, cases)
+    elif n_jobs == 1:
+        results = _get_results(
+            pc_org, index_reg, system_reg, ancilla_reg, cases)
+    else:
+        results = itertools.chain.from_iterable(_map_in_process_pool(
+            pc_org,
+            _get_results,
+            [(index_reg, system_reg, ancilla_reg, shard)
+             for shard in _split_into_shards(cases, n_jobs)],
+            n_jobs))
+
+    err_msgs, failures = [], []
+    for (in_bitstring, out_bitstring), (return_from_assert_equal,
+                                        return_from_assert_ancilla_reset) \
+            in zip(cases, results):
+        case_err_msgs, val_err_reg, ancilla_err_reg = [], [], []
 
         # actual != expect
         if return_from_assert_equal is not None:
@@ -173,13 +297,12 @@ def assert_unary_iteration(
                 + f"Out bitstring expect: {out_bitstring}\n" \
                 + f"Out bitstring actual: {out_bitstring_actual}"
 
-            if draw_circuit:
-                val_err_reg = []
-                for i, (j, k) in enumerate(
-                        zip(out_bitstring, out_bitstring_actual)):
-                    if j != k:
-                        val_err_reg.append(system_reg[i])
+            for i, (j, k) in enumerate(
+                    zip(out_bitstring, out_bitstring_actual)):
+                if j != k:
+                    val_err_reg.append(system_reg[i])
 
+            if draw_circuit:
                 _draw_circuit(pauli_circuit_org=pc_org,
                               index_reg=index_reg,
                               output_reg=system_reg,
@@ -188,33 +311,42 @@ def assert_unary_iteration(
                               err_msg=err_msg,
                               val_err_reg=val_err_reg,
                               replace_gate=True)
+            elif collect_failures:
+                case_err_msgs.append(err_msg)
             else:
                 raise QuantestPyAssertionError(err_msg)
 
-        # check ancilla == 0
-        if len(ancilla_reg) > 0:
-            return_from_assert_ancilla_reset = _assert_ancilla_reset(
-                pc_org,
-                index_reg,
-                ancilla_reg,
-                in_bitstring
-            )
+        # ancilla != 0
+        if return_from_assert_ancilla_reset is not None:
+            ancilla_err_reg = return_from_assert_ancilla_reset
+            err_msg = f"In bitstring: {in_bitstring}\n" \
+                + f"Qubits {ancilla_err_reg} in ancilla reg are not" \
+                + " back to 0 by uncomputation."
+
+            if draw_circuit:
+                _draw_circuit(pauli_circuit_org=pc_org,
+                              index_reg=index_reg,
+                              output_reg=ancilla_reg,
+                              output_reg_name="ancilla",
+                              in_bitstring=in_bitstring,
+                              err_msg=err_msg,
+                              val_err_reg=ancilla_err_reg,
+                              replace_gate=False)
+            elif collect_failures:
+                case_err_msgs.append(err_msg)
+            else:
+                raise QuantestPyAssertionError(err_msg)
+
+        if len(case_err_msgs) > 0:
+            err_msgs += case_err_msgs
+            failures.append({
+                "in_bitstring": in_bitstring,
+                "out_bitstring_expect": out_bitstring,
+                "out_bitstring_actual": return_from_assert_equal
+                if return_from_assert_equal is not None else out_bitstring,
+                "ancilla_error_qubits": ancilla_err_reg,
+                "error_qubits": sorted(val_err_reg + ancilla_err_reg)
+            })
 
-            # ancilla != 0
-            if return_from_assert_ancilla_reset is not None:
-                ancilla_err_reg = return_from_assert_ancilla_reset
-                err_msg = f"In bitstring: {in_bitstring}\n" \
-                    + f"Qubits {ancilla_err_reg} in ancilla reg are not" \
-                    + " back to 0 by uncomputation."
-
-                if draw_circuit:
-                    _draw_circuit(pauli_circuit_org=pc_org,
-                                  index_reg=index_reg,
-                                  output_reg=ancilla_reg,
-                                  output_reg_name="ancilla",
-                                  in_bitstring=in_bitstring,
-                                  err_msg=err_msg,
-                                  val_err_reg=ancilla_err_reg,
-                                  replace_gate=False)
-                else:
-                    raise QuantestPyAssertionError(err_msg)
+    if len(failures) > 0:
+        raise _create_error_with_failures(err_msgs, failures, len(cases))
@@ -1,4 +1,5 @@
 import unittest
+from typing import Union
 
 import numpy as np
 
@@ -6,7 +7,7 @@ from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
 from quantestpy.simulator.pauli_circuit import (
-    PauliCircuit, cvt_quantestpy_circuit_to_pauli_circuit)
+    PauliCircuit, _PauliTracer, cvt_quantestpy_circuit_to_pauli_circuit)
 
 ut_test_case = unittest.TestCase()
 
@@ -15,26 +16,32 @@ def _get_qubit_idx_to_qubit_val_for_given_val_in_ctrl_reg(
         val_in_ctrl_reg: str,
         pc: PauliCircuit,
         ctrl_reg: list,
-        ancilla_reg: list) -> dict:
+        ancilla_reg: list,
+        tracer: Union[_PauliTracer, None] = None) -> dict:
+    # passing a tracer made by pc._create_tracer lets consecutive values
+    # in ctrl reg reuse the prefix of the circuit they share.
+    if tracer is None:
+        tracer = pc._create_tracer()
 
     # init ancilla reg to 0
     pc.set_qubit_value(ancilla_reg, [0] * len(ancilla_reg))
     # init ctrl reg to val_in_ctrl_reg
     pc.set_qubit_value(ctrl_reg, [int(i) for i in val_in_ctrl_reg])
 
+    # execute all gates
+    tracer.run(pc._qubit_value, pc._qubit_phase)
+
     # get ctrl vals for all ops on syst reg
     qubit_idx_to_qubit_val = {idx: [] for idx in ctrl_reg + ancilla_reg}
     for i, gate in enumerate(pc._gates):
 
         qubit_idx = gate["control_qubit"]
-        qubit_val = pc._qubit_value[qubit_idx]
+        qubit_val = tracer.get_control_values(i)
 
         for j, idx in enumerate(qubit_idx):
             if idx in qubit_idx_to_qubit_val.keys():
                 qubit_idx_to_qubit_val[idx].append(qubit_val[j])
 
-        pc._execute_i_th_gate(i)
-
     return qubit_idx_to_qubit_val
 
 
@@ -59,6 +66,7 @@ def assert_get_ctrl_val(
     len_ctrl_reg = len(ctrl_reg)
     idx_to_val_in_ctrl_reg_to_val = \
         {idx: dict() for idx in ctrl_reg + ancilla_reg}
+    tracer = pc._create_tracer()
 
     for dec_val_in_ctrl_reg in range(2**len_ctrl_reg):
 
@@ -70,7 +78,8 @@ def assert_get_ctrl_val(
                 bin_val_in_ctrl_reg,
                 pc,
                 ctrl_reg,
-                ancilla_reg
+                ancilla_reg,
+                tracer
             )
 
         if check_ancilla_is_uncomputed:
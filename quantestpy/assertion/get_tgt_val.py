@@ -1,10 +1,11 @@
-import copy
 import unittest
+from typing import Union
 
 import numpy as np
 
 from quantestpy import PauliCircuit
 from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.pauli_circuit import _PauliTracer
 
 ut_test_case = unittest.TestCase()
 
@@ -14,7 +15,12 @@ def _get_tgt_qubit_idx_to_qubit_val_for_given_val_in_ctrl_reg(
         pc: PauliCircuit,
         tgt_reg: list,
         ctrl_reg: list,
-        ancilla_reg: list) -> dict:
+        ancilla_reg: list,
+        tracer: Union[_PauliTracer, None] = None) -> dict:
+    # passing a tracer made by pc._create_tracer lets consecutive values
+    # in ctrl reg reuse the prefix of the circuit they share.
+    if tracer is None:
+        tracer = pc._create_tracer()
 
     # init ancilla reg to 0
     pc.set_qubit_value(ancilla_reg, [0] * len(ancilla_reg))
@@ -23,14 +29,16 @@ def _get_tgt_qubit_idx_to_qubit_val_for_given_val_in_ctrl_reg(
     # init tgt reg to 0
     pc.set_qubit_value(tgt_reg, [0] * len(tgt_reg))
 
+    # execute all gates
+    tracer.run(pc._qubit_value, pc._qubit_phase)
+
     # get tgt vals for all ops on tgt reg
     qubit_idx_to_qubit_val = {idx: [0] for idx in tgt_reg}
 
     for i, gate in enumerate(pc._gates):
-        pc._execute_i_th_gate(i)
 
         qubit_idx = gate["target_qubit"]
-        qubit_val = pc._qubit_value[qubit_idx]
+        qubit_val = tracer.get_target_values(i)
 
         for j, idx in enumerate(qubit_idx):
             if idx in tgt_reg:
@@ -50,7 +58,7 @@ def assert_get_tgt_val(
 
     # check inputs
     PauliCircuit._assert_is_pauli_circuit(circuit)
-    pc = copy.deepcopy(circuit)
+    pc = circuit._create_execution_context()
     pc._assert_is_correct_reg(ctrl_reg)
     pc._assert_is_correct_reg(ancilla_reg)
     pc._assert_is_correct_reg(tgt_reg)
@@ -61,6 +69,7 @@ def assert_get_tgt_val(
 
     len_ctrl_reg = len(ctrl_reg)
     idx_to_val_in_tgt_reg_to_val = {idx: dict() for idx in tgt_reg}
+    tracer = pc._create_tracer()
 
     for dec_val_in_ctrl_reg in range(2**len_ctrl_reg):
 
@@ -73,7 +82,8 @@ def assert_get_tgt_val(
                 pc,
                 tgt_reg,
                 ctrl_reg,
-                ancilla_reg
+                ancilla_reg,
+                tracer
             )
 
         if check_ancilla_is_uncomputed:
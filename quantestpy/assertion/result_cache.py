@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Union
+
+import numpy as np
+
+from quantestpy._version import __version__
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.state_vector_circuit import StateVectorCircuit
+
+# The results of the assertions are cached on disk only if the directory is
+# given by the environment variable.
+_CACHE_DIR_ENV = "QUANTESTPY_CACHE_DIR"
+# maximum total bytes of the cached files, beyond which the least recently
+# used files are removed
+_CACHE_SIZE_ENV = "QUANTESTPY_CACHE_SIZE"
+_DEFAULT_CACHE_SIZE = 2**30
+# If "1", the operators of the circuits are also cached as .npy files.
+_CACHE_OPERATORS_ENV = "QUANTESTPY_CACHE_OPERATORS"
+
+
+def _get_cache_dir() -> Union[str, None]:
+    """Returns the directory given by QUANTESTPY_CACHE_DIR, or None if the
+    cache is disabled.
+    """
+    cache_dir = os.environ.get(_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return cache_dir
+
+
+def _get_max_cache_size() -> int:
+    """Returns the number of bytes given by QUANTESTPY_CACHE_SIZE, or 1 GiB
+    if it is not set.
+    """
+    cache_size = os.environ.get(_CACHE_SIZE_ENV)
+    if cache_size is None:
+        return _DEFAULT_CACHE_SIZE
+
+    if not cache_size.strip().isdigit():
+        raise QuantestPyError(
+            f"{_CACHE_SIZE_ENV} must be a non-negative integer."
+        )
+
+    return int(cache_size)
+
+
+def _get_key(*items) -> str:
+    """Returns the file name of the result for the items, which are the
+    name of the assertion and everything its result depends on. The
+    circuits are given by their structural hashes, which are computed from
+    their current gates on every call, so that a gate modified in place
+    gives another key. The version of quantestpy is added so that a new
+    version never uses the results of the old one.
+    """
+    return hashlib.blake2b(repr((__version__,) + items).encode(),
+                           digest_size=16).hexdigest()
+
+
+def _get_array_digest(array) -> str:
+    array = np.ascontiguousarray(array)
+    return hashlib.blake2b(
+        repr((array.shape, array.dtype.str)).encode() + array.tobytes(),
+        digest_size=16).hexdigest()
+
+
+def _touch(path: str) -> None:
+    """Marks the file as the most recently used one."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _write_atomically(path: str, write: Callable,
+                      max_cache_size: int) -> None:
+    """Writes the file through a temporary file so that concurrent
+    processes never read a partially written file. Failing to write only
+    leaves the result uncached.
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        return
+    _evict(cache_dir, max_cache_size)
+
+
+def _evict(cache_dir: str, max_cache_size: int) -> None:
+    """Removes the least recently used files until the total size of the
+    cached files is at most max_cache_size.
+    """
+    files = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith((".json", ".npy")):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    cache_size = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if cache_size <= max_cache_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        cache_size -= size
+
+
+def _run_with_result_cache(key_items: tuple,
+                           assertion: Callable[[], None]) -> None:
+    """Runs the assertion unless its result for key_items is cached, in
+    which case it passes or raises the cached QuantestPyAssertionError
+    without running. Errors other than QuantestPyAssertionError are not
+    cached.
+    """
+    cache_dir = _get_cache_dir()
+    if cache_dir is None:
+        assertion()
+        return
+
+    max_cache_size = _get_max_cache_size()
+    path = os.path.join(cache_dir, _get_key(*key_items) + ".json")
+    try:
+        with open(path, "r") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = None
+
+    if result is not None:
+        _touch(path)
+        if result["passed"]:
+            return
+        raise QuantestPyAssertionError(result["message"])
+
+    try:
+        assertion()
+    except QuantestPyAssertionError as e:
+        result = {"passed": False, "message": e.args[0]}
+        raise
+    else:
+        result = {"passed": True}
+    finally:
+        if result is not None:
+            _write_atomically(
+                path, lambda f: f.write(json.dumps(result).encode()),
+                max_cache_size)
+
+
+def _get_whole_gates_with_cache(
+        state_vector_circuit: StateVectorCircuit,
+        structural_hash: Union[str, None] = None) -> np.ndarray:
+    """Returns the operator of the circuit, which is loaded from and saved
+    to the cache if QUANTESTPY_CACHE_OPERATORS is "1". The cached operator
+    is memory-mapped if the circuit backs its operator by numpy.memmap.
+    structural_hash is that of the circuit if already computed by the
+    caller.
+    """
+    cache_dir = _get_cache_dir()
+    if cache_dir is None or os.environ.get(_CACHE_OPERATORS_ENV) != "1":
+        return state_vector_circuit._get_whole_gates()
+
+    if structural_hash is None:
+        structural_hash = state_vector_circuit._get_structural_hash()
+    max_cache_size = _get_max_cache_size()
+    key = _get_key("operator",
+                   structural_hash,
+                   state_vector_circuit._from_right_to_left_for_qubit_ids,
+                   state_vector_circuit._dtype.str)
+    path = os.path.join(cache_dir, key + ".npy")
+    try:
+        operator_ = np.load(
+            path,
+            mmap_mode=None if state_vector_circuit._operator_memmap_dir
+            is None else "r")
+    except (OSError, ValueError):
+        operator_ = None
+
+    if operator_ is not None:
+        _touch(path)
+        return operator_
+
+    operator_ = state_vector_circuit._get_whole_gates()
+    _write_atomically(path, lambda f: np.save(f, operator_), max_cache_size)
+    return operator_
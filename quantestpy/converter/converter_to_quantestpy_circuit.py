@@ -1,30 +1,58 @@
 from quantestpy import QuantestPyCircuit
 from quantestpy.converter.sdk.qasm import _cvt_openqasm_to_quantestpy_circuit
 from quantestpy.converter.sdk.qiskit import (
-    _cvt_qiskit_to_quantestpy_circuit, _is_instance_of_qiskit_quantumcircuit)
+    _cvt_qiskit_to_quantestpy_circuit, _get_qiskit_circuit_fingerprint,
+    _is_instance_of_qiskit_quantumcircuit)
 from quantestpy.converter.sdk.quri_parts import (
     _cvt_quri_parts_circuit_to_quantestpy_circuit,
+    _get_quri_parts_circuit_fingerprint,
     _is_instance_of_quri_parts_quantumcircuit)
 from quantestpy.exceptions import QuantestPyError
+from quantestpy.simulator.quantestpy_circuit import _ConversionCache
+
+# QuantestPyCircuits converted from qasm strings, keyed on the strings, and
+# from circuits of the SDKs, keyed on their identities and fingerprints
+_QUANTESTPY_CIRCUIT_CACHE = _ConversionCache()
+
+
+def _get_cache_key(circuit):
+    """Returns the key of the conversion of the input circuit in
+    _QUANTESTPY_CIRCUIT_CACHE, or None if it is not cacheable.
+    The fingerprint guards against a circuit modified in place or another
+    circuit taking over the identity of a garbage-collected one.
+    """
+    if isinstance(circuit, str):
+        return ("qasm", circuit)
+
+    if _is_instance_of_qiskit_quantumcircuit(circuit):
+        fingerprint = _get_qiskit_circuit_fingerprint(circuit)
+    else:
+        fingerprint = _get_quri_parts_circuit_fingerprint(circuit)
+
+    if fingerprint is None:
+        return None
+    return (type(circuit).__name__, id(circuit), fingerprint)
 
 
 def cvt_input_circuit_to_quantestpy_circuit(circuit) -> QuantestPyCircuit:
 
     # QuantestPyCircuit
     if isinstance(circuit, QuantestPyCircuit):
-        quantestpy_circuit = circuit
+        return circuit
 
     # qasm
     elif isinstance(circuit, str):
-        quantestpy_circuit = _cvt_openqasm_to_quantestpy_circuit(circuit)
+        def convert() -> QuantestPyCircuit:
+            return _cvt_openqasm_to_quantestpy_circuit(circuit)
 
     # qiskit.QuantumCircuit()
     elif _is_instance_of_qiskit_quantumcircuit(circuit):
-        quantestpy_circuit = _cvt_qiskit_to_quantestpy_circuit(circuit)
+        def convert() -> QuantestPyCircuit:
+            return _cvt_qiskit_to_quantestpy_circuit(circuit)
 
     elif _is_instance_of_quri_parts_quantumcircuit(circuit):
-        quantestpy_circuit = _cvt_quri_parts_circuit_to_quantestpy_circuit(
-            circuit)
+        def convert() -> QuantestPyCircuit:
+            return _cvt_quri_parts_circuit_to_quantestpy_circuit(circuit)
 
     else:
         raise QuantestPyError(
@@ -35,4 +63,4 @@ def cvt_input_circuit_to_quantestpy_circuit(circuit) -> QuantestPyCircuit:
             "and QuantestPyCircuit."
         )
 
-    return quantestpy_circuit
+    return _QUANTESTPY_CIRCUIT_CACHE.get(_get_cache_key(circuit), convert)
@@ -1,3 +1,5 @@
+import gc
+
 from quantestpy import QuantestPyCircuit
 from quantestpy.exceptions import QuantestPyError
 
@@ -8,8 +10,109 @@ _IMPLEMENTED_QISKIT_GATES = [
     "t", "tdg", "u", "x", "y", "z"
     ]
 
+# qiskit gate name -> (quantestpy gate name, number of target qubits)
+# The target qubits are the last qubits of a qiskit instruction and the
+# control qubits are the rest. The parameters are passed as they are.
+_QISKIT_GATE_TO_QUANTESTPY_GATE = {
+    # controlled gates
+    "ccx": ("x", 1),
+    "ccz": ("z", 1),
+    "ch": ("h", 1),
+    "cp": ("p", 1),
+    "crx": ("rx", 1),
+    "cry": ("ry", 1),
+    "crz": ("rz", 1),
+    "cs": ("s", 1),
+    "csdg": ("sdg", 1),
+    "cswap": ("swap", 2),
+    "csx": ("sx", 1),
+    "cu": ("u", 1),
+    "cx": ("x", 1),
+    "cy": ("y", 1),
+    "cz": ("z", 1),
+    "mcphase": ("p", 1),
+    "mcx": ("x", 1),
+    # gates without control
+    "h": ("h", 1),
+    "id": ("id", 1),
+    "iswap": ("iswap", 2),
+    "p": ("p", 1),
+    "r": ("r", 1),
+    "rx": ("rx", 1),
+    "ry": ("ry", 1),
+    "rz": ("rz", 1),
+    "s": ("s", 1),
+    "sdg": ("sdg", 1),
+    "swap": ("swap", 2),
+    "sx": ("sx", 1),
+    "sxdg": ("sxdg", 1),
+    "t": ("t", 1),
+    "tdg": ("tdg", 1),
+    "u": ("u", 1),
+    "x": ("x", 1),
+    "y": ("y", 1),
+    "z": ("z", 1)
+}
+
+
+def _get_qubit_to_index(qiskit_circuit) -> dict:
+    """Returns the dict from the qubits of a qiskit circuit to their
+    indices in the circuit, i.e. find_bit(qubit).index.
+    """
+    return {qubit: index for index, qubit in enumerate(qiskit_circuit.qubits)}
+
+
+def _parse_qiskit_gate_name(name: str) -> tuple:
+    """Splits the name of a qiskit gate into the base name and the control
+    state, e.g. "ccx_o1" into ("ccx", 1). The control state is None if the
+    name has no suffix, i.e. all the control values are 1.
+    """
+    base_name, separator, ctrl_state = name.rpartition("_o")
+    if separator and ctrl_state.isdigit():
+        return base_name, int(ctrl_state)
+    return name, None
+
+
+def _get_control_value(ctrl_state, num_control: int) -> list:
+    """Returns the control values given by ctrl_state, whose k-th bit is
+    the control value of the k-th control qubit.
+    """
+    if ctrl_state is None:
+        return [1] * num_control
+    return [(ctrl_state >> k) & 1 for k in range(num_control)]
+
+
+def _cvt_qiskit_instruction_to_gate(instruction,
+                                    qubit_to_index: dict) -> dict:
+    """Returns the gate of QuantestPyCircuit translated from an element of
+    QuantumCircuit.data.
+    """
+    operation = instruction.operation
+    base_name, ctrl_state = _parse_qiskit_gate_name(operation.name)
+    try:
+        name, num_target = _QISKIT_GATE_TO_QUANTESTPY_GATE[base_name]
+
+    # Other gates are not supported in QuantestPy
+    except KeyError:
+        raise QuantestPyError(
+            f"Qiskit gate [{operation.name}] "
+            "is not supported in QuantestPy.\n"
+            f'Implemented qiskit gates: {_IMPLEMENTED_QISKIT_GATES}'
+        ) from None
+
+    qubits = [qubit_to_index[qubit] for qubit in instruction.qubits]
+    control_qubit = qubits[:-num_target]
+
+    return dict(name=name,
+                target_qubit=qubits[-num_target:],
+                control_qubit=control_qubit,
+                control_value=_get_control_value(ctrl_state,
+                                                 len(control_qubit)),
+                parameter=[float(param) for param in operation.params])
+
+
 try:
-    from qiskit import QuantumCircuit, assemble
+    from qiskit import QuantumCircuit
 
 except ModuleNotFoundError:
     def _is_instance_of_qiskit_quantumcircuit(circuit) -> bool:
@@ -29,359 +132,52 @@ else:
 
     def _cvt_qiskit_to_quantestpy_circuit(qiskit_circuit) -> QuantestPyCircuit:
 
-        qobj = assemble(qiskit_circuit)
-        qobj_dict = qobj.to_dict()
-        experiments = qobj_dict["experiments"][0]  # [0] changes list into dict
-        gates = experiments["instructions"]
-        num_qubits = experiments["config"]["n_qubits"]
-        global_phase = experiments["header"]["global_phase"]
-        circuit = QuantestPyCircuit(num_qubits)
-
-        for gate in gates:
-            # "ccx gate"
-            if gate["name"] == "ccx":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1, 1]
-                parameter = []
-            elif gate["name"] == "ccx_o0":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0, 0]
-                parameter = []
-            elif gate["name"] == "ccx_o1":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1, 0]  # reverse order along with qubit order
-                parameter = []
-            elif gate["name"] == "ccx_o2":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0, 1]  # reverse order along with qubit order
-                parameter = []
-
-            # ccz gate
-            elif gate["name"] == "ccz":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1, 1]
-                parameter = []
-            elif gate["name"] == "ccz_o0":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0, 0]
-                parameter = []
-            elif gate["name"] == "ccz_o1":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1, 0]  # reverse order along with qubit order
-                parameter = []
-            elif gate["name"] == "ccz_o2":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0, 1]  # reverse order along with qubit order
-                parameter = []
-
-            # ch gate
-            elif gate["name"] == "ch":
-                name = "h"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "ch_o0":
-                name = "h"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # cp gate
-            elif gate["name"] == "cp":
-                name = "p"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = gate["params"]
-            elif gate["name"] == "cp_o0":
-                name = "p"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = gate["params"]
-
-            # crx gate
-            elif gate["name"] == "crx":
-                name = "rx"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = gate["params"]
-            elif gate["name"] == "crx_o0":
-                name = "rx"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = gate["params"]
-
-            # cry gate
-            elif gate["name"] == "cry":
-                name = "ry"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = gate["params"]
-            elif gate["name"] == "cry_o0":
-                name = "ry"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = gate["params"]
-
-            # crz gate
-            elif gate["name"] == "crz":
-                name = "rz"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = gate["params"]
-            elif gate["name"] == "crz_o0":
-                name = "rz"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = gate["params"]
-
-            # cs gate
-            elif gate["name"] == "cs":
-                name = "s"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "cs_o0":
-                name = "s"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # csdg gate
-            elif gate["name"] == "csdg":
-                name = "sdg"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "csdg_o0":
-                name = "sdg"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # cswap gate
-            elif gate["name"] == "cswap":
-                name = "swap"
-                target_qubit = gate["qubits"][-2:]
-                control_qubit = gate["qubits"][:-2]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "cswap_o0":
-                name = "swap"
-                target_qubit = gate["qubits"][-2:]
-                control_qubit = gate["qubits"][:-2]
-                control_value = [0]
-                parameter = []
-
-            # csx gate
-            elif gate["name"] == "csx":
-                name = "sx"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "csx_o0":
-                name = "sx"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # cu gate
-            elif gate["name"] == "cu":
-                name = "u"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = gate["params"]
-            elif gate["name"] == "cu_o0":
-                name = "u"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = gate["params"]
-
-            # cx gate
-            elif gate["name"] == "cx":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "cx_o0":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # cy gate
-            elif gate["name"] == "cy":
-                name = "y"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "cy_o0":
-                name = "y"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # cz gate
-            elif gate["name"] == "cz":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]
-                parameter = []
-            elif gate["name"] == "cz_o0":
-                name = "z"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [0]
-                parameter = []
-
-            # h gate
-            elif gate["name"] == "h":
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = []
-                control_value = []
-                parameter = []
-
-            # id gate
-            elif gate["name"] == "id":
-                name = "id"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = []
-                control_value = []
-                parameter = []
-
-            # iswap gate
-            elif gate["name"] == "iswap":
-                name = gate["name"]
-                target_qubit = gate["qubits"][-2:]
-                control_qubit = []
-                control_value = []
-                parameter = []
-
-            # mcp gate
-            elif gate["name"] == "mcphase":
-                name = "p"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]*len(control_qubit)
-                parameter = gate["params"]
-
-            # mcx gate
-            elif gate["name"] == "mcx":
-                name = "x"
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = [1]*len(control_qubit)
-                parameter = []
-
-            # p, r, rx, ry, rz gate
-            elif gate["name"] in ["p", "r", "rx", "ry", "rz"]:
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = []
-                control_value = []
-                parameter = gate["params"]
-
-            # s, sdg gate
-            elif gate["name"] in ["s", "sdg"]:
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = []
-                control_value = []
-                parameter = []
-
-            # swap gate
-            elif gate["name"] == "swap":
-                name = gate["name"]
-                target_qubit = gate["qubits"][-2:]
-                control_qubit = []
-                control_value = []
-                parameter = []
-
-            # sx, sxdg, t, tdg gate
-            elif gate["name"] in ["sx", "sxdg", "t", "tdg"]:
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = []
-                parameter = []
-
-            # u gate
-            elif gate["name"] == "u":
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = []
-                control_value = []
-                parameter = gate["params"]
-
-            # x, y, z gate
-            elif gate["name"] in ["x", "y", "z"]:
-                name = gate["name"]
-                target_qubit = gate["qubits"][-1:]
-                control_qubit = gate["qubits"][:-1]
-                control_value = []
-                parameter = []
-
-            # Other gates are not supported in QuantestPy
-            else:
-                raise QuantestPyError(
-                    f'Qiskit gate [{gate["name"]}] '
-                    "is not supported in QuantestPy.\n"
-                    f'Implemented qiskit gates: {_IMPLEMENTED_QISKIT_GATES}'
-                )
-
-            # add gate
-            gate_test = dict(name=name,
-                             target_qubit=target_qubit,
-                             control_qubit=control_qubit,
-                             control_value=control_value,
-                             parameter=parameter)
-            circuit.add_gate(gate_test)
-
+        circuit = QuantestPyCircuit(qiskit_circuit.num_qubits)
+        qubit_to_index = _get_qubit_to_index(qiskit_circuit)
+
+        # The gates hold no reference cycles. Pausing the cyclic garbage
+        # collector saves its repeated traversals of the large qiskit
+        # circuit while they are allocated.
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            gates = [_cvt_qiskit_instruction_to_gate(instruction,
+                                                     qubit_to_index)
+                     for instruction in qiskit_circuit.data]
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+        global_phase = float(qiskit_circuit.global_phase)
         if global_phase != 0.:
             gate_test = dict(name="scalar",
                              target_qubit=[0],
                              control_qubit=[],
                              control_value=[],
                              parameter=[global_phase])
-            circuit.add_gate(gate_test)
+            gates.append(gate_test)
 
+        # The translated gates are valid by construction.
+        circuit.add_gates(gates, validate=False)
         return circuit
+
+
+def _get_qiskit_circuit_fingerprint(qiskit_circuit):
+    """Returns a hashable value which is equal between qiskit circuits
+    converted to the same QuantestPyCircuit, or None if an instruction has
+    an unhashable parameter, e.g. the matrix of a unitary gate.
+    """
+    qubit_to_index = _get_qubit_to_index(qiskit_circuit)
+    fingerprint = (
+        qiskit_circuit.num_qubits,
+        qiskit_circuit.global_phase,
+        tuple((instruction.operation.name,
+               tuple(qubit_to_index[qubit] for qubit in instruction.qubits),
+               tuple(instruction.operation.params),
+               getattr(instruction.operation, "ctrl_state", None))
+              for instruction in qiskit_circuit.data))
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
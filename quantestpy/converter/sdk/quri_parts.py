@@ -96,3 +96,16 @@ else:
     def _is_instance_of_quri_parts_quantumcircuit(circuit) -> bool:
         return (isinstance(circuit, NonParametricQuantumCircuit) or
                 isinstance(circuit, ImmutableBoundParametricQuantumCircuit))
+
+
+def _get_quri_parts_circuit_fingerprint(quri_parts_circuit):
+    """Returns a hashable value which is equal between QURI Parts circuits
+    having the same gates, or None if a gate has an unhashable entry.
+    """
+    fingerprint = (quri_parts_circuit.qubit_count,
+                   tuple(quri_parts_circuit.gates))
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
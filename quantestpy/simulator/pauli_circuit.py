@@ -1,10 +1,369 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 from quantestpy.simulator.exceptions import PauliCircuitError
-from quantestpy.simulator.quantestpy_circuit import QuantestPyCircuit
+from quantestpy.simulator.quantestpy_circuit import (QuantestPyCircuit,
+                                                     _ColumnarGates,
+                                                     _ConversionCache)
 
 _IMPLEMENTED_GATES = ["x", "y", "z", "swap"]
 
+# opcodes of the compiled program
+_OPCODE_X = 0
+_OPCODE_Y = 1
+_OPCODE_Z = 2
+_OPCODE_SWAP = 3
+_GATE_NAME_TO_OPCODE = {"x": _OPCODE_X, "y": _OPCODE_Y, "z": _OPCODE_Z,
+                        "swap": _OPCODE_SWAP}
+
+# the phases of a traced input are checkpointed after every this number of
+# gates
+_DEFAULT_CHECKPOINT_INTERVAL = 64
+
+
+def _pack_qubit_value(qubit_value: np.ndarray) -> int:
+    """Returns the qubit values as one integer whose k-th bit is the value
+    of the k-th qubit.
+    """
+    return int.from_bytes(
+        np.packbits(np.asarray(qubit_value, dtype=np.uint8),
+                    bitorder="little").tobytes(), "little")
+
+
+def _unpack_qubit_value(value: int, num_qubit: int) -> np.ndarray:
+    """Inverse of _pack_qubit_value."""
+    return np.unpackbits(
+        np.frombuffer(value.to_bytes((num_qubit + 7) // 8, "little"),
+                      dtype=np.uint8),
+        count=num_qubit, bitorder="little")
+
+
+def _split_list(values: list, offset: list) -> list:
+    """Returns values[offset[i]:offset[i+1]] for each i."""
+    return [values[begin:end] for begin, end in zip(offset, offset[1:])]
+
+
+def _get_masks(qubit: np.ndarray,
+               weight: np.ndarray,
+               offset: np.ndarray) -> list:
+    """Returns the sum of weight[j] << qubit[j] over the qubits of each
+    gate, e.g. the mask of the target qubits for weight one, as a list of
+    integers. The qubits of a gate are distinct, so the sum is the bitwise
+    or.
+    """
+    num_gate = len(offset) - 1
+    if len(qubit) > 0 and qubit.max() >= 62:
+        # the masks do not fit in int64
+        return [sum(w << q for q, w in zip(qubits, weights))
+                for qubits, weights in zip(
+                    _split_list(qubit.tolist(), offset.tolist()),
+                    _split_list(weight.tolist(), offset.tolist()))]
+
+    if num_gate == 0:
+        return []
+
+    # a trailing zero keeps the offsets of gates without qubits at the end
+    # in range of reduceat
+    bits = np.append(weight.astype(np.int64) << qubit.astype(np.int64), 0)
+    masks = np.add.reduceat(bits, offset[:-1])
+    masks[offset[:-1] == offset[1:]] = 0
+    return masks.tolist()
+
+
+class _PauliProgram:
+    """
+    Gates of a PauliCircuit lowered into flat arrays: an opcode per gate
+    and CSR-style offsets into the target and control qubit arrays.
+    Qubits of gate i are target_qubit[target_offset[i]:target_offset[i+1]]
+    and likewise for the controls.
+
+    Qubit values of a single input are handled as one integer whose k-th
+    bit is the value of the k-th qubit, so that the control condition of
+    gate i is (value & control_mask[i]) == control_value_mask[i].
+    """
+
+    def __init__(self, gates: list):
+        if isinstance(gates, _ColumnarGates):
+            self._lower_columnar_gates(gates)
+        else:
+            self._lower_gates(gates)
+
+        # per-gate lists and masks used by the interpreters
+        self._opcodes = self.opcode.tolist()
+        self._target_lists = _split_list(self.target_qubit.tolist(),
+                                         self.target_offset.tolist())
+        self._control_lists = _split_list(self.control_qubit.tolist(),
+                                          self.control_offset.tolist())
+        self._target_masks = _get_masks(
+            self.target_qubit, np.ones_like(self.target_qubit),
+            self.target_offset)
+        self._control_masks = _get_masks(
+            self.control_qubit, np.ones_like(self.control_qubit),
+            self.control_offset)
+        self._control_value_masks = _get_masks(
+            self.control_qubit, self.control_value, self.control_offset)
+
+        # per-gate arrays used by execute_in_batch, created on first use
+        self._target_qubits = None
+        self._control_qubits = None
+        self._control_values = None
+
+    def _lower_gates(self, gates: list) -> None:
+        num_gate = len(gates)
+        self.opcode = np.empty(num_gate, dtype=np.int8)
+        self.target_offset = np.zeros(num_gate + 1, dtype=np.int64)
+        self.control_offset = np.zeros(num_gate + 1, dtype=np.int64)
+
+        target_qubit, control_qubit, control_value = [], [], []
+        for i, gate in enumerate(gates):
+            if gate["name"] not in _GATE_NAME_TO_OPCODE:
+                raise PauliCircuitError(
+                    "Unexpected error. Please report."
+                )
+            self.opcode[i] = _GATE_NAME_TO_OPCODE[gate["name"]]
+            target_qubit += gate["target_qubit"]
+            control_qubit += gate["control_qubit"]
+            control_value += gate["control_value"]
+            self.target_offset[i+1] = len(target_qubit)
+            self.control_offset[i+1] = len(control_qubit)
+
+        self.target_qubit = np.array(target_qubit, dtype=np.int64)
+        self.control_qubit = np.array(control_qubit, dtype=np.int64)
+        self.control_value = np.array(control_value, dtype=np.int8)
+
+    def _lower_columnar_gates(self, gates: _ColumnarGates) -> None:
+        """Same as _lower_gates but takes the columns as they are."""
+        name_to_opcode = np.array(
+            [_GATE_NAME_TO_OPCODE.get(name, -1) for name in gates.names],
+            dtype=np.int8)
+        self.opcode = name_to_opcode[gates.name_code]
+        if np.any(self.opcode < 0):
+            raise PauliCircuitError(
+                "Unexpected error. Please report."
+            )
+        self.target_offset = gates.target_offset.copy()
+        self.control_offset = gates.control_offset.copy()
+        self.target_qubit = gates.target_qubit.astype(np.int64)
+        self.control_qubit = gates.control_qubit.astype(np.int64)
+        self.control_value = gates.control_value.copy()
+
+    def __len__(self) -> int:
+        return len(self._opcodes)
+
+    def execute(self,
+                qubit_value: np.ndarray,
+                qubit_phase: np.ndarray,
+                start: int = 0,
+                stop: int = None) -> None:
+        """Executes gates start, ..., stop-1 on a single input in place."""
+        phase = qubit_phase.tolist()
+        value = self.execute_on_int(
+            _pack_qubit_value(qubit_value), phase, start, stop)
+        qubit_value[:] = _unpack_qubit_value(value, len(qubit_value))
+        qubit_phase[:] = phase
+
+    def execute_on_int(self,
+                       value: int,
+                       phase: list,
+                       start: int = 0,
+                       stop: int = None,
+                       trace: list = None) -> int:
+        """Executes gates start, ..., stop-1 on a single input given by
+        value, the qubit values as one integer (see _pack_qubit_value), and
+        phase, the list of the qubit phases updated in place. Returns the
+        new value. If trace is given, the value before each gate is
+        appended to it.
+        """
+        if stop is None:
+            stop = len(self)
+
+        opcodes = self._opcodes
+        target_lists = self._target_lists
+        target_masks = self._target_masks
+        control_masks = self._control_masks
+        control_value_masks = self._control_value_masks
+
+        for i in range(start, stop):
+            if trace is not None:
+                trace.append(value)
+
+            if value & control_masks[i] != control_value_masks[i]:
+                continue
+
+            opcode = opcodes[i]
+            if opcode == _OPCODE_X:
+                value ^= target_masks[i]
+            elif opcode == _OPCODE_Y:
+                for q in target_lists[i]:
+                    phase[q] += np.pi * (0.5 - ((value >> q) & 1))
+                value ^= target_masks[i]
+            elif opcode == _OPCODE_Z:
+                for q in target_lists[i]:
+                    phase[q] += np.pi * ((value >> q) & 1)
+            else:
+                a, b = target_lists[i]
+                if ((value >> a) & 1) != ((value >> b) & 1):
+                    value ^= target_masks[i]
+                phase[a], phase[b] = phase[b], phase[a]
+
+        return value
+
+    def execute_in_batch(self,
+                         qubit_value: np.ndarray,
+                         qubit_phase: np.ndarray,
+                         start: int = 0,
+                         stop: int = None) -> None:
+        """Executes gates start, ..., stop-1 on many inputs in place.
+        qubit_value and qubit_phase have one row per input.
+        """
+        if stop is None:
+            stop = len(self)
+
+        if self._target_qubits is None:
+            self._target_qubits = np.split(self.target_qubit,
+                                           self.target_offset[1:-1])
+            self._control_qubits = np.split(self.control_qubit,
+                                            self.control_offset[1:-1])
+            self._control_values = np.split(self.control_value,
+                                            self.control_offset[1:-1])
+
+        all_rows = np.arange(len(qubit_value))
+        for i in range(start, stop):
+            if self._control_masks[i] == 0:
+                rows = all_rows
+            else:
+                rows = np.nonzero(np.all(
+                    qubit_value[:, self._control_qubits[i]]
+                    == self._control_values[i], axis=1))[0]
+
+            target_qubit = self._target_qubits[i]
+            index = np.ix_(rows, target_qubit)
+            opcode = self._opcodes[i]
+            if opcode == _OPCODE_X:
+                qubit_value[index] ^= 1
+            elif opcode == _OPCODE_Y:
+                qubit_phase[index] += np.pi * (0.5 - qubit_value[index])
+                qubit_value[index] ^= 1
+            elif opcode == _OPCODE_Z:
+                qubit_phase[index] += np.pi * qubit_value[index]
+            else:
+                index_swapped = np.ix_(rows, target_qubit[::-1])
+                qubit_value[index] = qubit_value[index_swapped]
+                qubit_phase[index] = qubit_phase[index_swapped]
+
+    def get_first_gate_of_qubits(self, num_qubit: int) -> np.ndarray:
+        """Returns the index of the first gate acting on each qubit as a
+        target or a control, or len(self) if there is no such gate.
+        """
+        first_gate = np.full(num_qubit, len(self), dtype=np.int64)
+        for qubits, offset in [(self.target_qubit, self.target_offset),
+                               (self.control_qubit, self.control_offset)]:
+            gate_index = np.repeat(np.arange(len(self)), np.diff(offset))
+            np.minimum.at(first_gate, qubits, gate_index)
+        return first_gate
+
+
+class _PauliTracer:
+    """
+    Executes a compiled program on a sequence of single inputs, keeping
+    the qubit values before every gate of the last input.
+
+    The state is checkpointed after every checkpoint_interval gates. Gates
+    before the first gate acting on a qubit where an input differs from the
+    previous input see the same qubits in the same states for both, so the
+    input resumes from the last checkpoint before that gate rather than
+    from scratch, with the qubits not acted on yet set to its own values.
+    Inputs sharing a long prefix of the circuit, e.g. indices of a unary
+    iteration differing only in the qubits read late, then execute only
+    the rest of the circuit.
+
+    The values kept for the reused gates are exact only on the qubits acted
+    on so far, which include those read by get_control_values and
+    get_target_values.
+    """
+
+    def __init__(self,
+                 program: _PauliProgram,
+                 num_qubit: int,
+                 checkpoint_interval: int = _DEFAULT_CHECKPOINT_INTERVAL):
+        self._program = program
+        self._num_qubit = num_qubit
+        self._checkpoint_interval = checkpoint_interval
+        self._first_gate = program.get_first_gate_of_qubits(num_qubit)
+        # initial state of the last input
+        self._value = None
+        self._phase = None
+        # values before every gate and after the last one, and phases
+        # after every checkpoint_interval gates
+        self._trace = []
+        self._checkpoint_phases = []
+        # for profiling
+        self._num_executed_gates = 0
+
+    def run(self, qubit_value: np.ndarray, qubit_phase: np.ndarray) -> None:
+        """Executes all gates on the input given by qubit_value and
+        qubit_phase in place.
+        """
+        num_gate = len(self._program)
+        value = _pack_qubit_value(qubit_value)
+        phase = qubit_phase.tolist()
+
+        # first gate acting on a qubit where the input differs from the
+        # last one
+        first_diff_gate = 0
+        if self._value is not None:
+            is_diff = (_unpack_qubit_value(value ^ self._value,
+                                           self._num_qubit) != 0) \
+                | (qubit_phase != self._phase)
+            first_diff_gate = int(
+                np.min(self._first_gate[is_diff], initial=num_gate))
+        self._value, self._phase = value, np.array(qubit_phase)
+
+        # resume from the last checkpoint before it
+        checkpoint = first_diff_gate // self._checkpoint_interval
+        start = checkpoint * self._checkpoint_interval
+        if start > 0:
+            is_untouched = self._first_gate >= start
+            untouched_mask = _pack_qubit_value(is_untouched)
+            value = (self._trace[start] & ~untouched_mask) \
+                | (value & untouched_mask)
+            phase = np.where(is_untouched, phase,
+                             self._checkpoint_phases[checkpoint]).tolist()
+        del self._trace[start:]
+        del self._checkpoint_phases[checkpoint:]
+        self._checkpoint_phases.append(list(phase))
+
+        for chunk_start in range(start, num_gate, self._checkpoint_interval):
+            chunk_stop = min(chunk_start + self._checkpoint_interval,
+                             num_gate)
+            value = self._program.execute_on_int(
+                value, phase, chunk_start, chunk_stop, self._trace)
+            if chunk_stop % self._checkpoint_interval == 0:
+                self._checkpoint_phases.append(list(phase))
+        self._trace.append(value)
+        self._num_executed_gates += num_gate - start
+
+        qubit_value[:] = _unpack_qubit_value(value, self._num_qubit)
+        qubit_phase[:] = phase
+
+    def get_control_values(self, i: int) -> list:
+        """Returns the values of the control qubits of gate i before the
+        gate for the last input.
+        """
+        value = self._trace[i]
+        return [(value >> qubit) & 1
+                for qubit in self._program._control_lists[i]]
+
+    def get_target_values(self, i: int) -> list:
+        """Returns the values of the target qubits of gate i after the gate
+        for the last input.
+        """
+        value = self._trace[i + 1]
+        return [(value >> qubit) & 1
+                for qubit in self._program._target_lists[i]]
+
 
 class PauliCircuit(QuantestPyCircuit):
 
@@ -12,6 +371,9 @@ class PauliCircuit(QuantestPyCircuit):
         super().__init__(num_qubit=num_qubit)
         self._qubit_value = np.array([0 for _ in range(num_qubit)])
         self._qubit_phase = np.array([0. for _ in range(num_qubit)])
+        self._program = None
+        # an execution context shares its gates with another circuit
+        self._is_execution_context = False
 
     @property
     def qubit_value(self,):
@@ -42,6 +404,94 @@ class PauliCircuit(QuantestPyCircuit):
         if "parameter" not in gate.keys():
             gate["parameter"] = []
 
+    def _get_invalid_gates(self, gates: list) -> np.ndarray:
+        """Override"""
+        is_invalid = super()._get_invalid_gates(gates)
+        for i, gate in enumerate(gates):
+            if not is_invalid[i] and gate["name"] not in _IMPLEMENTED_GATES:
+                is_invalid[i] = True
+        return is_invalid
+
+    def _assert_gates_not_shared(self) -> None:
+        """Raises a PauliCircuitError if this circuit is an execution
+        context, the gates of which are those of the circuit it was created
+        from.
+        """
+        if self._is_execution_context:
+            raise PauliCircuitError(
+                "Gates cannot be added to an execution context."
+            )
+
+    def add_gate(self, gate: dict) -> None:
+        """Override"""
+        self._assert_gates_not_shared()
+        super().add_gate(gate)
+        # the compiled program is outdated
+        self._program = None
+
+    def add_gates(self, gates, validate: bool = True) -> None:
+        """Override"""
+        # arrays of gates and the gates of a columnar storage always come
+        # with the parameters
+        self._assert_gates_not_shared()
+        is_listed = not isinstance(gates, (dict, _ColumnarGates))
+        if is_listed:
+            gates = list(gates)
+        super().add_gates(gates, validate)
+        if validate and is_listed:
+            for gate in gates:
+                if "parameter" not in gate.keys():
+                    gate["parameter"] = []
+        self._program = None
+
+    def _get_program(self) -> _PauliProgram:
+        """Returns the compiled program of the gates, which is cached until
+        the next add_gate.
+        """
+        if self._program is None:
+            self._program = _PauliProgram(self._gates)
+        return self._program
+
+    def _create_execution_context(self) -> "PauliCircuit":
+        """Returns a PauliCircuit which shares the gates and the compiled
+        program with this circuit but has its own qubit values and phases.
+        Running an input on the context then never copies gates.
+        The gates are read-only for the context: add_gate and add_gates
+        raise a PauliCircuitError.
+        """
+        self._get_program()
+        context = copy.copy(self)
+        context._is_execution_context = True
+        context._qubit_value = self._qubit_value.copy()
+        context._qubit_phase = self._qubit_phase.copy()
+        return context
+
+    def _copy(self, copy_gates: bool = False) -> "PauliCircuit":
+        """Override"""
+        circuit = super()._copy(copy_gates)
+        circuit._is_execution_context = False
+        circuit._qubit_value = self._qubit_value.copy()
+        circuit._qubit_phase = self._qubit_phase.copy()
+        return circuit
+
+    def _create_tracer(
+            self,
+            checkpoint_interval: int = _DEFAULT_CHECKPOINT_INTERVAL) \
+            -> _PauliTracer:
+        """Returns a _PauliTracer of the compiled program, which runs
+        inputs one after another reusing the prefix of the circuit they
+        share.
+        """
+        return _PauliTracer(
+            self._get_program(), self._num_qubit, checkpoint_interval)
+
+    def _reset_execution_context(self, context: "PauliCircuit") -> None:
+        """Resets qubit values and phases of the context to those of this
+        circuit.
+        """
+        context._qubit_value[:] = self._qubit_value
+        context._qubit_phase[:] = self._qubit_phase
+
     @staticmethod
     def _assert_is_pauli_circuit(circuit):
         if not isinstance(circuit, PauliCircuit):
@@ -120,27 +570,63 @@ class PauliCircuit(QuantestPyCircuit):
         self._qubit_phase[target_qubit[1]] = a
 
     def _execute_i_th_gate(self, i: int) -> None:
-        gate = self._gates[i]
-        if len(gate["control_qubit"]) == 0 or \
-            np.all(self._qubit_value[gate["control_qubit"]]
-                   == gate["control_value"]):
-
-            if gate["name"] == "x":
-                self._execute_x_gate(gate["target_qubit"])
-            elif gate["name"] == "y":
-                self._execute_y_gate(gate["target_qubit"])
-            elif gate["name"] == "z":
-                self._execute_z_gate(gate["target_qubit"])
-            elif gate["name"] == "swap":
-                self._execute_swap_gate(gate["target_qubit"])
-            else:
-                raise PauliCircuitError(
-                    "Unexpected error. Please report."
-                )
+        self._get_program().execute(
+            self._qubit_value, self._qubit_phase, start=i, stop=i+1)
 
     def _execute_all_gates(self,) -> None:
-        for i in range(len(self._gates)):
-            self._execute_i_th_gate(i)
+        self._get_program().execute(self._qubit_value, self._qubit_phase)
+
+    def _get_qubit_value_and_phase_in_batch(
+            self,
+            register: list,
+            bitstrings: list) -> tuple:
+        """Returns qubit values and phases of shape
+        (len(bitstrings), num_qubit), i.e. one row per input, where the
+        register is set to each bitstring and the other qubits keep the
+        current values of the circuit.
+        """
+        if len(bitstrings) > 0 and len(register) > 0:
+            qubit_vals = np.frombuffer(
+                "".join(bitstrings).encode(), dtype=np.uint8) - ord("0")
+            qubit_vals = qubit_vals.reshape(len(bitstrings), len(register))
+        else:
+            qubit_vals = np.zeros((len(bitstrings), len(register)),
+                                  dtype=np.uint8)
+
+        return self._get_qubit_value_and_phase_for_qubit_vals(
+            register, qubit_vals)
+
+    def _get_qubit_value_and_phase_for_qubit_vals(
+            self,
+            register: list,
+            qubit_vals: np.ndarray) -> tuple:
+        """Same as _get_qubit_value_and_phase_in_batch but the inputs are
+        given by an array of shape (num_input, len(register)) of 0 and 1.
+        """
+        self._assert_is_correct_reg(register)
+
+        if np.any(qubit_vals > 1):
+            raise PauliCircuitError(
+                "Values in qubit_val must be either 0 or 1."
+            )
+
+        num_input = len(qubit_vals)
+        qubit_value = np.tile(self._qubit_value.astype(np.uint8),
+                              (num_input, 1))
+        qubit_phase = np.tile(self._qubit_phase, (num_input, 1))
+        qubit_value[:, register] = qubit_vals
+
+        return qubit_value, qubit_phase
+
+    def _execute_all_gates_in_batch(self,
+                                    qubit_value: np.ndarray,
+                                    qubit_phase: np.ndarray) -> None:
+        """Executes all gates for many inputs at once. qubit_value and
+        qubit_phase have one row per input (see
+        _get_qubit_value_and_phase_in_batch) and are updated in place, so
+        each gate is a vectorized operation over all the inputs.
+        """
+        self._get_program().execute_in_batch(qubit_value, qubit_phase)
 
     def draw(self,):
         from quantestpy.visualization.pauli_circuit_drawer import draw_circuit
@@ -148,6 +634,51 @@ class PauliCircuit(QuantestPyCircuit):
         return draw_circuit(self)
 
 
+# circuit sent to a worker process once by _initialize_worker
+_pauli_circuit_in_worker = None
+
+
+def _initialize_worker(pauli_circuit: PauliCircuit) -> None:
+    global _pauli_circuit_in_worker
+    _pauli_circuit_in_worker = pauli_circuit
+
+
+def _call_in_worker(function, args: tuple):
+    return function(_pauli_circuit_in_worker, *args)
+
+
+def _split_into_shards(items: list, num_shard: int) -> list:
+    """Splits items into num_shard contiguous lists of almost equal
+    lengths, keeping the order.
+    """
+    bounds = [len(items) * i // num_shard for i in range(num_shard + 1)]
+    return [items[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _map_in_process_pool(pauli_circuit: PauliCircuit,
+                         function,
+                         args_list: list,
+                         n_jobs: int) -> list:
+    """Returns [function(pauli_circuit, *args) for args in args_list]
+    computed in a pool of n_jobs processes. The circuit is compiled and
+    sent to each process once rather than with every args, and the
+    results are in the order of args_list. function must be defined at
+    module level so that it can be pickled.
+    """
+    pauli_circuit._get_program()
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             initializer=_initialize_worker,
+                             initargs=(pauli_circuit,)) as executor:
+        return list(executor.map(_call_in_worker,
+                                 [function] * len(args_list),
+                                 args_list))
+
+
+# PauliCircuits converted from QuantestPyCircuits, keyed on the fingerprint
+# of the QuantestPyCircuit
+_PAULI_CIRCUIT_CACHE = _ConversionCache()
+
+
 def cvt_quantestpy_circuit_to_pauli_circuit(
         qc: QuantestPyCircuit) -> PauliCircuit:
     """Converts an instance of QuantestPyCircuit to that of PauliCircuit.
@@ -157,8 +688,12 @@ def cvt_quantestpy_circuit_to_pauli_circuit(
             "Input circuit must be an instance of QuantestPyCircuit."
         )
 
-    pc = PauliCircuit(num_qubit=qc.num_qubit)
-    for gate in qc.gates:
-        pc.add_gate(gate)
+    def convert() -> PauliCircuit:
+        pc = PauliCircuit(num_qubit=qc.num_qubit)
+        pc.set_gate_storage(qc.gate_storage)
+        pc.add_gates(qc.gates)
+        # compile once for all the copies returned from the cache
+        pc._get_program()
+        return pc
 
-    return pc
+    return _PAULI_CIRCUIT_CACHE.get(qc._get_fingerprint(), convert)
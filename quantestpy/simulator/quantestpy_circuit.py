@@ -1,5 +1,539 @@
+import copy
+import gc
+import hashlib
+import itertools
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+
 from quantestpy.simulator.exceptions import QuantestPyCircuitError
 
+# number of circuits kept by each conversion cache
+_CONVERSION_CACHE_SIZE = 128
+
+_GATE_STORAGES = ["list", "columnar"]
+
+# number of gates added to a columnar gate store before they are moved from
+# python lists into its arrays
+_COLUMNAR_FLUSH_SIZE = 4096
+
+# number of gates a columnar gate store creates dicts for at a time while
+# it is iterated
+_COLUMNAR_ITER_CHUNK_SIZE = 4096
+
+# number of gates hashed together in the structural hash of a circuit
+_STRUCTURAL_HASH_BLOCK_SIZE = 1024
+
+# stand-in for a malformed gate while a batch of gates is validated
+_EMPTY_GATE = {"name": "", "target_qubit": [], "control_qubit": [],
+               "control_value": []}
+
+
+# keys of a gate given as arrays to add_gates, each a 2-dim array with a
+# row per gate
+_GATE_ARRAY_KEYS = ["target_qubit", "control_qubit", "control_value",
+                    "parameter"]
+
+
+def _flatten_gate_arrays(gates: dict) -> dict:
+    """Returns the gates given as arrays to add_gates in the layout of
+    _ColumnarGates: the distinct names, a code of the name per gate, and
+    the numbers of the targets, controls and parameters per gate followed
+    by their values. Raises QuantestPyCircuitError if the arrays are not
+    well-formed.
+    """
+    for key in ["name", "target_qubit", "control_qubit", "control_value"]:
+        if key not in gates.keys():
+            raise QuantestPyCircuitError(
+                f"gates must contain '{key}' as a key."
+            )
+
+    names = gates["name"]
+    if isinstance(names, np.ndarray):
+        names = names.tolist()
+    if isinstance(names, str) or not isinstance(names, Sequence) \
+            or not all(issubclass(t, str) for t in set(map(type, names))):
+        raise QuantestPyCircuitError(
+            'gates["name"] must be a sequence of gate names.'
+        )
+    num_gate = len(names)
+
+    arrays = dict()
+    for key in _GATE_ARRAY_KEYS:
+        array = np.asarray(gates.get(key, np.empty((num_gate, 0))))
+        if key == "parameter":
+            is_valid_dtype = array.dtype.kind in "biuf"
+        else:
+            is_valid_dtype = array.dtype.kind in "iu" or array.size == 0
+        if array.ndim != 2 or len(array) != num_gate or not is_valid_dtype:
+            raise QuantestPyCircuitError(
+                f'gates["{key}"] must be a 2-dim array of '
+                f'{"real numbers" if key == "parameter" else "integers"} '
+                "with a row for each gate."
+            )
+        arrays[key] = array
+
+    if arrays["control_qubit"].shape != arrays["control_value"].shape:
+        raise QuantestPyCircuitError(
+            "control_qubit and control_value must have the same shape."
+        )
+
+    flattened = _get_name_codes(names)
+    for key, count_key, dtype in [
+            ("target_qubit", "num_target", np.int32),
+            ("control_qubit", "num_control", np.int32),
+            ("control_value", None, np.int8),
+            ("parameter", "num_parameter", np.float64)]:
+        array = arrays[key]
+        if count_key is not None:
+            flattened[count_key] = np.full(num_gate, array.shape[1],
+                                           dtype=np.int64)
+        # qubits and values out of the range of dtype are kept out of range
+        if dtype is not np.float64 and array.size > 0:
+            array = np.clip(array, np.iinfo(dtype).min, np.iinfo(dtype).max)
+        flattened[key] = array.astype(dtype).reshape(-1)
+    return flattened
+
+
+def _get_name_codes(names: list) -> dict:
+    """Returns the distinct names in order of appearance and the code of
+    the name of each gate, i.e. its index in them.
+    """
+    name_to_code = dict(zip(names, itertools.repeat(0)))
+    name_to_code = dict(zip(name_to_code, range(len(name_to_code))))
+    return dict(names=list(name_to_code),
+                name_code=np.fromiter(map(name_to_code.__getitem__, names),
+                                      dtype=np.int32, count=len(names)))
+
+
+def _flatten_listed_gates(gates: list) -> dict:
+    """Returns the gates given as dicts in the layout of
+    _flatten_gate_arrays. Raises QuantestPyCircuitError if a parameter is
+    not a real number.
+    """
+    flattened = _get_name_codes([gate["name"] for gate in gates])
+    for key, count_key, dtype in [
+            ("target_qubit", "num_target", np.int32),
+            ("control_qubit", "num_control", np.int32),
+            ("control_value", None, np.int8),
+            ("parameter", "num_parameter", np.float64)]:
+        lists = [gate.get(key, []) for gate in gates]
+        if count_key is not None:
+            flattened[count_key] = np.fromiter(map(len, lists),
+                                               dtype=np.int64,
+                                               count=len(lists))
+        values = itertools.chain.from_iterable(lists)
+        if key != "parameter":
+            flattened[key] = np.fromiter(values, dtype=dtype)
+            continue
+        try:
+            flattened[key] = np.fromiter(map(float, values), dtype=dtype)
+        except (TypeError, ValueError):
+            raise QuantestPyCircuitError(
+                "parameter must be a list of real numbers "
+                "in the columnar gate storage."
+            ) from None
+    return flattened
+
+
+def _get_flattened_gate(flattened: dict, index: int) -> dict:
+    """Returns the gate of the index in the flattened gates as a dict."""
+    gate = {"name": flattened["names"][flattened["name_code"][index]]}
+    for key, count_key in [("target_qubit", "num_target"),
+                           ("control_qubit", "num_control"),
+                           ("control_value", "num_control"),
+                           ("parameter", "num_parameter")]:
+        start = int(np.sum(flattened[count_key][:index]))
+        stop = start + int(flattened[count_key][index])
+        gate[key] = flattened[key][start:stop].tolist()
+    return gate
+
+
+def _unflatten_gates(flattened: dict) -> list:
+    """Returns the flattened gates as a list of dicts. The garbage
+    collector is paused meanwhile, since the millions of new lists would
+    otherwise trigger it over and over although none of them is garbage.
+    """
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _create_gate_dicts(flattened)
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+
+def _create_gate_dicts(flattened: dict) -> list:
+    names = flattened["names"]
+    lists = dict()
+    for key, count_key in [("target_qubit", "num_target"),
+                           ("control_qubit", "num_control"),
+                           ("control_value", "num_control"),
+                           ("parameter", "num_parameter")]:
+        counts = flattened[count_key]
+        values = flattened[key]
+        if len(counts) > 0 and np.all(counts == counts[0]):
+            # gates of the same shape are split by reshaping
+            lists[key] = values.reshape(len(counts), counts[0]).tolist()
+        else:
+            values = values.tolist()
+            offsets = [0] + np.cumsum(counts).tolist()
+            lists[key] = [values[offsets[i]:offsets[i+1]]
+                          for i in range(len(counts))]
+    return [{"name": names[code], "target_qubit": target_qubit,
+             "control_qubit": control_qubit, "control_value": control_value,
+             "parameter": parameter}
+            for code, target_qubit, control_qubit, control_value, parameter
+            in zip(flattened["name_code"].tolist(), lists["target_qubit"],
+                   lists["control_qubit"], lists["control_value"],
+                   lists["parameter"])]
+
+
+class _Column:
+    """
+    One-dimensional numpy array which grows by doubling its capacity.
+    """
+
+    def __init__(self, dtype, values=()):
+        self._array = np.empty(16, dtype=dtype)
+        self._size = 0
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, values) -> None:
+        size = self._size + len(values)
+        if size > len(self._array):
+            array = np.empty(max(size, 2 * len(self._array)),
+                             dtype=self._array.dtype)
+            array[:self._size] = self._array[:self._size]
+            self._array = array
+        self._array[self._size:size] = values
+        self._size = size
+
+    @property
+    def array(self) -> np.ndarray:
+        """Returns a read-only view of the values."""
+        view = self._array[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def copy(self) -> "_Column":
+        column = _Column(self._array.dtype)
+        column.extend(self.array)
+        return column
+
+
+class _ColumnarGates(Sequence):
+    """
+    Gates stored column by column in flat arrays instead of a list of
+    dicts: a code of the name per gate, and CSR-style offsets into the
+    arrays of the target qubits, of the control qubits and values, and of
+    the parameters. The target qubits of gate i are
+    target_qubit[target_offset[i]:target_offset[i+1]] and likewise for the
+    others. A gate takes some tens of bytes instead of some hundreds.
+
+    It is a read-only sequence of gates: indexing and iterating return a
+    new dict per gate, so that modifying the dict does not modify the
+    stored gate. Parameters come back as floats, a gate without
+    "parameter" comes back with an empty one, and keys other than those of
+    a gate are not kept.
+
+    Creating the dicts costs about a microsecond per gate, which iterating
+    a list does not, so the passes over all the gates read the columns
+    directly instead: adding the gates to another circuit, compiling a
+    PauliCircuit, and comparing and hashing circuits. The others, e.g. the
+    fusion of the gates of a StateVectorCircuit, iterate the dicts.
+    """
+
+    def __init__(self, gates=()):
+        self._names = []
+        self._name_to_code = dict()
+        self._num_gate = 0
+        self._columns = dict(
+            name_code=_Column(np.int32),
+            target_offset=_Column(np.int64, [0]),
+            target_qubit=_Column(np.int32),
+            control_offset=_Column(np.int64, [0]),
+            control_qubit=_Column(np.int32),
+            control_value=_Column(np.int8),
+            parameter_offset=_Column(np.int64, [0]),
+            parameter=_Column(np.float64))
+        # gates added since the last flush: name codes, and the number of
+        # targets, controls and parameters per gate followed by their values
+        self._pending = dict(
+            name_code=[], num_target=[], target_qubit=[], num_control=[],
+            control_qubit=[], control_value=[], num_parameter=[],
+            parameter=[])
+        self._extend(list(gates))
+
+    @staticmethod
+    def _get_parameter(gate: dict) -> list:
+        try:
+            return [float(i) for i in gate.get("parameter", [])]
+        except (TypeError, ValueError):
+            raise QuantestPyCircuitError(
+                "parameter must be a list of real numbers "
+                "in the columnar gate storage."
+            ) from None
+
+    def _append(self, gate: dict) -> None:
+        name = gate["name"]
+        code = self._name_to_code.get(name)
+        if code is None:
+            code = len(self._names)
+            self._names.append(name)
+            self._name_to_code[name] = code
+
+        parameter = self._get_parameter(gate)
+
+        pending = self._pending
+        pending["name_code"].append(code)
+        pending["num_target"].append(len(gate["target_qubit"]))
+        pending["target_qubit"] += gate["target_qubit"]
+        pending["num_control"].append(len(gate["control_qubit"]))
+        pending["control_qubit"] += gate["control_qubit"]
+        pending["control_value"] += gate["control_value"]
+        pending["num_parameter"].append(len(parameter))
+        pending["parameter"] += parameter
+        self._num_gate += 1
+
+        if len(pending["name_code"]) >= _COLUMNAR_FLUSH_SIZE:
+            self._flush()
+
+    def _extend(self, gates: list) -> None:
+        """Appends the gates, or none of them if one has an unhashable name
+        or a parameter which is not a real number.
+        """
+        self._extend_flattened(_flatten_listed_gates(gates))
+
+    def _get_flattened(self) -> dict:
+        """Returns the gates in the layout of _flatten_gate_arrays."""
+        flattened = dict(names=list(self._names),
+                         name_code=self.name_code)
+        for key, count_key in [("target", "num_target"),
+                               ("control", "num_control"),
+                               ("parameter", "num_parameter")]:
+            flattened[count_key] = np.diff(self._get_column(key + "_offset"))
+        for key in ["target_qubit", "control_qubit", "control_value",
+                    "parameter"]:
+            flattened[key] = self._get_column(key)
+        return flattened
+
+    def _extend_flattened(self, flattened: dict) -> None:
+        """Appends the flattened gates, copying each of their arrays into
+        its column at once.
+        """
+        self._flush()
+        for name in flattened["names"]:
+            if name not in self._name_to_code:
+                self._name_to_code[name] = len(self._names)
+                self._names.append(name)
+        code = np.array([self._name_to_code[name]
+                         for name in flattened["names"]], dtype=np.int32)
+
+        columns = self._columns
+        columns["name_code"].extend(code[flattened["name_code"]])
+        for key in ["target_qubit", "control_qubit", "control_value",
+                    "parameter"]:
+            columns[key].extend(flattened[key])
+        for offset_key, count_key in [("target_offset", "num_target"),
+                                      ("control_offset", "num_control"),
+                                      ("parameter_offset", "num_parameter")]:
+            offset = columns[offset_key]
+            offset.extend(offset.array[-1]
+                          + np.cumsum(flattened[count_key]))
+        self._num_gate += len(flattened["name_code"])
+
+    def _flush(self) -> None:
+        """Moves the pending gates into the columns."""
+        pending = self._pending
+        if len(pending["name_code"]) == 0:
+            return
+
+        columns = self._columns
+        for key in ["name_code", "target_qubit", "control_qubit",
+                    "control_value", "parameter"]:
+            columns[key].extend(pending[key])
+        for offset_key, count_key in [("target_offset", "num_target"),
+                                      ("control_offset", "num_control"),
+                                      ("parameter_offset", "num_parameter")]:
+            offset = columns[offset_key]
+            offset.extend(offset.array[-1] + np.cumsum(pending[count_key]))
+
+        for values in pending.values():
+            values.clear()
+
+    def _get_column(self, key: str) -> np.ndarray:
+        self._flush()
+        return self._columns[key].array
+
+    @property
+    def names(self) -> list:
+        """Returns the gate names indexed by their codes in name_code."""
+        return list(self._names)
+
+    @property
+    def name_code(self) -> np.ndarray:
+        return self._get_column("name_code")
+
+    @property
+    def target_offset(self) -> np.ndarray:
+        return self._get_column("target_offset")
+
+    @property
+    def target_qubit(self) -> np.ndarray:
+        return self._get_column("target_qubit")
+
+    @property
+    def control_offset(self) -> np.ndarray:
+        return self._get_column("control_offset")
+
+    @property
+    def control_qubit(self) -> np.ndarray:
+        return self._get_column("control_qubit")
+
+    @property
+    def control_value(self) -> np.ndarray:
+        return self._get_column("control_value")
+
+    @property
+    def parameter_offset(self) -> np.ndarray:
+        return self._get_column("parameter_offset")
+
+    @property
+    def parameter(self) -> np.ndarray:
+        return self._get_column("parameter")
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes taken by the columns."""
+        self._flush()
+        return sum(column.array.nbytes for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return self._num_gate
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._num_gate)
+            if step == 1:
+                return self._get_gate_dicts(start, max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += self._num_gate
+        if not 0 <= index < self._num_gate:
+            raise IndexError("gate index out of range")
+
+        self._flush()
+        columns = {key: column._array for key, column in self._columns.items()}
+        target = slice(*columns["target_offset"][index:index+2])
+        control = slice(*columns["control_offset"][index:index+2])
+        parameter = slice(*columns["parameter_offset"][index:index+2])
+        return {
+            "name": self._names[columns["name_code"][index]],
+            "target_qubit": columns["target_qubit"][target].tolist(),
+            "control_qubit": columns["control_qubit"][control].tolist(),
+            "control_value": columns["control_value"][control].tolist(),
+            "parameter": columns["parameter"][parameter].tolist()
+        }
+
+    def __iter__(self):
+        for start in range(0, self._num_gate, _COLUMNAR_ITER_CHUNK_SIZE):
+            yield from self._get_gate_dicts(
+                start, min(start + _COLUMNAR_ITER_CHUNK_SIZE, self._num_gate))
+
+    def _get_gate_dicts(self, start: int, stop: int) -> list:
+        """Returns the gates from start to stop as a list of new dicts."""
+        flattened = dict(names=self._names,
+                         name_code=self.name_code[start:stop])
+        for key, count_key, values_key in [
+                ("target", "num_target", "target_qubit"),
+                ("control", "num_control", "control_qubit"),
+                ("parameter", "num_parameter", "parameter")]:
+            offset = self._get_column(key + "_offset")[start:stop+1]
+            flattened[count_key] = np.diff(offset)
+            flattened[values_key] = \
+                self._get_column(values_key)[offset[0]:offset[-1]]
+            if key == "control":
+                flattened["control_value"] = \
+                    self.control_value[offset[0]:offset[-1]]
+        return _unflatten_gates(flattened)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, _ColumnarGates)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> "_ColumnarGates":
+        self._flush()
+        gates = _ColumnarGates()
+        gates._names = list(self._names)
+        gates._name_to_code = dict(self._name_to_code)
+        gates._num_gate = self._num_gate
+        gates._columns = {key: column.copy()
+                          for key, column in self._columns.items()}
+        return gates
+
+    def _encode(self, start: int, stop: int) -> bytes:
+        """Returns the bytes of the gates from start to stop hashed in the
+        structural hash of a circuit.
+        """
+        counts_and_values = []
+        for key in ["target", "control", "parameter"]:
+            offset = self._get_column(key + "_offset")[start:stop+1]
+            values = self._get_column(
+                "parameter" if key == "parameter" else key + "_qubit")
+            counts_and_values += [np.diff(offset),
+                                  values[offset[0]:offset[-1]]]
+            if key == "control":
+                counts_and_values.append(
+                    self.control_value[offset[0]:offset[-1]])
+        names = [self._names[code]
+                 for code in self.name_code[start:stop].tolist()]
+        return _encode_gates(names, *counts_and_values)
+
+    def _get_fingerprint(self) -> tuple:
+        """Returns a hashable value which is equal between stores having
+        the same gates.
+        """
+        self._flush()
+        return (tuple(self._names),) + tuple(
+            column.array.tobytes() for column in self._columns.values())
+
+
+def _encode_gates(names: list, *counts_and_values) -> bytes:
+    """Returns the bytes of gates hashed in the structural hash of a
+    circuit: the names, and the numbers of the targets, controls and
+    parameters per gate, each followed by their values.
+    """
+    encoded = [repr(names).encode()]
+    for i, values in enumerate(counts_and_values):
+        dtype = np.float64 if i == len(counts_and_values) - 1 else np.int64
+        try:
+            encoded.append(np.asarray(values, dtype=dtype).tobytes())
+        except (TypeError, ValueError, OverflowError):
+            encoded.append(repr(values).encode())
+    return b"|".join(encoded)
+
+
+def _encode_listed_gates(gates: list) -> bytes:
+    counts_and_values = []
+    for key in ["target_qubit", "control_qubit", "parameter"]:
+        lists = [gate.get(key, []) for gate in gates]
+        counts_and_values += [
+            list(map(len, lists)), list(itertools.chain.from_iterable(lists))]
+        if key == "control_qubit":
+            counts_and_values.append(list(itertools.chain.from_iterable(
+                gate["control_value"] for gate in gates)))
+    return _encode_gates([gate["name"] for gate in gates], *counts_and_values)
+
 
 class QuantestPyCircuit:
     """
@@ -20,6 +554,12 @@ class QuantestPyCircuit:
     def gates(self):
         return self._gates
 
+    @property
+    def gate_storage(self):
+        if isinstance(self._gates, _ColumnarGates):
+            return "columnar"
+        return "list"
+
     @property
     def num_qubit(self):
         return self._num_qubit
@@ -147,9 +687,287 @@ class QuantestPyCircuit:
                 "containing exactly 2 elements for 'target_qubit'."
             )
 
+    def _get_invalid_gates(self, gates: list) -> np.ndarray:
+        """Returns a bool array flagging the gates which _diagnostic_gate
+        may reject, checking all the gates at once with array operations.
+        A flagged gate is not necessarily invalid, but a gate not flagged
+        is valid.
+        """
+        num_gate = len(gates)
+        # A gate which is not a dict or lacks a key is replaced with an
+        # empty gate, and a value other than a list with an empty list.
+        is_invalid = np.zeros(num_gate, dtype=bool)
+        keys = ["name", "target_qubit", "control_qubit", "control_value"]
+        try:
+            if set(map(type, gates)) - {dict}:
+                raise TypeError
+            names, *lists = [[gate[key] for gate in gates] for key in keys]
+        except (TypeError, KeyError):
+            is_invalid[:] = [type(gate) is not dict
+                             or not set(keys) <= gate.keys()
+                             for gate in gates]
+            gates = [_EMPTY_GATE if is_invalid[i] else gate
+                     for i, gate in enumerate(gates)]
+            names, *lists = [[gate[key] for gate in gates] for key in keys]
+
+        flattened = []
+        for lists_of_key in lists:
+            if set(map(type, lists_of_key)) - {list}:
+                is_not_list = np.array([type(values) is not list
+                                        for values in lists_of_key],
+                                       dtype=bool)
+                is_invalid |= is_not_list
+                lists_of_key = [[] if is_not_list[i] else values
+                                for i, values in enumerate(lists_of_key)]
+            flattened.append(
+                (list(map(len, lists_of_key)),
+                 list(itertools.chain.from_iterable(lists_of_key))))
+        (num_target, target_qubit), (num_control, control_qubit), \
+            (num_control_value, control_value) = flattened
+        is_swap = [name in ("swap", "iswap") for name in names]
+
+        num_target = np.array(num_target, dtype=np.int64)
+        num_control = np.array(num_control, dtype=np.int64)
+        num_control_value = np.array(num_control_value, dtype=np.int64)
+        is_invalid |= num_target < 1
+        is_invalid |= num_control != num_control_value
+        is_invalid |= np.array(is_swap, dtype=bool) & (num_target != 2)
+
+        gate_index = np.arange(num_gate)
+        target_gate = np.repeat(gate_index, num_target)
+        control_gate = np.repeat(gate_index, num_control)
+        # control_value is aligned with control_qubit in the valid gates
+        value_gate = np.repeat(gate_index, num_control_value)
+
+        def to_array(values: list, value_gate: np.ndarray) -> np.ndarray:
+            # flags the gates having a value which is not an integer
+            not_int_types = {t for t in set(map(type, values))
+                             if not issubclass(t, int)}
+            if not_int_types:
+                is_not_int = np.array(
+                    [type(v) in not_int_types for v in values], dtype=bool)
+                is_invalid[value_gate[is_not_int]] = True
+                values = [0 if type(v) in not_int_types else v
+                          for v in values]
+            return np.array(values, dtype=np.int64).reshape(-1)
+
+        try:
+            target_qubit = to_array(target_qubit, target_gate)
+            control_qubit = to_array(control_qubit, control_gate)
+            control_value = to_array(control_value, value_gate)
+        except OverflowError:
+            return np.ones(num_gate, dtype=bool)
+
+        self._flag_invalid_qubits(is_invalid, target_gate, target_qubit,
+                                  control_gate, control_qubit, value_gate,
+                                  control_value)
+        return is_invalid
+
+    def _flag_invalid_qubits(self, is_invalid: np.ndarray,
+                             target_gate: np.ndarray,
+                             target_qubit: np.ndarray,
+                             control_gate: np.ndarray,
+                             control_qubit: np.ndarray,
+                             value_gate: np.ndarray,
+                             control_value: np.ndarray) -> None:
+        """Flags in is_invalid the gates having a qubit out of range, a
+        control value other than 0 and 1, or a duplicate qubit, where
+        target_gate etc. are the indices of the gates the values belong to.
+        """
+        for qubit, qubit_gate in [(target_qubit, target_gate),
+                                  (control_qubit, control_gate)]:
+            is_out_of_range = (qubit < 0) | (qubit >= self._num_qubit)
+            is_invalid[qubit_gate[is_out_of_range]] = True
+        is_invalid[value_gate[(control_value != 0) & (control_value != 1)]] \
+            = True
+
+        # A qubit appearing twice in the targets, in the controls, or in
+        # both of a gate is a duplicate key (gate, qubit) after sorting.
+        num_qubit = self._num_qubit
+        target_key = np.unique(target_gate * num_qubit + target_qubit,
+                               return_counts=True)
+        control_key = np.unique(control_gate * num_qubit + control_qubit,
+                                return_counts=True)
+        for key, count in [target_key, control_key]:
+            is_invalid[key[count > 1] // num_qubit] = True
+        key = np.concatenate([target_key[0], control_key[0]])
+        key.sort()
+        is_invalid[key[1:][key[1:] == key[:-1]] // num_qubit] = True
+
+    def _get_invalid_flattened_gates(self, flattened: dict) -> np.ndarray:
+        """Returns a bool array flagging the flattened gates which
+        _diagnostic_gate may reject, as _get_invalid_gates does. The checks
+        depending only on the name and the numbers of the targets, controls
+        and parameters, including those of the subclasses, are left to
+        _diagnostic_gate for the first gate of each such combination.
+        """
+        num_gate = len(flattened["name_code"])
+        is_invalid = np.zeros(num_gate, dtype=bool)
+        if num_gate == 0:
+            return is_invalid
+
+        keys = ["name_code", "num_target", "num_control", "num_parameter"]
+        radixes = [int(flattened[key].max()) + 1 for key in keys]
+        if np.prod(radixes, dtype=object) < 2**63:
+            # the combinations are numbered in mixed radix
+            signature = np.zeros(num_gate, dtype=np.int64)
+            for key, radix in zip(keys, radixes):
+                signature = signature * radix + flattened[key]
+            first = np.unique(signature, return_index=True)[1]
+        else:
+            signature = np.stack([flattened[key] for key in keys], axis=1)
+            first = np.unique(signature, axis=0, return_index=True)[1]
+        is_invalid[first] = True
+
+        gate_index = np.arange(num_gate)
+        control_gate = np.repeat(gate_index, flattened["num_control"])
+        self._flag_invalid_qubits(
+            is_invalid,
+            np.repeat(gate_index, flattened["num_target"]),
+            flattened["target_qubit"].astype(np.int64),
+            control_gate, flattened["control_qubit"].astype(np.int64),
+            control_gate, flattened["control_value"].astype(np.int64))
+        return is_invalid
+
     def add_gate(self, gate: dict) -> None:
         self._diagnostic_gate(gate)
-        self._gates.append(gate)
+        if isinstance(self._gates, _ColumnarGates):
+            self._gates._append(gate)
+        else:
+            self._gates.append(gate)
+
+    def add_gates(self, gates, validate: bool = True) -> None:
+        """Adds the gates at once, i.e. a list of gates, the gates of
+        another circuit, or arrays of gates: a dict of a sequence of names
+        and of 2-dim arrays with a row per gate for the other keys of a
+        gate. The gates are validated all together with array operations,
+        and if one is invalid, the same error as add_gate is raised for the
+        first invalid gate and none of them is added. validate=False skips
+        the validation for the gates known to be valid, e.g. those
+        translated from a circuit of another SDK.
+        """
+        if isinstance(gates, dict):
+            self._add_flattened_gates(_flatten_gate_arrays(gates), validate)
+            return
+        if isinstance(gates, _ColumnarGates):
+            self._add_flattened_gates(gates._get_flattened(), validate)
+            return
+
+        gates = list(gates)
+        if validate:
+            for i in np.flatnonzero(self._get_invalid_gates(gates)):
+                self._diagnostic_gate(gates[i])
+
+        if isinstance(self._gates, _ColumnarGates):
+            self._gates._extend(gates)
+        else:
+            self._gates += gates
+
+    def _add_flattened_gates(self, flattened: dict, validate: bool) -> None:
+        if validate:
+            for i in np.flatnonzero(
+                    self._get_invalid_flattened_gates(flattened)):
+                self._diagnostic_gate(_get_flattened_gate(flattened, i))
+
+        if isinstance(self._gates, _ColumnarGates):
+            self._gates._extend_flattened(flattened)
+        else:
+            self._gates += _unflatten_gates(flattened)
+
+    def set_gate_storage(self, gate_storage: str) -> None:
+        """Sets how the gates are stored: "list", a list of the gate dicts
+        as added (default), or "columnar", flat arrays which take far less
+        memory for large circuits. In the latter, gates is a read-only
+        sequence returning a new dict per gate.
+        """
+        if gate_storage not in _GATE_STORAGES:
+            raise QuantestPyCircuitError(
+                f"gate_storage must be one of {_GATE_STORAGES}."
+            )
+        if gate_storage == self.gate_storage:
+            return
+
+        if gate_storage == "columnar":
+            self._gates = _ColumnarGates(self._gates)
+        else:
+            self._gates = list(self._gates)
+
+    def _get_fingerprint(self):
+        """Returns a hashable value which is equal between circuits having
+        the same number of qubits and the same gates, or None if a gate has
+        an unhashable parameter.
+        """
+        if isinstance(self._gates, _ColumnarGates):
+            return (self._num_qubit, self._gates._get_fingerprint())
+
+        fingerprint = (
+            self._num_qubit,
+            tuple((gate["name"],
+                   tuple(gate["target_qubit"]),
+                   tuple(gate["control_qubit"]),
+                   tuple(gate["control_value"]),
+                   tuple(gate.get("parameter", [])))
+                  for gate in self._gates))
+        try:
+            hash(fingerprint)
+        except TypeError:
+            return None
+        return fingerprint
+
+    def _get_structural_hash(self) -> str:
+        """Returns the hex digest of the number of qubits and the gates,
+        which is equal between circuits with the same gates in any gate
+        storage and stable across processes. The digest is computed from
+        the current gates on every call, since the gates of a list storage
+        may be modified in place, and they are encoded
+        _STRUCTURAL_HASH_BLOCK_SIZE gates at a time.
+        """
+        digest = hashlib.blake2b(repr(self._num_qubit).encode(),
+                                 digest_size=16)
+        num_gate = len(self._gates)
+        for start in range(0, num_gate, _STRUCTURAL_HASH_BLOCK_SIZE):
+            stop = min(start + _STRUCTURAL_HASH_BLOCK_SIZE, num_gate)
+            encoded = self._encode_gates(start, stop)
+            digest.update(len(encoded).to_bytes(8, "little") + encoded)
+        return digest.hexdigest()
+
+    def _encode_gates(self, start: int, stop: int) -> bytes:
+        if isinstance(self._gates, _ColumnarGates):
+            return self._gates._encode(start, stop)
+        return _encode_listed_gates(self._gates[start:stop])
+
+    def __eq__(self, other) -> bool:
+        """Circuits are equal if they are of the same class and have the
+        same number of qubits and the same gates.
+        """
+        if not isinstance(other, QuantestPyCircuit):
+            return NotImplemented
+        return type(self) is type(other) \
+            and self._num_qubit == other._num_qubit \
+            and len(self._gates) == len(other._gates) \
+            and self._get_structural_hash() == other._get_structural_hash()
+
+    # Circuits are hashed by identity as before __eq__ was defined, so
+    # that they can still be keys of dicts and members of sets.
+    __hash__ = object.__hash__
+
+    def _copy(self, copy_gates: bool = False) -> "QuantestPyCircuit":
+        """Returns a copy of this circuit to which gates can be added
+        independently. The gates themselves are shared unless copy_gates
+        is True or they are stored in columns.
+        """
+        circuit = copy.copy(self)
+        if isinstance(self._gates, _ColumnarGates):
+            circuit._gates = self._gates.copy()
+        elif copy_gates:
+            circuit._gates = [
+                {key: list(value) if isinstance(value, list) else value
+                 for key, value in gate.items()}
+                for gate in self._gates]
+        else:
+            circuit._gates = list(self._gates)
+        circuit._qubit_indices = list(self._qubit_indices)
+        return circuit
 
     def draw(self,):
         from quantestpy.visualization.quantestpy_circuit_drawer import \
@@ -158,6 +976,50 @@ class QuantestPyCircuit:
         return draw_circuit(self)
 
 
+class _ConversionCache:
+    """
+    Least recently used cache of converted circuits.
+
+    A cached circuit is never returned itself but as a copy, so that the
+    caller is free to add gates to it or to change its settings. The
+    circuit is cached with its own gates, which do not change even if the
+    gates of the converted circuit are modified in place.
+    """
+
+    def __init__(self, maxsize: int = _CONVERSION_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._circuits = OrderedDict()
+        # for profiling
+        self._num_hit = 0
+        self._num_miss = 0
+
+    def get(self, key, convert) -> QuantestPyCircuit:
+        """Returns the circuit cached for key, or the one returned by
+        convert() caching its copy if there is none. key None means the
+        circuit is not cacheable.
+        """
+        if key is None:
+            return convert()
+
+        circuit = self._circuits.get(key)
+        if circuit is not None:
+            self._num_hit += 1
+            self._circuits.move_to_end(key)
+            return circuit._copy()
+
+        self._num_miss += 1
+        circuit = convert()
+        self._circuits[key] = circuit._copy(copy_gates=True)
+        if len(self._circuits) > self._maxsize:
+            self._circuits.popitem(last=False)
+        return circuit
+
+    def clear(self) -> None:
+        self._circuits.clear()
+        self._num_hit = 0
+        self._num_miss = 0
+
+
 if __name__ == "__main__":
     """Example showing how to use QuantestPyCircuit class."""
 
@@ -1,9 +1,34 @@
+import functools
 import itertools
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 
 import numpy as np
 
 from quantestpy.simulator.exceptions import StateVectorCircuitError
-from quantestpy.simulator.quantestpy_circuit import QuantestPyCircuit
+from quantestpy.simulator.quantestpy_circuit import (QuantestPyCircuit,
+                                                     _ConversionCache)
+
+try:
+    from scipy.sparse import csr_matrix
+
+except ModuleNotFoundError:
+    def _create_sparse_matrix(data: np.ndarray,
+                              row: np.ndarray,
+                              col: np.ndarray,
+                              dim: int):
+        raise StateVectorCircuitError(
+            "SciPy is missing. Please install it."
+        )
+
+else:
+    def _create_sparse_matrix(data: np.ndarray,
+                              row: np.ndarray,
+                              col: np.ndarray,
+                              dim: int) -> csr_matrix:
+        return csr_matrix((data, (row, col)), shape=(dim, dim))
 
 # inside of test unit
 # single qubit gates
@@ -19,6 +44,10 @@ _Tdg = np.array([[1, 0], [0, np.exp(-1j*np.pi/4)]])
 _SX = np.array([[1+1j, 1-1j], [1-1j, 1+1j]])/2.
 _SXdg = np.array([[1-1j, 1+1j], [1+1j, 1-1j]])/2.
 
+# two qubit gates
+_SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+_ISWAP = np.array([[1, 0, 0, 0], [0, 0, 1j, 0], [0, 1j, 0, 0], [0, 0, 0, 1]])
+
 
 def _u(parameter: list) -> np.ndarray:
     theta, phi, lambda_, gamma = parameter
@@ -61,6 +90,395 @@ def _scalar(parameter: list) -> np.ndarray:
     return _ID * np.exp(1j*theta)
 
 
+# registry of single qubit gates: constant matrices and functions of the
+# parameters
+_GATE_NAME_TO_MATRIX = {"id": _ID, "x": _X, "y": _Y, "z": _Z, "h": _H,
+                        "s": _S, "sdg": _Sdg, "t": _T, "tdg": _Tdg,
+                        "sx": _SX, "sxdg": _SXdg}
+_GATE_NAME_TO_MATRIX_FUNCTION = {"rx": _rx, "ry": _ry, "rz": _rz, "r": _r,
+                                 "u": _u, "p": _p, "scalar": _scalar}
+for _matrix in list(_GATE_NAME_TO_MATRIX.values()) + [_SWAP, _ISWAP]:
+    _matrix.flags.writeable = False
+
+# gates acting on at most this number of qubits in total are fused before
+# simulation
+_DEFAULT_MAX_FUSED_QUBIT = 2
+_MAX_FUSED_QUBIT_LIMIT = 4
+
+# the amplitudes are split among threads only if each thread gets at least
+# this number of them, below which the overhead dominates.
+_NUM_THREADS_ENV = "QUANTESTPY_NUM_THREADS"
+_MIN_AMPLITUDES_PER_THREAD = 2**14
+
+# The operator of a circuit is backed by a temporary file in the directory
+# given by the environment variable, and computed and compared this number
+# of columns at a time, which bounds the memory to a few times
+# 2**num_qubit x tile_size amplitudes.
+_OPERATOR_MEMMAP_DIR_ENV = "QUANTESTPY_OPERATOR_MEMMAP_DIR"
+_OPERATOR_TILE_SIZE_ENV = "QUANTESTPY_OPERATOR_TILE_SIZE"
+_DEFAULT_OPERATOR_TILE_SIZE = 256
+
+# precisions of the simulation and the absolute tolerances the assertions
+# default to for them
+_DTYPE_TO_DEFAULT_ATOL = {np.dtype(np.complex64): 1e-5,
+                          np.dtype(np.complex128): 1e-8}
+
+# angles repeating across circuits, e.g. in a parameter sweep, share an
+# entry of the cache.
+_PARAMETRIC_GATE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_PARAMETRIC_GATE_CACHE_SIZE)
+def _get_parametric_gate_matrix(name: str, parameter: tuple) -> np.ndarray:
+    matrix = _GATE_NAME_TO_MATRIX_FUNCTION[name](list(parameter))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _get_gate_matrix(name: str, parameter: list) -> np.ndarray:
+    """Returns the read-only 2x2 matrix of the single qubit gate, shared
+    among all the circuits.
+    """
+    if name in _GATE_NAME_TO_MATRIX:
+        return _GATE_NAME_TO_MATRIX[name]
+
+    # keyed on the exact values, so that the matrix is that of the
+    # parameters given
+    return _get_parametric_gate_matrix(
+        name, tuple(float(param) for param in parameter))
+
+
+def _is_diagonal(gate: np.ndarray) -> bool:
+    """Returns True if gate is diagonal. A 1-dim gate is the diagonal of
+    a 2**k x 2**k gate acting on its k target qubits jointly.
+    """
+    if np.ndim(gate) == 1:
+        return True
+
+    return np.count_nonzero(gate - np.diag(np.diagonal(gate))) == 0
+
+
+def _get_permutation_and_phase(gate: np.ndarray) -> tuple:
+    """Returns (permutation, phase) if the only non-zero elements of gate
+    are gate[row, permutation[row]] = phase[row], as for x, y, swap and
+    iswap, otherwise None. Such a gate moves and multiplies amplitudes
+    rather than mixing them.
+    """
+    if np.ndim(gate) == 1:
+        return np.arange(len(gate)), np.asarray(gate)
+
+    is_nonzero = np.asarray(gate) != 0
+    if np.any(np.count_nonzero(is_nonzero, axis=0) != 1) \
+            or np.any(np.count_nonzero(is_nonzero, axis=1) != 1):
+        return None
+
+    permutation = np.argmax(is_nonzero, axis=1)
+    phase = np.asarray(gate)[np.arange(len(gate)), permutation]
+
+    return permutation, phase
+
+
+def _apply_permutation_and_phase_to_sub_tensor(sub_tensor: np.ndarray,
+                                               permutation: np.ndarray,
+                                               phase: np.ndarray,
+                                               target_axis: list) -> None:
+    """Applies the gate given by _get_permutation_and_phase jointly to the
+    target axes of sub_tensor in place, as gathers of slices.
+    """
+    num_target = len(target_axis)
+
+    def _get_index(value: int) -> tuple:
+        index = [slice(None)] * sub_tensor.ndim
+        for i, axis in enumerate(target_axis):
+            index[axis] = (value >> (num_target - 1 - i)) & 1
+        return tuple(index)
+
+    is_permuted = np.any(permutation != np.arange(len(permutation)))
+    source = sub_tensor.copy() if is_permuted else sub_tensor
+
+    for row, col in enumerate(permutation):
+        if row == col and phase[row] == 1:
+            continue
+        if phase[row] == 1:
+            sub_tensor[_get_index(row)] = source[_get_index(col)]
+        else:
+            sub_tensor[_get_index(row)] = phase[row] * source[_get_index(col)]
+
+
+def _is_supported_dtype(dtype) -> bool:
+    """Returns True if dtype is one of the precisions of the simulation,
+    i.e. complex64 or complex128.
+    """
+    try:
+        return np.dtype(dtype) in _DTYPE_TO_DEFAULT_ATOL
+    except TypeError:
+        return False
+
+
+def _get_default_num_threads() -> int:
+    """Returns the number of threads given by the environment variable
+    QUANTESTPY_NUM_THREADS, or 1 if it is not set.
+    """
+    num_threads = os.environ.get(_NUM_THREADS_ENV)
+    if num_threads is None:
+        return 1
+
+    if not num_threads.strip().isdigit() or int(num_threads) < 1:
+        raise StateVectorCircuitError(
+            f"{_NUM_THREADS_ENV} must be a positive integer."
+        )
+
+    return int(num_threads)
+
+
+def _get_default_operator_memmap_dir() -> Union[str, None]:
+    """Returns the directory given by the environment variable
+    QUANTESTPY_OPERATOR_MEMMAP_DIR, or None if it is not set.
+    """
+    return os.environ.get(_OPERATOR_MEMMAP_DIR_ENV) or None
+
+
+def _get_default_operator_tile_size() -> int:
+    """Returns the number of columns given by the environment variable
+    QUANTESTPY_OPERATOR_TILE_SIZE, or 256 if it is not set.
+    """
+    tile_size = os.environ.get(_OPERATOR_TILE_SIZE_ENV)
+    if tile_size is None:
+        return _DEFAULT_OPERATOR_TILE_SIZE
+
+    if not tile_size.strip().isdigit() or int(tile_size) < 1:
+        raise StateVectorCircuitError(
+            f"{_OPERATOR_TILE_SIZE_ENV} must be a positive integer."
+        )
+
+    return int(tile_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_thread_pool(num_threads: int) -> ThreadPoolExecutor:
+    """Returns the pool of num_threads threads shared among all the
+    circuits.
+    """
+    return ThreadPoolExecutor(max_workers=num_threads,
+                              thread_name_prefix="quantestpy")
+
+
+def _slice_axes(tensor: np.ndarray, axes: list, values: list,
+                other_axes: list) -> tuple:
+    """Returns the view of tensor at the given values of axes, together
+    with other_axes renumbered for the view in which axes are dropped.
+    """
+    index = [slice(None)] * tensor.ndim
+    for axis, value in zip(axes, values):
+        index[axis] = value
+
+    other_axes = [axis - len([i for i in axes if i < axis])
+                  for axis in other_axes]
+
+    return tensor[tuple(index)], other_axes
+
+
+def _apply_gate_to_state_tensor(state_tensor: np.ndarray,
+                                gate: np.ndarray,
+                                control_axis: list,
+                                target_axis: list,
+                                control_value: list,
+                                num_threads: int = 1) -> None:
+    """Applies gate to state_tensor of shape (2, 2, ..., 2) + extra in
+    place. gate is either a 2x2 matrix applied to each target axis, a
+    2**k x 2**k matrix applied jointly to the k target axes, the first of
+    which is the most significant, or the diagonal of the latter as a
+    1-dim array. With num_threads > 1, large tensors are split along the
+    axes the gate does not act on and the parts are updated in parallel.
+    """
+    # slicing the control axes at the control values leaves a view on the
+    # amplitudes the gate acts on.
+    sub_tensor, target_axis = _slice_axes(
+        state_tensor, control_axis, control_value, target_axis)
+
+    # each of 2**num_split_axis parts is an independent view, so that
+    # they are updated without locks. NumPy releases the GIL in the
+    # kernels.
+    free_axis = [axis for axis in range(sub_tensor.ndim)
+                 if axis not in target_axis and sub_tensor.shape[axis] == 2]
+    num_split_axis = min(
+        (num_threads - 1).bit_length(),
+        (sub_tensor.size // _MIN_AMPLITUDES_PER_THREAD).bit_length() - 1,
+        len(free_axis)
+    )
+    if num_split_axis <= 0:
+        _apply_gate_to_sub_tensor(sub_tensor, gate, target_axis)
+        return
+
+    split_axis = free_axis[:num_split_axis]
+    futures = []
+    for values in itertools.product([0, 1], repeat=num_split_axis):
+        part, part_target_axis = _slice_axes(
+            sub_tensor, split_axis, values, target_axis)
+        futures.append(_get_thread_pool(num_threads).submit(
+            _apply_gate_to_sub_tensor, part, gate, part_target_axis))
+
+    for future in futures:
+        future.result()
+
+
+def _apply_gate_to_sub_tensor(sub_tensor: np.ndarray,
+                              gate: np.ndarray,
+                              target_axis: list) -> None:
+    """Applies gate to the target axes of sub_tensor in place. See
+    _apply_gate_to_state_tensor for gate.
+    """
+    # diagonal gates given as phase vectors are executed as an elementwise
+    # multiply broadcast over the other axes
+    if np.ndim(gate) == 1:
+        num_target = len(target_axis)
+        phase = np.transpose(np.reshape(gate, (2,) * num_target),
+                             np.argsort(target_axis))
+        shape = [1] * sub_tensor.ndim
+        for axis in target_axis:
+            shape[axis] = 2
+        sub_tensor *= phase.reshape(shape)
+        return
+
+    # permutation-type gates are executed as gathers
+    permutation_and_phase = _get_permutation_and_phase(gate)
+    if permutation_and_phase is not None:
+        if len(gate) == 2:
+            for axis in target_axis:
+                _apply_permutation_and_phase_to_sub_tensor(
+                    sub_tensor, *permutation_and_phase, [axis])
+        else:
+            _apply_permutation_and_phase_to_sub_tensor(
+                sub_tensor, *permutation_and_phase, target_axis)
+
+    elif len(gate) == 2:
+        for axis in target_axis:
+            sub_tensor[...] = np.moveaxis(
+                np.tensordot(gate, sub_tensor, axes=([1], [axis])), 0, axis)
+    else:
+        num_target = len(target_axis)
+        gate_tensor = np.reshape(gate, (2,) * (2 * num_target))
+        sub_tensor[...] = np.moveaxis(
+            np.tensordot(gate_tensor, sub_tensor,
+                         axes=(list(range(num_target, 2 * num_target)),
+                               target_axis)),
+            list(range(num_target)), target_axis)
+
+
+def _get_fused_gate(original_qubit_gates: list, qubits: list) -> np.ndarray:
+    """Returns the 2**k x 2**k matrix of original_qubit_gates, a list of
+    (original_qubit_gate, control_qubit, target_qubit, control_value)
+    acting on the k qubits, the first of which is the most significant.
+    """
+    num_qubit = len(qubits)
+    axis_of_qubit = {qubit: axis for axis, qubit in enumerate(qubits)}
+
+    # columns of the identity evolve into those of the fused gate
+    fused_gate = np.eye(2**num_qubit, dtype=np.complex128)
+    fused_gate_tensor = fused_gate.reshape((2,) * num_qubit + (-1,))
+    for gate, control_qubit, target_qubit, control_value \
+            in original_qubit_gates:
+        _apply_gate_to_state_tensor(
+            fused_gate_tensor,
+            gate,
+            [axis_of_qubit[qubit] for qubit in control_qubit],
+            [axis_of_qubit[qubit] for qubit in target_qubit],
+            control_value
+        )
+
+    return fused_gate
+
+
+def _merge_diagonal_gates(original_qubit_gates: list) -> tuple:
+    """Merges runs of at least two adjacent diagonal gates in
+    original_qubit_gates, a list of
+    (original_qubit_gate, control_qubit, target_qubit, control_value),
+    into one phase vector, i.e. a 1-dim gate on all the qubits of the run
+    without control qubits. Returns the list of gates after merging and
+    the number of gates merged.
+    """
+    runs = []
+    for original_qubit_gate in original_qubit_gates:
+        if _is_diagonal(original_qubit_gate[0]) and len(runs) > 0 \
+                and runs[-1][0]:
+            runs[-1][1].append(original_qubit_gate)
+        else:
+            runs.append((_is_diagonal(original_qubit_gate[0]),
+                         [original_qubit_gate]))
+
+    merged_gates = []
+    num_merged_gates = 0
+    for is_diagonal, run_gates in runs:
+        if not is_diagonal or len(run_gates) == 1:
+            merged_gates += run_gates
+            continue
+
+        qubits = []
+        for _, control_qubit, target_qubit, _ in run_gates:
+            qubits += [qubit for qubit in control_qubit + target_qubit
+                       if qubit not in qubits]
+        axis_of_qubit = {qubit: axis for axis, qubit in enumerate(qubits)}
+
+        # diagonal gates multiply the amplitudes, here all 1, by their
+        # diagonal elements.
+        phase = np.ones(2**len(qubits), dtype=np.complex128)
+        phase_tensor = phase.reshape((2,) * len(qubits))
+        for gate, control_qubit, target_qubit, control_value in run_gates:
+            _apply_gate_to_state_tensor(
+                phase_tensor,
+                gate,
+                [axis_of_qubit[qubit] for qubit in control_qubit],
+                [axis_of_qubit[qubit] for qubit in target_qubit],
+                control_value
+            )
+
+        merged_gates.append((phase, [], qubits, []))
+        num_merged_gates += len(run_gates)
+
+    return merged_gates, num_merged_gates
+
+
+def _fuse_original_qubit_gates(original_qubit_gates: list,
+                               max_fused_qubit: int) -> tuple:
+    """Fuses runs of adjacent gates in original_qubit_gates, a list of
+    (original_qubit_gate, control_qubit, target_qubit, control_value),
+    acting on at most max_fused_qubit qubits in total (control qubits
+    included) into one gate without control qubits. Phase vectors from
+    _merge_diagonal_gates are left as they are. Returns the list of gates
+    after fusion and the number of gates fused.
+    """
+    blocks = []
+    block_gates, block_qubits = [], []
+    for original_qubit_gate in original_qubit_gates:
+        _, control_qubit, target_qubit, _ = original_qubit_gate
+        new_qubits = [qubit for qubit in control_qubit + target_qubit
+                      if qubit not in block_qubits]
+        if np.ndim(original_qubit_gate[0]) == 1:
+            blocks.append((block_gates, block_qubits))
+            blocks.append(([original_qubit_gate], new_qubits))
+            block_gates, block_qubits = [], []
+            continue
+        if len(block_qubits) + len(new_qubits) > max_fused_qubit:
+            blocks.append((block_gates, block_qubits))
+            block_gates, block_qubits = [], []
+            new_qubits = control_qubit + target_qubit
+        block_gates.append(original_qubit_gate)
+        block_qubits = block_qubits + new_qubits
+    blocks.append((block_gates, block_qubits))
+
+    fused_gates = []
+    num_fused_gates = 0
+    for block_gates, block_qubits in blocks:
+        if len(block_gates) == 1:
+            fused_gates.append(block_gates[0])
+        elif len(block_gates) > 1:
+            fused_gates.append((_get_fused_gate(block_gates, block_qubits),
+                                [], block_qubits, []))
+            num_fused_gates += len(block_gates)
+
+    return fused_gates, num_fused_gates
+
+
 # gates lists
 _IMPLEMENTED_GATES_WITHOUT_PARAM = ["id", "x", "y", "z", "h", "s", "sdg",
                                     "t", "tdg", "swap", "iswap", "sx", "sxdg"]
@@ -71,6 +489,12 @@ _IMPLEMENTED_GATES_WITH_PARAM = _IMPLEMENTED_GATES_WITH_ONE_PARAM \
     + _IMPLEMENTED_GATES_WITH_TWO_PARAM + _IMPLEMENTED_GATES_WITH_FOUR_PARAM
 _IMPLEMENTED_GATES = _IMPLEMENTED_GATES_WITHOUT_PARAM \
     + _IMPLEMENTED_GATES_WITH_PARAM
+# gate name -> number of parameters
+_NUM_PARAM_OF_GATE = dict(
+    [(name, 0) for name in _IMPLEMENTED_GATES_WITHOUT_PARAM]
+    + [(name, 1) for name in _IMPLEMENTED_GATES_WITH_ONE_PARAM]
+    + [(name, 2) for name in _IMPLEMENTED_GATES_WITH_TWO_PARAM]
+    + [(name, 4) for name in _IMPLEMENTED_GATES_WITH_FOUR_PARAM])
 
 
 class StateVectorCircuit(QuantestPyCircuit):
@@ -84,6 +508,115 @@ class StateVectorCircuit(QuantestPyCircuit):
         self._from_right_to_left_for_qubit_ids = False
         self._binary_to_vector = None
         self._initial_state_vector = None
+        self._max_fused_qubit = _DEFAULT_MAX_FUSED_QUBIT
+        self._fused_gates = None
+        self._num_fused_gates = 0
+        self._num_merged_diagonal_gates = 0
+        self._num_threads = _get_default_num_threads()
+        self._dtype = np.dtype(np.complex128)
+        self._operator_memmap_dir = _get_default_operator_memmap_dir()
+        self._operator_tile_size = _get_default_operator_tile_size()
+
+    def _get_invalid_gates(self, gates: list) -> np.ndarray:
+        """Override"""
+        is_invalid = super()._get_invalid_gates(gates)
+        parameters = []
+        for i, gate in enumerate(gates):
+            if is_invalid[i]:
+                continue
+            name, parameter = gate["name"], gate.get("parameter")
+            if type(name) is not str or type(parameter) is not list \
+                    or _NUM_PARAM_OF_GATE.get(name) != len(parameter):
+                is_invalid[i] = True
+            else:
+                parameters += parameter
+
+        # a parameter of a wrong type is searched for only if there is one
+        if not all(issubclass(t, (float, int))
+                   for t in set(map(type, parameters))):
+            for i, gate in enumerate(gates):
+                if not is_invalid[i] and not all(
+                        isinstance(param, (float, int))
+                        for param in gate["parameter"]):
+                    is_invalid[i] = True
+        return is_invalid
+
+    def add_gate(self, gate: dict) -> None:
+        """Override"""
+        super().add_gate(gate)
+        self._fused_gates = None
+
+    def add_gates(self, gates, validate: bool = True) -> None:
+        """Override"""
+        super().add_gates(gates, validate)
+        self._fused_gates = None
+
+    def _copy(self, copy_gates: bool = False) -> "StateVectorCircuit":
+        """Override"""
+        circuit = super()._copy(copy_gates)
+        # the fused gates are replaced rather than modified when a gate or
+        # a setting changes, so that the copies share them
+        circuit._fused_gates = self._fused_gates
+        return circuit
+
+    def set_max_fused_qubit(self, max_fused_qubit: int) -> None:
+        """Sets the maximum number of qubits adjacent gates are fused on
+        before simulation. 0 disables the fusion.
+        """
+        if not isinstance(max_fused_qubit, int) \
+                or not 0 <= max_fused_qubit <= _MAX_FUSED_QUBIT_LIMIT:
+            raise StateVectorCircuitError(
+                "max_fused_qubit must be an integer from 0 to "
+                f"{_MAX_FUSED_QUBIT_LIMIT}."
+            )
+        self._max_fused_qubit = max_fused_qubit
+        self._fused_gates = None
+
+    def set_num_threads(self, num_threads: int) -> None:
+        """Sets the number of threads gates are applied to a state vector
+        with. The default is given by the environment variable
+        QUANTESTPY_NUM_THREADS, or 1 if it is not set.
+        """
+        if not isinstance(num_threads, int) or num_threads < 1:
+            raise StateVectorCircuitError(
+                "num_threads must be a positive integer."
+            )
+        self._num_threads = num_threads
+
+    def set_dtype(self, dtype) -> None:
+        """Sets the precision of the simulation, either numpy.complex64 or
+        numpy.complex128 (default). All the gates, state vectors and
+        operators are kept in this precision.
+        """
+        if not _is_supported_dtype(dtype):
+            raise StateVectorCircuitError(
+                "dtype must be complex64 or complex128."
+            )
+        self._dtype = np.dtype(dtype)
+        self._fused_gates = None
+
+    def set_operator_memmap(self, directory: Union[str, None],
+                            tile_size: int = _DEFAULT_OPERATOR_TILE_SIZE) \
+            -> None:
+        """Backs the operator of the circuit by numpy.memmap on a temporary
+        file in directory, computing it tile_size columns at a time so that
+        the memory is bounded by a few times 2**num_qubit x tile_size
+        amplitudes. None keeps the operator in memory. The defaults are
+        given by the environment variables QUANTESTPY_OPERATOR_MEMMAP_DIR
+        and QUANTESTPY_OPERATOR_TILE_SIZE.
+        """
+        if directory is not None and not os.path.isdir(directory):
+            raise StateVectorCircuitError(
+                "directory must be an existing directory or None."
+            )
+
+        if not isinstance(tile_size, int) or tile_size < 1:
+            raise StateVectorCircuitError(
+                "tile_size must be a positive integer."
+            )
+
+        self._operator_memmap_dir = directory
+        self._operator_tile_size = tile_size
 
     def _diagnostic_gate(self, gate: dict) -> None:
         """Override"""
@@ -136,49 +669,106 @@ class StateVectorCircuit(QuantestPyCircuit):
                         'float or integer type.'
                     )
 
+    def _get_bit_of_qubit(self, index: np.ndarray, qubit: int) -> np.ndarray:
+        """Returns the bit of the qubit in each computational basis index."""
+        shift = self._num_qubit - 1 - self._get_axis_of_qubit(qubit)
+        return (index >> shift) & 1
+
+    def _get_nonzero_elements_of_all_qubit_gate(
+            self,
+            gate: np.ndarray,
+            control_qubit: list,
+            target_qubit: list,
+            control_value: list) -> tuple:
+        """Returns (row, col, data) of the non-zero elements of the
+        all-qubit gate, computed from the basis indices rather than from
+        Kronecker products.
+        """
+        col = np.arange(2**self._num_qubit)
+
+        # columns whose control qubits match control_value
+        is_controlled = np.ones(len(col), dtype=bool)
+        for qubit, value in zip(control_qubit, control_value):
+            is_controlled &= self._get_bit_of_qubit(col, qubit) == value
+        col_ctrl = col[is_controlled]
+        col_id = col[~is_controlled]
+
+        if gate.ndim == 1:
+            # diagonal gate: the target bits of a column select the
+            # element of the phase vector.
+            num_target = len(target_qubit)
+            bit_in = np.zeros(len(col_ctrl), dtype=col_ctrl.dtype)
+            for i, qubit in enumerate(target_qubit):
+                bit_in |= self._get_bit_of_qubit(col_ctrl, qubit) \
+                    << (num_target - 1 - i)
+            row_ctrl = col_ctrl[np.newaxis, :]
+            data_ctrl = gate[bit_in][np.newaxis, :]
+        elif len(gate) == 2:
+            # apply gate on each target qubit: every existing term branches
+            # into the two values of the target bit.
+            row_ctrl = col_ctrl[np.newaxis, :]
+            data_ctrl = np.ones((1, len(col_ctrl)), dtype=gate.dtype)
+            for qubit in target_qubit:
+                shift = self._num_qubit - 1 - self._get_axis_of_qubit(qubit)
+                bit_in = (row_ctrl >> shift) & 1
+                row_cleared = row_ctrl & ~(1 << shift)
+                row_ctrl = np.concatenate(
+                    [row_cleared, row_cleared | (1 << shift)])
+                data_ctrl = np.concatenate(
+                    [data_ctrl * gate[0][bit_in],
+                     data_ctrl * gate[1][bit_in]])
+        else:
+            # apply gate on all the target qubits jointly: the target bits
+            # of a column select the column of gate, and each row of gate
+            # gives a term with the target bits set to the row.
+            num_target = len(target_qubit)
+            bit_in = np.zeros(len(col_ctrl), dtype=col_ctrl.dtype)
+            col_cleared = col_ctrl.copy()
+            bit_out = np.arange(2**num_target)
+            row_offset = np.zeros(2**num_target, dtype=col_ctrl.dtype)
+            for i, qubit in enumerate(target_qubit):
+                shift = self._num_qubit - 1 - self._get_axis_of_qubit(qubit)
+                bit_in |= ((col_ctrl >> shift) & 1) << (num_target - 1 - i)
+                col_cleared &= ~(1 << shift)
+                row_offset |= ((bit_out >> (num_target - 1 - i)) & 1) \
+                    << shift
+            row_ctrl = col_cleared[np.newaxis, :] | row_offset[:, np.newaxis]
+            data_ctrl = gate[:, bit_in]
+
+        col_ctrl = np.broadcast_to(col_ctrl, row_ctrl.shape).ravel()
+        row_ctrl = row_ctrl.ravel()
+        data_ctrl = data_ctrl.ravel()
+        is_nonzero = data_ctrl != 0
+
+        row = np.concatenate([row_ctrl[is_nonzero], col_id])
+        col = np.concatenate([col_ctrl[is_nonzero], col_id])
+        data = np.concatenate(
+            [data_ctrl[is_nonzero], np.ones(len(col_id), dtype=gate.dtype)])
+
+        return row, col, data
+
     def _create_all_qubit_gate_from_original_qubit_gate(
             self,
             gate: np.ndarray,
             control_qubit: list,
             target_qubit: list,
-            control_value: list) -> np.ndarray:
-
-        all_qubit_gate = np.zeros((2**self._num_qubit, 2**self._num_qubit))
-        bit_patterns_for_control_qubit = list(
-            itertools.product([0, 1], repeat=len(control_qubit)))
-        for bit_pattern in bit_patterns_for_control_qubit:
-            term = 1
-            for i in range(self._num_qubit):
-                if i in control_qubit:
-                    if bit_pattern[control_qubit.index(i)] == 0:
-                        # |0><0|
-                        if self._from_right_to_left_for_qubit_ids:
-                            term = np.kron(np.array([[1, 0], [0, 0]]), term)
-                        else:
-                            term = np.kron(term, np.array([[1, 0], [0, 0]]))
-                    else:
-                        # |1><1|
-                        if self._from_right_to_left_for_qubit_ids:
-                            term = np.kron(np.array([[0, 0], [0, 1]]), term)
-                        else:
-                            term = np.kron(term, np.array([[0, 0], [0, 1]]))
-                elif i in target_qubit:
-                    if list(bit_pattern) == control_value:
-                        if self._from_right_to_left_for_qubit_ids:
-                            term = np.kron(gate, term)
-                        else:
-                            term = np.kron(term, gate)
-                    else:
-                        if self._from_right_to_left_for_qubit_ids:
-                            term = np.kron(_ID, term)
-                        else:
-                            term = np.kron(term, _ID)
-                else:
-                    if self._from_right_to_left_for_qubit_ids:
-                        term = np.kron(_ID, term)
-                    else:
-                        term = np.kron(term, _ID)
-            all_qubit_gate = all_qubit_gate + term
+            control_value: list,
+            sparse: bool = False) -> np.ndarray:
+        """Returns the 2**num_qubit x 2**num_qubit operator of gate.
+        If sparse is True, the operator is returned as
+        scipy.sparse.csr_matrix.
+        """
+        gate = np.asarray(gate)
+        row, col, data = self._get_nonzero_elements_of_all_qubit_gate(
+            gate, control_qubit, target_qubit, control_value)
+
+        dim = 2**self._num_qubit
+        if sparse:
+            return _create_sparse_matrix(data, row, col, dim)
+
+        all_qubit_gate = np.zeros(
+            (dim, dim), dtype=np.result_type(gate.dtype, np.float32))
+        all_qubit_gate[row, col] = data
 
         return all_qubit_gate
 
@@ -198,6 +788,111 @@ class StateVectorCircuit(QuantestPyCircuit):
 
         self._initial_state_vector = initial_state_vector
 
+    def _get_axis_of_qubit(self, qubit: int) -> int:
+        """Returns the axis of the state tensor, i.e. the state vector
+        reshaped to (2, 2, ..., 2), which corresponds to the qubit.
+        """
+        if self._from_right_to_left_for_qubit_ids:
+            return self._num_qubit - 1 - qubit
+        else:
+            return qubit
+
+    def _get_original_qubit_gates(self, gate: dict) -> list:
+        """Decomposes gate into a list of
+        (original_qubit_gate, control_qubit, target_qubit, control_value)
+        to be applied in order. original_qubit_gate is either a 2x2
+        matrix applied to each target qubit or, for swap and iswap, a
+        4x4 matrix applied to both target qubits jointly.
+        """
+        if gate["name"] in ("swap", "iswap"):
+            return [(_SWAP if gate["name"] == "swap" else _ISWAP,
+                     gate["control_qubit"],
+                     gate["target_qubit"],
+                     gate["control_value"])]
+
+        if gate["name"] in _GATE_NAME_TO_MATRIX \
+                or gate["name"] in _GATE_NAME_TO_MATRIX_FUNCTION:
+            original_qubit_gate = _get_gate_matrix(gate["name"],
+                                                   gate["parameter"])
+        else:
+            raise StateVectorCircuitError(
+                "Unexpected error. Please report."
+            )
+
+        return [(original_qubit_gate,
+                 gate["control_qubit"],
+                 gate["target_qubit"],
+                 gate["control_value"])]
+
+    def _apply_original_qubit_gate_to_state_vector(
+            self,
+            state_vec: np.ndarray,
+            gate: np.ndarray,
+            control_qubit: list,
+            target_qubit: list,
+            control_value: list) -> None:
+        """Applies gate to state_vec in place without building the
+        2**num_qubit x 2**num_qubit operator. state_vec must be a
+        C-contiguous complex array of shape (2**num_qubit,) or
+        (2**num_qubit, k), in which case the k columns are updated at once.
+        """
+        state_tensor = state_vec.reshape(
+            (2,) * self._num_qubit + state_vec.shape[1:])
+
+        _apply_gate_to_state_tensor(
+            state_tensor,
+            gate,
+            [self._get_axis_of_qubit(qubit) for qubit in control_qubit],
+            [self._get_axis_of_qubit(qubit) for qubit in target_qubit],
+            control_value,
+            self._num_threads
+        )
+
+    def _get_fused_gates(self,) -> list:
+        """Returns all gates of the circuit as a list of
+        (original_qubit_gate, control_qubit, target_qubit, control_value)
+        to be applied in order, where runs of adjacent gates acting on at
+        most _max_fused_qubit qubits are fused into one 2**k x 2**k gate
+        and runs of adjacent diagonal gates are merged into one phase
+        vector. The numbers of gates fused and merged are kept in
+        _num_fused_gates and _num_merged_diagonal_gates for profiling.
+        The gates are cast to the precision of the simulation, and the list
+        is cached until a gate is added.
+        """
+        if self._fused_gates is None:
+            original_qubit_gates = []
+            for gate in self._gates:
+                original_qubit_gates += self._get_original_qubit_gates(gate)
+            original_qubit_gates, self._num_merged_diagonal_gates = \
+                _merge_diagonal_gates(original_qubit_gates)
+            fused_gates, self._num_fused_gates = \
+                _fuse_original_qubit_gates(original_qubit_gates,
+                                           self._max_fused_qubit)
+            self._fused_gates = [
+                (np.asarray(gate, dtype=self._dtype), control_qubit,
+                 target_qubit, control_value)
+                for gate, control_qubit, target_qubit, control_value
+                in fused_gates
+            ]
+
+        return self._fused_gates
+
+    def _apply_all_gates_to_state_vector(self, state_vec: np.ndarray) \
+            -> None:
+        """Applies all gates of the circuit to state_vec in place. See
+        _apply_original_qubit_gate_to_state_vector for the shape of
+        state_vec.
+        """
+        for original_qubit_gate, control_qubit, target_qubit, \
+                control_value in self._get_fused_gates():
+            self._apply_original_qubit_gate_to_state_vector(
+                state_vec,
+                original_qubit_gate,
+                control_qubit,
+                target_qubit,
+                control_value
+            )
+
     def _get_state_vector(self,) -> np.ndarray:
 
         # initialize state vector if not given
@@ -206,110 +901,103 @@ class StateVectorCircuit(QuantestPyCircuit):
             state_vec += [0 for _ in range(2**self._num_qubit-2)]
             self._initial_state_vector = np.array(state_vec)
 
-        whole_gates = self._get_whole_gates()
-        state_vec = np.matmul(whole_gates, self._initial_state_vector)
+        # apply each gate to state vector
+        state_vec = np.array(self._initial_state_vector, dtype=self._dtype)
+        self._apply_all_gates_to_state_vector(state_vec)
 
         return state_vec
 
-    def _get_whole_gates(self,) -> np.ndarray:
+    def _get_whole_gates(self, sparse: bool = False) -> np.ndarray:
+        """Returns the operator of the circuit. If sparse is True, the
+        operator is kept as scipy.sparse.csr_matrix throughout and returned
+        as it is, so call toarray() on it only for the final comparison.
+        """
+
+        if not sparse and self._operator_memmap_dir is not None:
+            return self._get_whole_gates_by_tiles()
 
         # initialize circuit operator
-        whole_gates = np.eye(2**self._num_qubit)
+        dim = 2**self._num_qubit
+        if sparse:
+            whole_gates = _create_sparse_matrix(
+                np.ones(dim, dtype=self._dtype), np.arange(dim),
+                np.arange(dim), dim)
+        else:
+            whole_gates = np.eye(dim, dtype=self._dtype)
 
-        # apply each gate to state vector
-        for gate in self._gates:
-            if gate["name"] == "swap":
-                all_qubit_gate1 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _X,
-                        gate["target_qubit"][1:],
-                        gate["target_qubit"][:1],
-                        [1]
-                    )
-                all_qubit_gate2 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _X,
-                        gate["control_qubit"] + gate["target_qubit"][:1],
-                        gate["target_qubit"][1:],
-                        gate["control_value"] + [1]
-                    )
-                whole_gates = np.matmul(all_qubit_gate1, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate2, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate1, whole_gates)
-            elif gate["name"] == "iswap":
-                all_qubit_gate1 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _S,
-                        gate["control_qubit"],
-                        gate["target_qubit"][:1],
-                        gate["control_value"]
-                    )
-                all_qubit_gate2 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _S,
-                        gate["control_qubit"],
-                        gate["target_qubit"][1:],
-                        gate["control_value"]
-                    )
-                all_qubit_gate3 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _H,
-                        gate["control_qubit"],
-                        gate["target_qubit"][:1],
-                        gate["control_value"]
-                    )
-                all_qubit_gate4 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _X,
-                        gate["control_qubit"] + gate["target_qubit"][:1],
-                        gate["target_qubit"][1:],
-                        gate["control_value"] + [1]
-                    )
-                all_qubit_gate5 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _X,
-                        gate["control_qubit"] + gate["target_qubit"][1:],
-                        gate["target_qubit"][:1],
-                        gate["control_value"] + [1]
-                    )
-                all_qubit_gate6 = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
-                        _H,
-                        gate["control_qubit"],
-                        gate["target_qubit"][1:],
-                        gate["control_value"]
-                    )
-                whole_gates = np.matmul(all_qubit_gate1, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate2, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate3, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate4, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate5, whole_gates)
-                whole_gates = np.matmul(all_qubit_gate6, whole_gates)
-            else:
-                if gate["name"] in ("id", "x", "y", "z", "h", "s", "t", "sx"):
-                    original_qubit_gate = eval("_" + gate["name"].upper())
-                elif gate["name"] in ("sdg", "tdg", "sxdg"):
-                    original_qubit_gate = \
-                        eval("_" + gate["name"][:-2].upper() + "dg")
-                elif gate["name"] in (
-                        "rx", "ry", "rz", "r", "u", "p", "scalar"):
-                    original_qubit_gate = eval("_" + gate["name"]
-                                               + '(gate["parameter"])')
-                else:
-                    raise StateVectorCircuitError(
-                        "Unexpected error. Please report."
-                    )
-                all_qubit_gate = \
-                    self._create_all_qubit_gate_from_original_qubit_gate(
+        # apply each gate to circuit operator
+        for original_qubit_gate, control_qubit, target_qubit, \
+                control_value in self._get_fused_gates():
+
+            # the all-qubit gate of a diagonal gate is a phase vector
+            # multiplying the rows.
+            if not sparse and _is_diagonal(original_qubit_gate):
+                phase = np.ones(dim, dtype=self._dtype)
+                self._apply_original_qubit_gate_to_state_vector(
+                    phase,
+                    original_qubit_gate,
+                    control_qubit,
+                    target_qubit,
+                    control_value
+                )
+                whole_gates = phase[:, np.newaxis] * whole_gates
+                continue
+
+            # the all-qubit gate of a permutation-type gate has one
+            # non-zero element per row, so that the product is a gather
+            # of rows.
+            if not sparse and _get_permutation_and_phase(
+                    original_qubit_gate) is not None:
+                row, col, data = \
+                    self._get_nonzero_elements_of_all_qubit_gate(
                         original_qubit_gate,
-                        gate["control_qubit"],
-                        gate["target_qubit"],
-                        gate["control_value"]
+                        control_qubit,
+                        target_qubit,
+                        control_value
                     )
-                whole_gates = np.matmul(all_qubit_gate, whole_gates)
+                source_row = np.empty(dim, dtype=col.dtype)
+                source_row[row] = col
+                phase = np.empty(dim, dtype=data.dtype)
+                phase[row] = data
+                whole_gates = phase[:, np.newaxis] * whole_gates[source_row]
+                continue
+
+            all_qubit_gate = \
+                self._create_all_qubit_gate_from_original_qubit_gate(
+                    original_qubit_gate,
+                    control_qubit,
+                    target_qubit,
+                    control_value,
+                    sparse
+                )
+            whole_gates = all_qubit_gate @ whole_gates
 
         return whole_gates
 
+    def _get_whole_gates_by_tiles(self,) -> np.memmap:
+        """Returns the operator of the circuit as numpy.memmap in column
+        major order, whose columns are computed _operator_tile_size at a
+        time by applying the gates to the basis vectors. The file is
+        removed when the operator is garbage-collected.
+        """
+        dim = 2**self._num_qubit
+        with tempfile.TemporaryFile(dir=self._operator_memmap_dir) as f:
+            whole_gates = np.memmap(f, dtype=self._dtype, mode="w+",
+                                    shape=(dim, dim), order="F")
+
+        for col_start in range(0, dim, self._operator_tile_size):
+            col_end = min(col_start + self._operator_tile_size, dim)
+
+            # basis vectors for the columns col_start, ..., col_end-1
+            cols = np.zeros((dim, col_end - col_start), dtype=self._dtype)
+            cols[np.arange(col_start, col_end),
+                 np.arange(col_end - col_start)] = 1.
+            self._apply_all_gates_to_state_vector(cols)
+            whole_gates[:, col_start:col_end] = cols
+
+        whole_gates.flush()
+        return whole_gates
+
     def draw(self,):
         from quantestpy.visualization.state_vector_circuit_drawer import \
             draw_circuit
@@ -317,6 +1005,11 @@ class StateVectorCircuit(QuantestPyCircuit):
         return draw_circuit(self)
 
 
+# StateVectorCircuits converted from QuantestPyCircuits, keyed on the
+# fingerprint of the QuantestPyCircuit
+_STATE_VECTOR_CIRCUIT_CACHE = _ConversionCache()
+
+
 def cvt_quantestpy_circuit_to_state_vector_circuit(
         qc: QuantestPyCircuit) -> StateVectorCircuit:
     """Converts an instance of QuantestPyCircuit to that of StateVectorCircuit.
@@ -326,10 +1019,39 @@ def cvt_quantestpy_circuit_to_state_vector_circuit(
             "Input circuit must be an instance of QuantestPyCircuit."
         )
 
-    svc = StateVectorCircuit(num_qubit=qc.num_qubit)
-    for gate in qc.gates:
-        svc.add_gate(gate)
+    def set_settings(svc: StateVectorCircuit) -> None:
+        # The circuit is simulated as set for the input circuit, or else as
+        # given by the current environment variables, not as when the
+        # cached circuit was converted.
+        if isinstance(qc, StateVectorCircuit):
+            dtype, max_fused_qubit = qc._dtype, qc._max_fused_qubit
+            svc._num_threads = qc._num_threads
+            svc._operator_memmap_dir = qc._operator_memmap_dir
+            svc._operator_tile_size = qc._operator_tile_size
+        else:
+            dtype = np.dtype(np.complex128)
+            max_fused_qubit = _DEFAULT_MAX_FUSED_QUBIT
+            svc._num_threads = _get_default_num_threads()
+            svc._operator_memmap_dir = _get_default_operator_memmap_dir()
+            svc._operator_tile_size = _get_default_operator_tile_size()
+
+        # the fused gates are kept unless they depend on a changed setting
+        if svc._dtype != dtype:
+            svc.set_dtype(dtype)
+        if svc._max_fused_qubit != max_fused_qubit:
+            svc.set_max_fused_qubit(max_fused_qubit)
+
+    def convert() -> StateVectorCircuit:
+        svc = StateVectorCircuit(num_qubit=qc.num_qubit)
+        svc.set_gate_storage(qc.gate_storage)
+        svc.add_gates(qc.gates)
+        set_settings(svc)
+        # fuse once for all the copies returned from the cache
+        svc._get_fused_gates()
+        return svc
 
+    svc = _STATE_VECTOR_CIRCUIT_CACHE.get(qc._get_fingerprint(), convert)
+    set_settings(svc)
     return svc
 
 
@@ -6,7 +6,8 @@ REFERENCE : Figure 1 in C. Gidney, arXiv:1709.06648
 
 
 from quantestpy import (QuantestPyCircuit,
-                        assert_circuit_equivalent_to_output_qubit_state)
+                        assert_circuit_equivalent_to_output_qubit_state,
+                        assert_circuit_equivalent_to_truth_table)
 
 """Define a function testing the circuit"""
 
@@ -14,6 +15,8 @@ from quantestpy import (QuantestPyCircuit,
 def test_5_bit_adder(circuit):
     """a + b = c"""
 
+    # all the inputs are checked in one execution of the circuit
+    input_to_output = dict()
     for decimal_a in range(2**5):
         for decimal_b in range(2**5):
             decimal_c = decimal_a + decimal_b
@@ -23,16 +26,28 @@ def test_5_bit_adder(circuit):
             bitstring_b = ("0" * 5 + bin(decimal_b)[2:])[-5:]
             bitstring_c = ("0" * 5 + bin(decimal_c)[2:])[-5:]
 
-            assert_circuit_equivalent_to_output_qubit_state(
-                circuit=circuit,
-                # input_reg = reg. for a + reg. for b
-                input_reg=[12, 9, 6, 3, 0, 13, 10, 7, 4, 1],
-                output_reg=[13, 10, 7, 4, 1],  # output_reg = reg. for c
-                input_to_output={
-                    bitstring_a + bitstring_b: bitstring_c
-                },  # input (= a + b) : output (= c)
-                draw_circuit=True
-            )
+            # input (= a + b) : output (= c)
+            input_to_output[bitstring_a + bitstring_b] = bitstring_c
+
+    assert_circuit_equivalent_to_output_qubit_state(
+        circuit=circuit,
+        # input_reg = reg. for a + reg. for b
+        input_reg=[12, 9, 6, 3, 0, 13, 10, 7, 4, 1],
+        output_reg=[13, 10, 7, 4, 1],  # output_reg = reg. for c
+        input_to_output=input_to_output,
+        draw_circuit=True
+    )
+
+
+def test_5_bit_adder_by_truth_table(circuit):
+    """b = a + b (mod 32) for all the 2^10 inputs"""
+
+    assert_circuit_equivalent_to_truth_table(
+        circuit=circuit,
+        input_reg={"a": [12, 9, 6, 3, 0], "b": [13, 10, 7, 4, 1]},
+        output_reg=[13, 10, 7, 4, 1],
+        expected=lambda a, b: a + b
+    )
 
 
 """Construct the circuit"""
@@ -94,6 +109,7 @@ qc.add_gate({"name": "x", "control_qubit": [12], "target_qubit": [13],
 Get none and confirm that the circuit is constructed as expected.
 """
 test_5_bit_adder(circuit=qc)
+test_5_bit_adder_by_truth_table(circuit=qc)
 
 """(Option)
 Make a mistake in the circuit intentionally and see how the assert method
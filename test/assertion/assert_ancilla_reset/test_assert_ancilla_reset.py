@@ -1,8 +1,10 @@
 import traceback
 import unittest
 
+import numpy as np
+
 from quantestpy import QuantestPyCircuit, assert_ancilla_reset
-from quantestpy.exceptions import QuantestPyAssertionError
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
 
 
 class TestAssertAncillaReset(unittest.TestCase):
@@ -12,9 +14,9 @@ class TestAssertAncillaReset(unittest.TestCase):
     {Your directory where you git-cloned quantestpy}/quantestpy
     $ python -m unittest \
         test.assertion.assert_ancilla_reset.test_assert_ancilla_reset
-    ..
+    ......
     ----------------------------------------------------------------------
-    Ran 2 tests in 0.135s
+    Ran 6 tests in 0.135s
 
     OK
     """
@@ -99,3 +101,138 @@ class TestAssertAncillaReset(unittest.TestCase):
             actual_error_msg = traceback.format_exception_only(type(e), e)[0]
 
             self.assertEqual(expected_error_msg, actual_error_msg)
+
+    def test_superposition(self,):
+        qc = QuantestPyCircuit(4)
+        # V
+        qc.add_gate(
+            {"name": "h", "control_qubit": [], "target_qubit": [0],
+             "control_value": [], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "control_qubit": [0], "target_qubit": [1],
+             "control_value": [1], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "control_qubit": [1, 3], "target_qubit": [2],
+             "control_value": [1, 0], "parameter": []}
+        )
+
+        # uncomputation
+        qc.add_gate(
+            {"name": "rz", "control_qubit": [2], "target_qubit": [3],
+             "control_value": [1], "parameter": [0.5]}
+        )
+
+        # V^{-1}
+        qc.add_gate(
+            {"name": "x", "control_qubit": [1, 3], "target_qubit": [2],
+             "control_value": [1, 0], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "control_qubit": [0], "target_qubit": [1],
+             "control_value": [1], "parameter": []}
+        )
+
+        for method in ["exhaustive", "superposition"]:
+            self.assertIsNone(
+                assert_ancilla_reset(
+                    circuit=qc,
+                    ancilla_qubits=[1, 2],
+                    method=method
+                )
+            )
+
+        # ancilla qubits left flipped
+        qc.add_gate(
+            {"name": "x", "control_qubit": [0], "target_qubit": [1],
+             "control_value": [1], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "control_qubit": [3], "target_qubit": [2],
+             "control_value": [0], "parameter": []}
+        )
+
+        expected_error_msg = "qubit(s) [1, 2] are either non-zero or " \
+            + "entangled with other qubits."
+
+        for method in ["exhaustive", "superposition"]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_ancilla_reset(
+                    circuit=qc,
+                    ancilla_qubits=[2, 1],
+                    method=method
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_superposition_with_leak_near_atol(self,):
+        expected_error_msg = "qubit(s) [2] are either non-zero or " \
+            + "entangled with other qubits."
+
+        # each basis state leaks into its own output: the amplitudes are
+        # compared with atol on the same scale by both methods
+        for leak, is_reset in [(1.5e-8, False), (0.5e-8, True)]:
+            qc = QuantestPyCircuit(3)
+            qc.add_gate(
+                {"name": "ry", "control_qubit": [0], "target_qubit": [2],
+                 "control_value": [1], "parameter": [2 * np.arcsin(leak)]}
+            )
+
+            for method in ["exhaustive", "superposition"]:
+                if is_reset:
+                    self.assertIsNone(
+                        assert_ancilla_reset(qc, [2], method=method))
+                    continue
+                with self.assertRaises(QuantestPyAssertionError) as cm:
+                    assert_ancilla_reset(qc, [2], method=method)
+                self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+        # the leaks of the four basis states spread over the same outputs,
+        # where they add up in the superposition
+        for leak, is_reset_by_superposition in [(1.5e-8, False),
+                                                (0.4e-8, True)]:
+            qc = QuantestPyCircuit(3)
+            qc.add_gate(
+                {"name": "ry", "control_qubit": [], "target_qubit": [2],
+                 "control_value": [], "parameter": [2 * np.arcsin(leak)]}
+            )
+            qc.add_gate(
+                {"name": "h", "control_qubit": [], "target_qubit": [0, 1],
+                 "control_value": [], "parameter": []}
+            )
+
+            self.assertIsNone(
+                assert_ancilla_reset(qc, [2], method="exhaustive"))
+            if is_reset_by_superposition:
+                self.assertIsNone(
+                    assert_ancilla_reset(qc, [2], method="superposition"))
+                continue
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_ancilla_reset(qc, [2], method="superposition")
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_invalid_method(self,):
+        qc = QuantestPyCircuit(2)
+
+        expected_error_msg = \
+            "method must be one of ['exhaustive', 'superposition']."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_ancilla_reset(
+                circuit=qc,
+                ancilla_qubits=[1],
+                method="random"
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_out_of_range_qubit(self,):
+        qc = QuantestPyCircuit(2)
+
+        expected_error_msg = "qubit 2 is out of range for the given circuit."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_ancilla_reset(
+                circuit=qc,
+                ancilla_qubits=[2]
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
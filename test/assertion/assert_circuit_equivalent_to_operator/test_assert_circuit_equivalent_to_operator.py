@@ -13,9 +13,9 @@ class TestAssertCircuitEquivalentToOperator(unittest.TestCase):
     {Your directory where you git-cloned quantestpy}/quantestpy
     $ python -m unittest \
         test.assertion.assert_circuit_equivalent_to_operator.test_assert_circuit_equivalent_to_operator
-    ....
+    .....
     ----------------------------------------------------------------------
-    Ran 4 tests in 0.003s
+    Ran 5 tests in 0.003s
 
     OK
     $
@@ -97,3 +97,26 @@ class TestAssertCircuitEquivalentToOperator(unittest.TestCase):
                 operator_=expected_operator,
                 circuit=self.qc
             )
+
+    def test_assert_equal_to_operator_in_complex64(self,):
+
+        expected_operator = np.array(
+            [[1, 0, 1, 0],
+             [0, 1, 0, 1],
+             [0, 1, 0, -1],
+             [1, 0, -1, 0]]
+        )/np.sqrt(2.) + 1e-6
+
+        self.assertIsNone(
+            assert_circuit_equivalent_to_operator(
+                operator_=expected_operator,
+                circuit=self.qc,
+                dtype=np.complex64
+            )
+        )
+
+        with self.assertRaises(QuantestPyAssertionError):
+            assert_circuit_equivalent_to_operator(
+                operator_=expected_operator,
+                circuit=self.qc
+            )
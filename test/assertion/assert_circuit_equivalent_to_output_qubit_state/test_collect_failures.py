@@ -0,0 +1,106 @@
+import unittest
+
+from quantestpy import (QuantestPyCircuit,
+                        assert_circuit_equivalent_to_output_qubit_state)
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+
+class TestAssertCircuitEquivalentToOutputQubitStateCollectFailures(
+        unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_circuit_equivalent_to_output_qubit_state.test_collect_failures
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # copy of the input qubits 0 and 1 to the qubits 2 and 3 with a z
+        # gate on the qubit 3
+        self.qc = QuantestPyCircuit(4)
+        self.qc.add_gate({"name": "x", "control_qubit": [0],
+                          "target_qubit": [2], "control_value": [1]})
+        self.qc.add_gate({"name": "x", "control_qubit": [1],
+                          "target_qubit": [3], "control_value": [1]})
+        self.qc.add_gate({"name": "z", "control_qubit": [],
+                          "target_qubit": [3], "control_value": []})
+
+    def tearDown(self) -> None:
+        del self.qc
+
+    def test_return_none(self,):
+        self.assertIsNone(
+            assert_circuit_equivalent_to_output_qubit_state(
+                circuit=self.qc,
+                input_reg=[0, 1],
+                output_reg=[2, 3],
+                input_to_output={"00": "00", "11": "11"},
+                collect_failures=True
+            )
+        )
+
+    def test_all_failures_raised(self,):
+        input_to_output = {
+            "00": "00",
+            "01": ("01", [0., 0.]),  # error in phase
+            "10": "11",  # error
+            "11": "00"  # error
+        }
+        expected_error_msg = "3 of 4 inputs failed.\n" \
+            + "In bitstring: 01\n" \
+            + "Out bitstring expect: 01\n" \
+            + "Out bitstring actual: 01\n" \
+            + "Out phase expect: [0.0, 0.0]\n" \
+            + "Out phase actual: [0.0, 1.0]\n" \
+            + "In bitstring: 10\n" \
+            + "Out bitstring expect: 11\n" \
+            + "Out bitstring actual: 10\n" \
+            + "In bitstring: 11\n" \
+            + "Out bitstring expect: 00\n" \
+            + "Out bitstring actual: 11\n" \
+            + "Failures per qubit: qubit 3: 3, qubit 2: 1"
+
+        for n_jobs in [1, 2]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_circuit_equivalent_to_output_qubit_state(
+                    circuit=self.qc,
+                    input_reg=[0, 1],
+                    output_reg=[2, 3],
+                    input_to_output=input_to_output,
+                    n_jobs=n_jobs,
+                    collect_failures=True
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+            self.assertEqual(cm.exception.qubit_to_num_failures,
+                             {3: 3, 2: 1})
+            self.assertEqual(
+                [failure["in_bitstring"]
+                 for failure in cm.exception.failures],
+                ["01", "10", "11"])
+            self.assertEqual(
+                cm.exception.failures[0],
+                {"in_bitstring": "01",
+                 "out_bitstring_expect": "01",
+                 "out_bitstring_actual": "01",
+                 "out_phase_expect": [0., 0.],
+                 "out_phase_actual": [0., 1.],
+                 "error_qubits": [3]})
+
+    def test_raise_from_invalid_collect_failures(self,):
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_circuit_equivalent_to_output_qubit_state(
+                circuit=self.qc,
+                input_reg=[0, 1],
+                output_reg=[2, 3],
+                input_to_output={"00": "00"},
+                collect_failures=1
+            )
+        self.assertEqual(
+            cm.exception.args[0], "collect_failures must be bool type.")
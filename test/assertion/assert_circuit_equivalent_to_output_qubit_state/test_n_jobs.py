@@ -0,0 +1,81 @@
+import unittest
+
+from quantestpy import (QuantestPyCircuit,
+                        assert_circuit_equivalent_to_output_qubit_state)
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+
+class TestAssertCircuitEquivalentToOutputQubitStateNJobs(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_circuit_equivalent_to_output_qubit_state.test_n_jobs
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.200s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # copy of the input qubits 0 and 1 to the qubits 2 and 3 with a z
+        # gate on the qubit 3
+        self.qc = QuantestPyCircuit(4)
+        self.qc.add_gate({"name": "x", "control_qubit": [0],
+                          "target_qubit": [2], "control_value": [1]})
+        self.qc.add_gate({"name": "x", "control_qubit": [1],
+                          "target_qubit": [3], "control_value": [1]})
+        self.qc.add_gate({"name": "z", "control_qubit": [],
+                          "target_qubit": [3], "control_value": []})
+
+    def tearDown(self) -> None:
+        del self.qc
+
+    def test_same_as_sequential(self,):
+        input_to_output = {"00": ("00", [0., 0.]), "01": ("01", [0., 1.]),
+                           "10": "10", "11": ("11", [0., 1.])}
+        for n_jobs in [1, 2, 3]:
+            self.assertIsNone(
+                assert_circuit_equivalent_to_output_qubit_state(
+                    circuit=self.qc,
+                    input_reg=[0, 1],
+                    output_reg=[2, 3],
+                    input_to_output=input_to_output,
+                    n_jobs=n_jobs
+                )
+            )
+
+    def test_first_failure_raised(self,):
+        input_to_output = {"00": "00", "01": "01", "10": ("10", [0., 1.]),
+                           "11": "00"}
+        expected_error_msg = "In bitstring: 10\n" \
+            + "Out bitstring expect: 10\n" \
+            + "Out bitstring actual: 10\n" \
+            + "Out phase expect: [0.0, 1.0]\n" \
+            + "Out phase actual: [0.0, 0.0]"
+        for n_jobs in [1, 2, 4]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_circuit_equivalent_to_output_qubit_state(
+                    circuit=self.qc,
+                    input_reg=[0, 1],
+                    output_reg=[2, 3],
+                    input_to_output=input_to_output,
+                    n_jobs=n_jobs
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_invalid_n_jobs(self,):
+        for n_jobs in [0, 2.]:
+            with self.assertRaises(QuantestPyError) as cm:
+                assert_circuit_equivalent_to_output_qubit_state(
+                    circuit=self.qc,
+                    input_reg=[0, 1],
+                    output_reg=[2, 3],
+                    input_to_output={"00": "00"},
+                    n_jobs=n_jobs
+                )
+            self.assertEqual(
+                cm.exception.args[0], "n_jobs must be a positive integer.")
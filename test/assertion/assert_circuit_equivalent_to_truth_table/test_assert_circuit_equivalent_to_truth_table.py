@@ -0,0 +1,222 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import (QuantestPyCircuit,
+                        assert_circuit_equivalent_to_truth_table)
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+
+class TestAssertCircuitEquivalentToTruthTable(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_circuit_equivalent_to_truth_table.test_assert_circuit_equivalent_to_truth_table
+    ..........
+    ----------------------------------------------------------------------
+    Ran 10 tests in 0.010s
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # b = a + b mod 4 with a = [0, 1] and b = [2, 3]
+        self.qc = QuantestPyCircuit(4)
+        self.qc.add_gate(
+            {"name": "x", "control_qubit": [1, 3], "target_qubit": [2],
+             "control_value": [1, 1]})
+        self.qc.add_gate(
+            {"name": "x", "control_qubit": [1], "target_qubit": [3],
+             "control_value": [1]})
+        self.qc.add_gate(
+            {"name": "x", "control_qubit": [0], "target_qubit": [2],
+             "control_value": [1]})
+
+    def tearDown(self) -> None:
+        del self.qc
+
+    def test_return_none(self,):
+        qc = self.qc
+
+        for vectorized in [True, False]:
+            self.assertIsNone(
+                assert_circuit_equivalent_to_truth_table(
+                    circuit=qc,
+                    input_reg={"a": [0, 1], "b": [2, 3]},
+                    output_reg=[2, 3],
+                    expected=lambda a, b: a + b,
+                    vectorized=vectorized
+                )
+            )
+
+    def test_return_none_for_untouched_register(self,):
+        qc = self.qc
+
+        self.assertIsNone(
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"b": [2, 3], "a": [0, 1]},
+                output_reg=[0, 1],
+                expected=lambda b, a: a
+            )
+        )
+
+    def test_return_none_for_constant(self,):
+        qc = QuantestPyCircuit(3)
+        qc.add_gate({"name": "x", "control_qubit": [], "target_qubit": [2],
+                    "control_value": []})
+
+        self.assertIsNone(
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"a": [0, 1]},
+                output_reg=[2],
+                expected=lambda a: 1
+            )
+        )
+
+    def test_return_assert_error(self,):
+        qc = self.qc
+        # error: the carry is lost
+        qc._gates.pop(0)
+
+        expected_error_msg = "4 of 16 inputs failed.\n" \
+            + "In: a=1, b=1\nOut expect: 2\nOut actual: 0\n" \
+            + "In: a=1, b=3\nOut expect: 0\nOut actual: 2\n" \
+            + "In: a=3, b=1\nOut expect: 0\nOut actual: 2\n" \
+            + "In: a=3, b=3\nOut expect: 2\nOut actual: 0"
+
+        for vectorized in [True, False]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_circuit_equivalent_to_truth_table(
+                    circuit=qc,
+                    input_reg={"a": [0, 1], "b": [2, 3]},
+                    output_reg=[2, 3],
+                    expected=lambda a, b: a + b,
+                    vectorized=vectorized
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    @patch("quantestpy.assertion.assert_circuit_equivalent_to_truth_table."
+           "_INPUT_CHUNK_SIZE", 3)
+    def test_return_assert_error_over_chunks(self,):
+        qc = self.qc
+        # error: the carry is lost
+        qc._gates.pop(0)
+
+        expected_error_msg = "4 of 16 inputs failed.\n" \
+            + "In: a=1, b=1\nOut expect: 2\nOut actual: 0\n" \
+            + "In: a=1, b=3\nOut expect: 0\nOut actual: 2\n" \
+            + "In: a=3, b=1\nOut expect: 0\nOut actual: 2\n" \
+            + "In: a=3, b=3\nOut expect: 2\nOut actual: 0"
+
+        # expected is called for each chunk of inputs
+        num_inputs = []
+
+        def expected(a, b):
+            num_inputs.append(len(a))
+            return a + b
+
+        with self.assertRaises(QuantestPyAssertionError) as cm:
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"a": [0, 1], "b": [2, 3]},
+                output_reg=[2, 3],
+                expected=expected
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+        self.assertEqual(num_inputs, [3, 3, 3, 3, 3, 1])
+
+    @patch("quantestpy.assertion.assert_circuit_equivalent_to_truth_table."
+           "_INPUT_CHUNK_SIZE", 5)
+    def test_return_assert_error_for_all_inputs(self,):
+        qc = self.qc
+
+        expected_error_msg = "16 of 16 inputs failed.\n" \
+            + "In: a=0, b=0\nOut expect: 1\nOut actual: 0\n" \
+            + "In: a=0, b=1\nOut expect: 2\nOut actual: 1\n" \
+            + "In: a=0, b=2\nOut expect: 3\nOut actual: 2\n" \
+            + "... and 13 more failing inputs, see the attribute failures."
+
+        with patch("quantestpy.assertion."
+                   "assert_circuit_equivalent_to_truth_table."
+                   "_MAX_FAILURES_IN_MSG", 3):
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_circuit_equivalent_to_truth_table(
+                    circuit=qc,
+                    input_reg={"a": [0, 1], "b": [2, 3]},
+                    output_reg=[2, 3],
+                    expected=lambda a, b: a + b + 1
+                )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+        # all the failures are attached to the error
+        failures = cm.exception.failures
+        a, b = np.divmod(np.arange(16), 4)
+        self.assertEqual(list(failures["input_reg"].keys()), ["a", "b"])
+        self.assertEqual(failures["input_reg"]["a"].tolist(), a.tolist())
+        self.assertEqual(failures["input_reg"]["b"].tolist(), b.tolist())
+        self.assertEqual(failures["out_expect"].tolist(),
+                         ((a + b + 1) % 4).tolist())
+        self.assertEqual(failures["out_actual"].tolist(),
+                         ((a + b) % 4).tolist())
+
+    def test_raise_from_too_many_input_qubits(self,):
+        qc = QuantestPyCircuit(32)
+
+        expected_error_msg = "input_reg has more than 30 qubits in total."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"a": list(range(16)), "b": list(range(16, 31))},
+                output_reg=[31],
+                expected=lambda a, b: 0
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_overlapping_registers(self,):
+        qc = self.qc
+
+        expected_error_msg = "Registers in input_reg must not share qubits."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"a": [0, 1], "b": [1, 2]},
+                output_reg=[2, 3],
+                expected=lambda a, b: a + b
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_invalid_register_name(self,):
+        qc = self.qc
+
+        expected_error_msg = \
+            "Register names in input_reg must be valid identifiers."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"reg a": [0, 1]},
+                output_reg=[2, 3],
+                expected=lambda a: a
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_invalid_expected_length(self,):
+        qc = self.qc
+
+        expected_error_msg = "expected must return one integer per input."
+
+        with self.assertRaises(QuantestPyError) as cm:
+            assert_circuit_equivalent_to_truth_table(
+                circuit=qc,
+                input_reg={"a": [0, 1], "b": [2, 3]},
+                output_reg=[2, 3],
+                expected=lambda a, b: [0, 1, 2]
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
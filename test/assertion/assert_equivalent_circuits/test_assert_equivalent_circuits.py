@@ -0,0 +1,197 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import QuantestPyCircuit, assert_equivalent_circuits
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+
+class TestAssertEquivalentCircuits(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_equivalent_circuits.test_assert_equivalent_circuits
+    ...........
+    ----------------------------------------------------------------------
+    Ran 11 tests in 0.011s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # swap gate
+        self.qc_a = QuantestPyCircuit(3)
+        self.qc_a.add_gate(
+            {"name": "swap", "target_qubit": [0, 2], "control_qubit": [],
+             "control_value": [], "parameter": []})
+
+        # swap gate decomposed into three cx gates
+        self.qc_b = QuantestPyCircuit(3)
+        for control_qubit, target_qubit in [(0, 2), (2, 0), (0, 2)]:
+            self.qc_b.add_gate(
+                {"name": "x", "target_qubit": [target_qubit],
+                 "control_qubit": [control_qubit], "control_value": [1],
+                 "parameter": []})
+
+    def tearDown(self) -> None:
+        del self.qc_a, self.qc_b
+
+    def test_streaming_regular(self,):
+        for block_size in [1, 3, 8, 16]:
+            self.assertIsNone(
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=True,
+                    block_size=block_size)
+            )
+
+    def test_streaming_irregular(self,):
+        # phase only on the last column
+        self.qc_b.add_gate(
+            {"name": "p", "target_qubit": [2], "control_qubit": [0, 1],
+             "control_value": [1, 1], "parameter": [np.pi/4]})
+
+        with self.assertRaises(QuantestPyAssertionError) as cm:
+            assert_equivalent_circuits(
+                self.qc_a, self.qc_b, streaming=True, block_size=2)
+
+        self.assertIn("Columns: 6 to 7", cm.exception.args[0])
+
+    def test_streaming_same_results_over_block_sizes(self,):
+        qc_c = QuantestPyCircuit(3)
+        qc_c.add_gate(
+            {"name": "swap", "target_qubit": [0, 2], "control_qubit": [],
+             "control_value": [], "parameter": []})
+        qc_c.add_gate(
+            {"name": "scalar", "target_qubit": [1], "control_qubit": [],
+             "control_value": [], "parameter": [np.pi/3]})
+        # phase only on the last column
+        self.qc_b.add_gate(
+            {"name": "p", "target_qubit": [2], "control_qubit": [0, 1],
+             "control_value": [1, 1], "parameter": [np.pi/4]})
+
+        for block_size, expect_columns in [
+                (1, "7 to 7"), (3, "6 to 7"), (5, "5 to 7"), (8, "0 to 7"),
+                (100, "0 to 7"), (None, "0 to 7")]:
+            self.assertIsNone(
+                assert_equivalent_circuits(
+                    self.qc_a, qc_c, up_to_global_phase=True,
+                    streaming=True, block_size=block_size)
+            )
+
+            for up_to_global_phase in [False, True]:
+                with self.assertRaises(QuantestPyAssertionError) as cm:
+                    assert_equivalent_circuits(
+                        self.qc_a, self.qc_b,
+                        up_to_global_phase=up_to_global_phase,
+                        streaming=True, block_size=block_size)
+                self.assertIn(f"Columns: {expect_columns}",
+                              cm.exception.args[0])
+
+    def test_streaming_block_size_by_default(self,):
+        self.qc_b.add_gate(
+            {"name": "p", "target_qubit": [2], "control_qubit": [0, 1],
+             "control_value": [1, 1], "parameter": [np.pi/4]})
+
+        # the tile size of the operators
+        with patch.dict(os.environ, {"QUANTESTPY_OPERATOR_TILE_SIZE": "3"}):
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=True)
+        self.assertIn("Columns: 6 to 7", cm.exception.args[0])
+
+        for block_size in [0, 2.]:
+            with self.assertRaises(QuantestPyError) as cm:
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=True,
+                    block_size=block_size)
+            self.assertEqual(
+                cm.exception.args[0],
+                "block_size must be an integer greater than 0 or None."
+            )
+
+    def test_streaming_up_to_global_phase(self,):
+        self.qc_b.add_gate(
+            {"name": "scalar", "target_qubit": [1], "control_qubit": [],
+             "control_value": [], "parameter": [np.pi/3]})
+
+        with self.assertRaises(QuantestPyAssertionError):
+            assert_equivalent_circuits(self.qc_a, self.qc_b, streaming=True)
+
+        self.assertIsNone(
+            assert_equivalent_circuits(
+                self.qc_a, self.qc_b, up_to_global_phase=True,
+                streaming=True)
+        )
+
+    def test_streaming_same_as_whole_gates(self,):
+        self.qc_b.add_gate(
+            {"name": "h", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [0], "parameter": []})
+
+        for streaming in [False, True]:
+            with self.assertRaises(QuantestPyAssertionError):
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=streaming)
+
+    def test_streaming_with_matrix_norm_type(self,):
+        with self.assertRaises(QuantestPyError):
+            assert_equivalent_circuits(
+                self.qc_a, self.qc_b, matrix_norm_type="max_norm",
+                streaming=True)
+
+    def test_complex64(self,):
+        self.qc_b.add_gate(
+            {"name": "rz", "target_qubit": [1], "control_qubit": [],
+             "control_value": [], "parameter": [1e-6]})
+
+        for streaming in [False, True]:
+            # the default atol of complex64 covers the small rotation
+            self.assertIsNone(
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=streaming,
+                    dtype=np.complex64)
+            )
+
+            with self.assertRaises(QuantestPyAssertionError):
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, streaming=streaming)
+
+    def test_invalid_dtype(self,):
+        for dtype in [np.float64, "foo"]:
+            with self.assertRaises(QuantestPyError) as cm:
+                assert_equivalent_circuits(
+                    self.qc_a, self.qc_b, dtype=dtype)
+            self.assertEqual(
+                cm.exception.args[0],
+                "dtype must be complex64 or complex128."
+            )
+
+    def test_identical_circuits_not_simulated(self,):
+        qc_c = QuantestPyCircuit(3)
+        qc_c.set_gate_storage("columnar")
+        qc_c.add_gates(self.qc_b.gates)
+
+        with patch("quantestpy.StateVectorCircuit._get_whole_gates") \
+                as get_whole_gates:
+            self.assertIsNone(
+                assert_equivalent_circuits(self.qc_b, qc_c))
+            get_whole_gates.assert_not_called()
+
+    @patch("quantestpy.simulator.quantestpy_circuit."
+           "_STRUCTURAL_HASH_BLOCK_SIZE", 1)
+    def test_raise_after_gate_modified(self,):
+        qc_c = QuantestPyCircuit(3)
+        qc_c.add_gates(
+            [dict(gate, target_qubit=list(gate["target_qubit"]))
+             for gate in self.qc_b.gates])
+        assert_equivalent_circuits(self.qc_b, qc_c)
+
+        # the gate is modified in place after the circuits are compared
+        qc_c.gates[1]["target_qubit"][0] = 1
+        with self.assertRaises(QuantestPyAssertionError):
+            assert_equivalent_circuits(self.qc_b, qc_c)
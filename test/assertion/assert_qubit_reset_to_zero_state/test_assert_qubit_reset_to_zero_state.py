@@ -11,9 +11,9 @@ class TestAssertQubitResetToZeroState(unittest.TestCase):
     {Your directory where you git-cloned quantestpy}/quantestpy
     $ python -m unittest \
         test.assertion.assert_qubit_reset_to_zero_state.test_assert_qubit_reset_to_zero_state
-    ....
+    .....
     ----------------------------------------------------------------------
-    Ran 4 tests in 0.008s
+    Ran 5 tests in 0.008s
 
     OK
     """
@@ -97,3 +97,30 @@ class TestAssertQubitResetToZeroState(unittest.TestCase):
                 circuit=qc,
                 atol=0.7
             )
+
+    def test_error_msg_with_diagnostics(self,):
+        qc = QuantestPyCircuit(3)
+        qc.add_gate(
+            {"name": "h", "target_qubit": [0], "control_qubit": [],
+             "control_value": [], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "target_qubit": [2], "control_qubit": [0],
+             "control_value": [1], "parameter": []}
+        )
+        qc.add_gate(
+            {"name": "x", "target_qubit": [1], "control_qubit": [],
+             "control_value": [], "parameter": []}
+        )
+
+        expected_error_msg = "qubit(s) [2, 1] are either non-zero or " \
+            + "entangled with other qubits.\n" \
+            + "qubit 2: probability of |1> = 0.5, purity = 0.5\n" \
+            + "qubit 1: probability of |1> = 1, purity = 1"
+
+        with self.assertRaises(QuantestPyAssertionError) as cm:
+            assert_qubit_reset_to_zero_state(
+                circuit=qc,
+                qubits=[2, 1]
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
@@ -0,0 +1,83 @@
+import unittest
+
+from quantestpy import QuantestPyCircuit, assert_unary_iteration
+from quantestpy.exceptions import QuantestPyAssertionError
+
+
+class TestAssertUnaryIterationCollectFailures(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_unary_iteration.test_collect_failures
+    ..
+    ----------------------------------------------------------------------
+    Ran 2 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # x on the system qubit 3 for the index 11, with the ancilla qubit 2
+        # left flipped for the index 11
+        self.qc = QuantestPyCircuit(4)
+        self.qc.add_gate({"name": "x", "control_qubit": [0, 1],
+                          "target_qubit": [2], "control_value": [1, 1]})
+        self.qc.add_gate({"name": "x", "control_qubit": [2],
+                          "target_qubit": [3], "control_value": [1]})
+
+    def tearDown(self) -> None:
+        del self.qc
+
+    def test_return_none(self,):
+        self.assertIsNone(
+            assert_unary_iteration(
+                circuit=self.qc,
+                index_reg=[0, 1],
+                system_reg=[3],
+                input_to_output={"00": "0", "01": "0", "10": "0", "11": "1"},
+                collect_failures=True
+            )
+        )
+
+    def test_all_failures_raised(self,):
+        input_to_output = {
+            "00": "0",
+            "01": "1",  # error
+            "10": "0",
+            "11": "0"  # error, and the ancilla is not reset
+        }
+        expected_error_msg = "2 of 4 inputs failed.\n" \
+            + "In bitstring: 01\n" \
+            + "Out bitstring expect: 1\n" \
+            + "Out bitstring actual: 0\n" \
+            + "In bitstring: 11\n" \
+            + "Out bitstring expect: 0\n" \
+            + "Out bitstring actual: 1\n" \
+            + "In bitstring: 11\n" \
+            + "Qubits [2] in ancilla reg are not back to 0 by uncomputation." \
+            + "\nFailures per qubit: qubit 3: 2, qubit 2: 1"
+
+        for n_jobs in [1, 2]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_unary_iteration(
+                    circuit=self.qc,
+                    index_reg=[0, 1],
+                    system_reg=[3],
+                    input_to_output=input_to_output,
+                    ancilla_reg=[2],
+                    n_jobs=n_jobs,
+                    collect_failures=True
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+            self.assertEqual(cm.exception.qubit_to_num_failures,
+                             {3: 2, 2: 1})
+            self.assertEqual(
+                cm.exception.failures[1],
+                {"in_bitstring": "11",
+                 "out_bitstring_expect": "0",
+                 "out_bitstring_actual": "1",
+                 "ancilla_error_qubits": [2],
+                 "error_qubits": [2, 3]})
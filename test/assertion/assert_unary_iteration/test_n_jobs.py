@@ -0,0 +1,87 @@
+import unittest
+
+from quantestpy import QuantestPyCircuit, assert_unary_iteration
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+
+class TestAssertUnaryIterationNJobs(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.assertion.assert_unary_iteration.test_n_jobs
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.200s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        # x on the system qubit 3 for the index 11, with the ancilla qubit 2
+        # left flipped for the index 11
+        self.qc = QuantestPyCircuit(4)
+        self.qc.add_gate({"name": "x", "control_qubit": [0, 1],
+                          "target_qubit": [2], "control_value": [1, 1]})
+        self.qc.add_gate({"name": "x", "control_qubit": [2],
+                          "target_qubit": [3], "control_value": [1]})
+
+    def tearDown(self) -> None:
+        del self.qc
+
+    def test_same_as_sequential(self,):
+        input_to_output = {"00": "0", "01": "0", "10": "0", "11": "1"}
+        for n_jobs in [1, 2, 3]:
+            self.assertIsNone(
+                assert_unary_iteration(
+                    circuit=self.qc,
+                    index_reg=[0, 1],
+                    system_reg=[3],
+                    input_to_output=input_to_output,
+                    n_jobs=n_jobs
+                )
+            )
+
+    def test_first_failure_raised(self,):
+        input_to_output = {"00": "0", "01": "1", "10": "0", "11": "0"}
+        expected_error_msg = "In bitstring: 01\n" \
+            + "Out bitstring expect: 1\n" \
+            + "Out bitstring actual: 0"
+        for n_jobs in [1, 2, 4]:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_unary_iteration(
+                    circuit=self.qc,
+                    index_reg=[0, 1],
+                    system_reg=[3],
+                    input_to_output=input_to_output,
+                    n_jobs=n_jobs
+                )
+            self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+        expected_error_msg = "In bitstring: 11\n" \
+            + "Qubits [2] in ancilla reg are not back to 0 by uncomputation."
+        with self.assertRaises(QuantestPyAssertionError) as cm:
+            assert_unary_iteration(
+                circuit=self.qc,
+                index_reg=[0, 1],
+                system_reg=[3],
+                input_to_output={"10": "0", "11": "1"},
+                ancilla_reg=[2],
+                n_jobs=2
+            )
+        self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_raise_from_invalid_n_jobs(self,):
+        for n_jobs in [0, 2.]:
+            with self.assertRaises(QuantestPyError) as cm:
+                assert_unary_iteration(
+                    circuit=self.qc,
+                    index_reg=[0, 1],
+                    system_reg=[3],
+                    input_to_output={"00": "0"},
+                    n_jobs=n_jobs
+                )
+            self.assertEqual(
+                cm.exception.args[0], "n_jobs must be a positive integer.")
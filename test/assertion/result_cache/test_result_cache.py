@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import (QuantestPyCircuit,
+                        assert_circuit_equivalent_to_operator,
+                        assert_equivalent_circuits)
+from quantestpy.assertion.result_cache import _evict
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+
+_GET_WHOLE_GATES = "quantestpy.StateVectorCircuit._get_whole_gates"
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.assertion.result_cache.test_result_cache
+    ........
+    ----------------------------------------------------------------------
+    Ran 8 tests in 0.030s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ,
+                              {"QUANTESTPY_CACHE_DIR": self.cache_dir.name})
+        self.env.start()
+
+        # swap gate
+        self.qc_a = QuantestPyCircuit(2)
+        self.qc_a.add_gate(
+            {"name": "swap", "target_qubit": [0, 1], "control_qubit": [],
+             "control_value": [], "parameter": []})
+
+        # swap gate decomposed into three cx gates
+        self.qc_b = QuantestPyCircuit(2)
+        for control_qubit, target_qubit in [(0, 1), (1, 0), (0, 1)]:
+            self.qc_b.add_gate(
+                {"name": "x", "target_qubit": [target_qubit],
+                 "control_qubit": [control_qubit], "control_value": [1],
+                 "parameter": []})
+
+    def tearDown(self) -> None:
+        self.env.stop()
+        self.cache_dir.cleanup()
+
+    def test_passed_from_cache(self,):
+        assert_equivalent_circuits(self.qc_a, self.qc_b)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 1)
+
+        with patch(_GET_WHOLE_GATES) as get_whole_gates:
+            self.assertIsNone(
+                assert_equivalent_circuits(self.qc_a, self.qc_b))
+            get_whole_gates.assert_not_called()
+
+        # another tolerance is another result
+        assert_equivalent_circuits(self.qc_a, self.qc_b, atol=1e-3)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 2)
+
+    def test_failed_from_cache(self,):
+        self.qc_b.add_gate(
+            {"name": "z", "target_qubit": [0], "control_qubit": [],
+             "control_value": [], "parameter": []})
+        with self.assertRaises(QuantestPyAssertionError) as cm_expected:
+            assert_equivalent_circuits(self.qc_a, self.qc_b, msg="swap")
+
+        with patch(_GET_WHOLE_GATES) as get_whole_gates:
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_equivalent_circuits(self.qc_a, self.qc_b, msg="swap")
+            get_whole_gates.assert_not_called()
+        self.assertEqual(cm.exception.args[0],
+                         cm_expected.exception.args[0])
+
+    def test_circuit_equivalent_to_operator(self,):
+        swap = np.eye(4)[[0, 2, 1, 3]]
+        assert_circuit_equivalent_to_operator(self.qc_b, swap)
+
+        with patch(_GET_WHOLE_GATES) as get_whole_gates:
+            self.assertIsNone(
+                assert_circuit_equivalent_to_operator(self.qc_b, swap))
+            get_whole_gates.assert_not_called()
+
+        with self.assertRaises(QuantestPyAssertionError):
+            assert_circuit_equivalent_to_operator(self.qc_b, np.eye(4))
+
+    def test_operator_from_cache(self,):
+        with patch.dict(os.environ, {"QUANTESTPY_CACHE_OPERATORS": "1"}):
+            assert_equivalent_circuits(self.qc_a, self.qc_b)
+            file_names = os.listdir(self.cache_dir.name)
+            self.assertEqual(
+                sorted(os.path.splitext(name)[1] for name in file_names),
+                [".json", ".npy", ".npy"])
+
+            # the operators are reused by another assertion
+            with patch(_GET_WHOLE_GATES) as get_whole_gates:
+                assert_circuit_equivalent_to_operator(
+                    self.qc_b, np.eye(4)[[0, 2, 1, 3]])
+                get_whole_gates.assert_not_called()
+
+    def test_each_circuit_hashed_once(self,):
+        get_structural_hash = QuantestPyCircuit._get_structural_hash
+        with patch.dict(os.environ, {"QUANTESTPY_CACHE_OPERATORS": "1"}), \
+                patch.object(QuantestPyCircuit, "_get_structural_hash",
+                             autospec=True,
+                             side_effect=get_structural_hash) as mock:
+            # for the comparison and the caches of the result and the
+            # operators
+            assert_equivalent_circuits(self.qc_a, self.qc_b)
+            self.assertEqual(mock.call_count, 2)
+
+            mock.reset_mock()
+            assert_circuit_equivalent_to_operator(
+                self.qc_b, np.eye(4)[[0, 2, 1, 3]])
+            self.assertEqual(mock.call_count, 1)
+
+            mock.reset_mock()
+            assert_equivalent_circuits(self.qc_a, self.qc_a._copy())
+            self.assertEqual(mock.call_count, 2)
+
+    @patch("quantestpy.simulator.quantestpy_circuit."
+           "_STRUCTURAL_HASH_BLOCK_SIZE", 1)
+    def test_not_from_cache_after_gate_modified(self,):
+        swap = np.eye(4)[[0, 2, 1, 3]]
+        with patch.dict(os.environ, {"QUANTESTPY_CACHE_OPERATORS": "1"}):
+            assert_equivalent_circuits(self.qc_a, self.qc_b)
+            assert_circuit_equivalent_to_operator(self.qc_b, swap)
+
+            # the gate is modified in place after the results are cached
+            self.qc_b.gates[1]["control_value"][0] = 0
+            with self.assertRaises(QuantestPyAssertionError):
+                assert_equivalent_circuits(self.qc_a, self.qc_b)
+            with self.assertRaises(QuantestPyAssertionError):
+                assert_circuit_equivalent_to_operator(self.qc_b, swap)
+
+    def test_least_recently_used_evicted(self,):
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.cache_dir.name, f"{i}.json")
+            with open(path, "w") as f:
+                f.write("0123456789")
+            os.utime(path, (i, i))
+            paths.append(path)
+        # the first file is used again
+        os.utime(paths[0], (3, 3))
+
+        _evict(self.cache_dir.name, 25)
+        self.assertEqual(sorted(os.listdir(self.cache_dir.name)),
+                         ["0.json", "2.json"])
+
+    def test_invalid_cache_size(self,):
+        with patch.dict(os.environ, {"QUANTESTPY_CACHE_SIZE": "1GB"}):
+            with self.assertRaises(QuantestPyError) as cm:
+                assert_equivalent_circuits(self.qc_a, self.qc_b)
+        self.assertEqual(
+            cm.exception.args[0],
+            "QUANTESTPY_CACHE_SIZE must be a non-negative integer."
+        )
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import PauliCircuit
+from quantestpy.simulator.exceptions import PauliCircuitError
+
+
+class TestCreateExecutionContext(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.pauli_circuit.test_create_execution_context
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.001s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.circ = PauliCircuit(3)
+        self.circ.add_gate(
+            {"name": "y", "target_qubit": [1], "control_qubit": [0],
+             "control_value": [1]})
+
+    def tearDown(self) -> None:
+        del self.circ
+
+    def test_gates_shared_and_state_separated(self,):
+        context = self.circ._create_execution_context()
+
+        self.assertIs(context.gates, self.circ.gates)
+        self.assertIs(context._get_program(), self.circ._get_program())
+
+        context.set_qubit_value([0], [1])
+        context._execute_all_gates()
+
+        self.assertEqual(context.qubit_value.tolist(), [1, 1, 0])
+        self.assertEqual(self.circ.qubit_value.tolist(), [0, 0, 0])
+        self.assertEqual(self.circ.qubit_phase.tolist(), [0., 0., 0.])
+
+    def test_gates_read_only(self,):
+        context = self.circ._create_execution_context()
+        gate = {"name": "x", "target_qubit": [2], "control_qubit": [],
+                "control_value": []}
+
+        for add_gates in [lambda: context.add_gate(dict(gate)),
+                          lambda: context.add_gates([dict(gate)])]:
+            with self.assertRaises(PauliCircuitError) as cm:
+                add_gates()
+            self.assertEqual(
+                cm.exception.args[0],
+                "Gates cannot be added to an execution context."
+            )
+        self.assertEqual(len(self.circ.gates), 1)
+        self.assertIs(context._get_program(), self.circ._get_program())
+
+        # gates are added to the circuit and a copy of the context
+        copied = context._copy()
+        copied.add_gate(dict(gate))
+        self.circ.add_gate(dict(gate))
+        self.assertEqual(len(copied.gates), 2)
+        self.assertEqual(len(self.circ.gates), 2)
+
+    def test_reset_execution_context(self,):
+        context = self.circ._create_execution_context()
+        context.set_qubit_value([0], [1])
+        context._execute_all_gates()
+
+        self.circ._reset_execution_context(context)
+
+        self.assertIsNone(
+            np.testing.assert_array_equal(context.qubit_value, [0, 0, 0]))
+        self.assertIsNone(
+            np.testing.assert_array_equal(context.qubit_phase, [0., 0., 0.]))
@@ -0,0 +1,170 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import PauliCircuit
+
+
+class TestCreateTracer(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.simulator.pauli_circuit.test_create_tracer
+    .....
+    ----------------------------------------------------------------------
+    Ran 5 tests in 0.005s
+
+    OK
+    $
+    """
+
+    def test_first_gate_of_qubits(self,):
+        circ = PauliCircuit(4)
+        circ.add_gate(
+            {"name": "x", "target_qubit": [2], "control_qubit": [0],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "z", "target_qubit": [2], "control_qubit": [],
+             "control_value": []})
+        circ.add_gate(
+            {"name": "x", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [0]})
+        program = circ._get_program()
+        # qubit 3 is not acted on
+        self.assertEqual(
+            program.get_first_gate_of_qubits(4).tolist(), [0, 2, 0, 3])
+
+        self.assertEqual(
+            PauliCircuit(2)._get_program().get_first_gate_of_qubits(
+                2).tolist(), [0, 0])
+
+    def test_empty_circuit(self,):
+        tracer = PauliCircuit(2)._create_tracer(checkpoint_interval=1)
+        for value in [[1, 0], [1, 0], [0, 1]]:
+            qubit_value, qubit_phase = np.array(value), np.array([0.1, 0.])
+            tracer.run(qubit_value, qubit_phase)
+            self.assertEqual(qubit_value.tolist(), value)
+            self.assertEqual(qubit_phase.tolist(), [0.1, 0.])
+        self.assertEqual(tracer._num_executed_gates, 0)
+
+    def test_same_values_as_gate_by_gate(self,):
+        # the index qubits 0, 1 and 2 are read one after another and qubit
+        # 2 is acted on only from the 5-th gate.
+        circ = PauliCircuit(5)
+        circ.add_gate(
+            {"name": "x", "target_qubit": [3], "control_qubit": [0],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "y", "target_qubit": [4], "control_qubit": [3],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "swap", "target_qubit": [3, 4], "control_qubit": [1],
+             "control_value": [0]})
+        circ.add_gate(
+            {"name": "z", "target_qubit": [4], "control_qubit": [],
+             "control_value": []})
+        circ.add_gate(
+            {"name": "x", "target_qubit": [4], "control_qubit": [2],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "y", "target_qubit": [3], "control_qubit": [4, 2],
+             "control_value": [0, 1]})
+        for checkpoint_interval in [1, 2, 4, 64]:
+            tracer = circ._create_tracer(checkpoint_interval)
+            for index in [0, 1, 5, 4, 7, 7, 2, 6]:
+                qubit_value = np.zeros(5, dtype=int)
+                qubit_value[:3] = [(index >> i) & 1 for i in range(3)]
+                qubit_phase = np.zeros(5)
+                qubit_phase[0] = np.pi * index / 8
+                actual_value, actual_phase = \
+                    qubit_value.copy(), qubit_phase.copy()
+                tracer.run(actual_value, actual_phase)
+
+                pc = circ._create_execution_context()
+                pc._qubit_value[:], pc._qubit_phase[:] = \
+                    qubit_value, qubit_phase
+                for i in range(len(circ._gates)):
+                    gate = circ._gates[i]
+                    self.assertEqual(
+                        tracer.get_control_values(i),
+                        pc._qubit_value[gate["control_qubit"]].tolist())
+                    pc._execute_i_th_gate(i)
+                    self.assertEqual(
+                        tracer.get_target_values(i),
+                        pc._qubit_value[gate["target_qubit"]].tolist())
+
+                self.assertEqual(actual_value.tolist(),
+                                 pc._qubit_value.tolist())
+                self.assertIsNone(np.testing.assert_allclose(
+                    actual_phase, pc._qubit_phase))
+
+    def test_resume_from_checkpoint(self,):
+        # the index qubits 0, 1 and 2 are read one after another and qubit
+        # 2 is acted on only from the 5-th gate.
+        circ = PauliCircuit(5)
+        circ.add_gate(
+            {"name": "x", "target_qubit": [3], "control_qubit": [0],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "y", "target_qubit": [4], "control_qubit": [3],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "swap", "target_qubit": [3, 4], "control_qubit": [1],
+             "control_value": [0]})
+        circ.add_gate(
+            {"name": "z", "target_qubit": [4], "control_qubit": [],
+             "control_value": []})
+        circ.add_gate(
+            {"name": "x", "target_qubit": [4], "control_qubit": [2],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "y", "target_qubit": [3], "control_qubit": [4, 2],
+             "control_value": [0, 1]})
+        tracer = circ._create_tracer(checkpoint_interval=2)
+
+        # the first input executes all gates
+        tracer.run(np.array([1, 1, 0, 0, 0]), np.zeros(5))
+        self.assertEqual(tracer._num_executed_gates, 6)
+
+        # qubit 2 is first acted on by gate 4, which starts a checkpoint
+        tracer.run(np.array([1, 1, 1, 0, 0]), np.zeros(5))
+        self.assertEqual(tracer._num_executed_gates, 6 + 2)
+
+        # the same input reuses all gates
+        tracer.run(np.array([1, 1, 1, 0, 0]), np.zeros(5))
+        self.assertEqual(tracer._num_executed_gates, 6 + 2)
+
+        # qubit 1 is first acted on by gate 2
+        tracer.run(np.array([1, 0, 1, 0, 0]), np.zeros(5))
+        self.assertEqual(tracer._num_executed_gates, 6 + 2 + 4)
+
+    def test_resume_on_untouched_qubit_and_phase(self,):
+        circ = PauliCircuit(4)
+        circ.add_gate(
+            {"name": "x", "target_qubit": [2], "control_qubit": [0],
+             "control_value": [1]})
+        circ.add_gate(
+            {"name": "z", "target_qubit": [2], "control_qubit": [],
+             "control_value": []})
+        circ.add_gate(
+            {"name": "y", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [1]})
+        tracer = circ._create_tracer(checkpoint_interval=1)
+
+        for value, phase, num_executed_gates in [
+                # all gates
+                ([1, 0, 0, 0], [0., 0., 0., 0.], 3),
+                # qubit 3 is not acted on
+                ([1, 0, 0, 1], [0., 0., 0., 0.], 3),
+                # only the phase of qubit 1 first acted on by gate 2
+                ([1, 0, 0, 1], [0., 0.5, 0., 0.], 3 + 1)]:
+            actual_value, actual_phase = np.array(value), np.array(phase)
+            tracer.run(actual_value, actual_phase)
+            self.assertEqual(tracer._num_executed_gates, num_executed_gates)
+
+            expect_value, expect_phase = np.array(value), np.array(phase)
+            circ._create_tracer().run(expect_value, expect_phase)
+            self.assertEqual(actual_value.tolist(), expect_value.tolist())
+            self.assertIsNone(np.testing.assert_allclose(
+                actual_phase, expect_phase))
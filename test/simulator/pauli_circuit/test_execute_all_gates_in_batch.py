@@ -0,0 +1,71 @@
+import copy
+import unittest
+
+import numpy as np
+
+from quantestpy import PauliCircuit
+from quantestpy.simulator.exceptions import PauliCircuitError
+
+
+class TestExecuteAllGatesInBatch(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.pauli_circuit.test_execute_all_gates_in_batch
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.004s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.circ = PauliCircuit(5)
+        self.circ.add_gate(
+            {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+             "control_value": [1, 0]})
+        self.circ.add_gate(
+            {"name": "y", "target_qubit": [3, 4], "control_qubit": [2],
+             "control_value": [1]})
+        self.circ.add_gate(
+            {"name": "swap", "target_qubit": [0, 3], "control_qubit": [1],
+             "control_value": [0]})
+        self.circ.add_gate(
+            {"name": "z", "target_qubit": [0, 1, 4], "control_qubit": [],
+             "control_value": []})
+
+    def tearDown(self) -> None:
+        del self.circ
+
+    def test_same_as_execute_all_gates(self,):
+        in_bitstrings = ["00", "01", "10", "11"]
+        qubit_value, qubit_phase = \
+            self.circ._get_qubit_value_and_phase_in_batch(
+                [0, 1], in_bitstrings)
+        self.circ._execute_all_gates_in_batch(qubit_value, qubit_phase)
+
+        for i, in_bitstring in enumerate(in_bitstrings):
+            pc = copy.deepcopy(self.circ)
+            pc.set_qubit_value([0, 1], [int(j) for j in in_bitstring])
+            pc._execute_all_gates()
+
+            self.assertIsNone(
+                np.testing.assert_array_equal(qubit_value[i], pc.qubit_value))
+            self.assertIsNone(
+                np.testing.assert_array_equal(qubit_phase[i], pc.qubit_phase))
+
+    def test_other_qubits_keep_circuit_values(self,):
+        self.circ.set_qubit_value([4], [1])
+        qubit_value, _ = self.circ._get_qubit_value_and_phase_in_batch(
+            [0, 1], ["00", "11"])
+
+        self.assertIsNone(
+            np.testing.assert_array_equal(
+                qubit_value, [[0, 0, 0, 0, 1], [1, 1, 0, 0, 1]]))
+
+    def test_invalid_bitstring(self,):
+        with self.assertRaises(PauliCircuitError):
+            self.circ._get_qubit_value_and_phase_in_batch([0, 1], ["02"])
@@ -0,0 +1,93 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import PauliCircuit
+
+
+class TestGetProgram(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.simulator.pauli_circuit.test_get_program
+    .....
+    ----------------------------------------------------------------------
+    Ran 5 tests in 0.004s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.circ = PauliCircuit(4)
+        self.circ.add_gate(
+            {"name": "x", "target_qubit": [0, 1], "control_qubit": [],
+             "control_value": []})
+        self.circ.add_gate(
+            {"name": "swap", "target_qubit": [1, 3], "control_qubit": [0, 2],
+             "control_value": [1, 0]})
+        self.circ.add_gate(
+            {"name": "y", "target_qubit": [2], "control_qubit": [3],
+             "control_value": [1]})
+
+    def tearDown(self) -> None:
+        del self.circ
+
+    def test_struct_of_arrays(self,):
+        program = self.circ._get_program()
+
+        self.assertEqual(program.opcode.tolist(), [0, 3, 1])
+        self.assertEqual(program.target_offset.tolist(), [0, 2, 4, 5])
+        self.assertEqual(program.target_qubit.tolist(), [0, 1, 1, 3, 2])
+        self.assertEqual(program.control_offset.tolist(), [0, 0, 2, 3])
+        self.assertEqual(program.control_qubit.tolist(), [0, 2, 3])
+        self.assertEqual(program.control_value.tolist(), [1, 0, 1])
+
+    def test_cache_invalidated_by_add_gate(self,):
+        program = self.circ._get_program()
+        self.assertIs(self.circ._get_program(), program)
+
+        self.circ.add_gate(
+            {"name": "z", "target_qubit": [2], "control_qubit": [],
+             "control_value": []})
+        self.assertIsNot(self.circ._get_program(), program)
+        self.assertEqual(len(self.circ._get_program()), 4)
+
+    def test_execute(self,):
+        self.circ._execute_all_gates()
+
+        self.assertEqual(self.circ.qubit_value.tolist(), [1, 0, 1, 1])
+        self.assertIsNone(
+            np.testing.assert_allclose(
+                self.circ.qubit_phase, [0., 0., np.pi/2, 0.]))
+
+    def test_masks(self,):
+        # the masks of qubits up to 61 are computed in int64 and the others
+        # in python integers
+        for last_qubit in [61, 69]:
+            circ = PauliCircuit(70)
+            circ.add_gate(
+                {"name": "x", "target_qubit": [last_qubit],
+                 "control_qubit": [60, 59], "control_value": [1, 0]})
+            circ.add_gate(
+                {"name": "swap", "target_qubit": [1, 3], "control_qubit": [],
+                 "control_value": []})
+            program = circ._get_program()
+
+            self.assertEqual(program._target_masks,
+                             [1 << last_qubit, 0b1010])
+            self.assertEqual(program._control_masks,
+                             [(1 << 60) + (1 << 59), 0])
+            self.assertEqual(program._control_value_masks, [1 << 60, 0])
+
+    def test_columnar_gates(self,):
+        self.circ.set_gate_storage("columnar")
+        program = self.circ._get_program()
+
+        self.assertEqual(program.opcode.tolist(), [0, 3, 1])
+        self.assertEqual(program.target_offset.tolist(), [0, 2, 4, 5])
+        self.assertEqual(program.target_qubit.tolist(), [0, 1, 1, 3, 2])
+        self.assertEqual(program.control_offset.tolist(), [0, 0, 2, 3])
+        self.assertEqual(program.control_qubit.tolist(), [0, 2, 3])
+        self.assertEqual(program.control_value.tolist(), [1, 0, 1])
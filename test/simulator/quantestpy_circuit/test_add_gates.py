@@ -0,0 +1,251 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import PauliCircuit, QuantestPyCircuit, StateVectorCircuit
+from quantestpy.simulator.exceptions import (PauliCircuitError,
+                                             QuantestPyCircuitError,
+                                             StateVectorCircuitError)
+
+_GATES = [
+    {"name": "h", "target_qubit": [1], "control_qubit": [],
+     "control_value": [], "parameter": []},
+    {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+     "control_value": [1, 0], "parameter": []},
+    {"name": "rx", "target_qubit": [0], "control_qubit": [2],
+     "control_value": [1], "parameter": [0.5]},
+    {"name": "swap", "target_qubit": [0, 2], "control_qubit": [],
+     "control_value": [], "parameter": []}
+]
+
+
+class TestQuantestPyCircuitAddGates(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.simulator.quantestpy_circuit.test_add_gates
+    ..........
+    ----------------------------------------------------------------------
+    Ran 10 tests in 0.004s
+
+    OK
+    $
+    """
+
+    def test_all_pass(self,):
+        for gate_storage in ["list", "columnar"]:
+            qc = QuantestPyCircuit(3)
+            qc.set_gate_storage(gate_storage)
+            qc.add_gates(_GATES[:1])
+            qc.add_gates(gate for gate in _GATES[1:])
+            self.assertEqual(qc.gates, _GATES)
+
+    def test_gates_of_another_circuit(self,):
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        qc.add_gates(_GATES)
+
+        svc = StateVectorCircuit(3)
+        svc.add_gates(qc.gates)
+        self.assertEqual(svc.gates, _GATES)
+
+    def test_same_error_as_add_gate(self,):
+        invalid_gates = [
+            "x",
+            {"name": "x", "target_qubit": [0], "control_qubit": []},
+            {"name": "x", "target_qubit": (0,), "control_qubit": [],
+             "control_value": []},
+            {"name": "x", "target_qubit": [], "control_qubit": [],
+             "control_value": []},
+            {"name": "x", "target_qubit": [1.0], "control_qubit": [],
+             "control_value": []},
+            {"name": "x", "target_qubit": [3], "control_qubit": [],
+             "control_value": []},
+            {"name": "x", "target_qubit": [0], "control_qubit": [-1],
+             "control_value": [1]},
+            {"name": "x", "target_qubit": [0], "control_qubit": [1],
+             "control_value": [2]},
+            {"name": "x", "target_qubit": [0], "control_qubit": [1],
+             "control_value": [1, 0]},
+            {"name": "x", "target_qubit": [0, 0], "control_qubit": [],
+             "control_value": []},
+            {"name": "x", "target_qubit": [0], "control_qubit": [1, 1],
+             "control_value": [1, 1]},
+            {"name": "x", "target_qubit": [0, 2], "control_qubit": [2],
+             "control_value": [1]},
+            {"name": "iswap", "target_qubit": [1], "control_qubit": [],
+             "control_value": []}
+        ]
+        for invalid_gate in invalid_gates:
+            qc = QuantestPyCircuit(3)
+            with self.assertRaises(QuantestPyCircuitError) as cm_expected:
+                qc.add_gate(invalid_gate)
+
+            with self.assertRaises(QuantestPyCircuitError) as cm:
+                qc.add_gates(_GATES + [invalid_gate] + _GATES)
+            self.assertEqual(cm.exception.args[0],
+                             cm_expected.exception.args[0])
+            # none of the gates is added
+            self.assertEqual(qc.gates, [])
+
+    def test_subclass_error(self,):
+        pc = PauliCircuit(3)
+        with self.assertRaises(PauliCircuitError) as cm:
+            pc.add_gates(_GATES)
+        self.assertEqual(
+            cm.exception.args[0],
+            "h gate is not implemented.\n"
+            "Implemented gates: ['x', 'y', 'z', 'swap']"
+        )
+
+        svc = StateVectorCircuit(3)
+        with self.assertRaises(StateVectorCircuitError) as cm:
+            svc.add_gates(_GATES[:2] + [
+                {"name": "rx", "target_qubit": [0], "control_qubit": [],
+                 "control_value": [], "parameter": ["theta"]}])
+        self.assertEqual(
+            cm.exception.args[0],
+            "Parameter(s) in rx gate must be float or integer type."
+        )
+        self.assertEqual(svc.gates, [])
+
+    def test_pauli_circuit_default_parameter(self,):
+        pc = PauliCircuit(2)
+        pc.add_gate({"name": "x", "target_qubit": [0], "control_qubit": [],
+                     "control_value": []})
+        pc._get_program()
+        pc.add_gates([{"name": "x", "target_qubit": [1],
+                       "control_qubit": [0], "control_value": [1]}])
+
+        self.assertEqual(pc.gates[1]["parameter"], [])
+        # the compiled program is outdated
+        self.assertIsNone(pc._program)
+        pc._execute_all_gates()
+        self.assertEqual(pc.qubit_value.tolist(), [1, 1])
+
+    def test_without_validation(self,):
+        qc = QuantestPyCircuit(2)
+        gate = {"name": "x", "target_qubit": [5], "control_qubit": [],
+                "control_value": []}
+        qc.add_gates([gate], validate=False)
+        self.assertEqual(qc.gates, [gate])
+
+    def test_gate_arrays(self,):
+        for gate_storage in ["list", "columnar"]:
+            qc = QuantestPyCircuit(3)
+            qc.set_gate_storage(gate_storage)
+            qc.add_gates({"name": np.array(["x", "rx"]),
+                          "target_qubit": np.array([[2], [0]]),
+                          "control_qubit": [[0, 1], [1, 2]],
+                          "control_value": [[1, 0], [0, 1]],
+                          "parameter": [[0.5], [1]]})
+            # without parameters, and no gates
+            qc.add_gates({"name": ["swap"], "target_qubit": [[0, 2]],
+                          "control_qubit": np.empty((1, 0), dtype=int),
+                          "control_value": np.empty((1, 0), dtype=int)})
+            qc.add_gates({"name": [], "target_qubit": np.empty((0, 1)),
+                          "control_qubit": np.empty((0, 0)),
+                          "control_value": np.empty((0, 0))})
+
+            self.assertEqual(qc.gates, [
+                {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+                 "control_value": [1, 0], "parameter": [0.5]},
+                {"name": "rx", "target_qubit": [0], "control_qubit": [1, 2],
+                 "control_value": [0, 1], "parameter": [1.]},
+                {"name": "swap", "target_qubit": [0, 2], "control_qubit": [],
+                 "control_value": [], "parameter": []}])
+            self.assertIs(type(qc.gates[0]["name"]), str)
+
+    def test_gate_arrays_same_error_as_add_gate(self,):
+        invalid_gates = [
+            {"name": "x", "target_qubit": [3], "control_qubit": [1],
+             "control_value": [1], "parameter": [0.5]},
+            {"name": "x", "target_qubit": [0], "control_qubit": [-1],
+             "control_value": [1], "parameter": [0.5]},
+            {"name": "x", "target_qubit": [0], "control_qubit": [1],
+             "control_value": [2], "parameter": [0.5]},
+            {"name": "x", "target_qubit": [0], "control_qubit": [0],
+             "control_value": [1], "parameter": [0.5]},
+            {"name": "rz", "target_qubit": [0], "control_qubit": [1],
+             "control_value": [1], "parameter": [0.5]}
+        ]
+        valid_gates = [
+            {"name": "x", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [0], "parameter": [0.5]}] * 2
+        # rz is invalid only in PauliCircuit
+        for circuit_class, invalid_gate in \
+                [(QuantestPyCircuit, gate) for gate in invalid_gates[:-1]] \
+                + [(PauliCircuit, gate) for gate in invalid_gates]:
+            gates = valid_gates + [invalid_gate] + valid_gates
+            arrays = {key: [gate[key] for gate in gates]
+                      for key in invalid_gate.keys()}
+            qc = circuit_class(3)
+            errors = (QuantestPyCircuitError, PauliCircuitError)
+            with self.assertRaises(errors) as cm_expected:
+                qc.add_gate(invalid_gate)
+
+            with self.assertRaises(errors) as cm:
+                qc.add_gates(arrays)
+            self.assertIs(type(cm.exception), type(cm_expected.exception))
+            self.assertEqual(cm.exception.args[0],
+                             cm_expected.exception.args[0])
+            self.assertEqual(qc.gates, [])
+
+        # x with a parameter is valid in QuantestPyCircuit but not here
+        svc = StateVectorCircuit(3)
+        with self.assertRaises(StateVectorCircuitError) as cm:
+            svc.add_gates({key: [gate[key] for gate in valid_gates]
+                           for key in valid_gates[0].keys()})
+        self.assertEqual(cm.exception.args[0],
+                         "x gate must have an empty list for 'parameter'.")
+
+    def test_malformed_gate_arrays(self,):
+        arrays = {"name": ["x", "x"], "target_qubit": [[0], [1]],
+                  "control_qubit": [[1], [0]], "control_value": [[1], [1]]}
+        for key, value, error_msg in [
+                ("name", "xx",
+                 'gates["name"] must be a sequence of gate names.'),
+                ("target_qubit", [0, 1],
+                 'gates["target_qubit"] must be a 2-dim array of integers '
+                 "with a row for each gate."),
+                ("control_qubit", [[1.], [0.]],
+                 'gates["control_qubit"] must be a 2-dim array of integers '
+                 "with a row for each gate."),
+                ("parameter", [["a"], ["b"]],
+                 'gates["parameter"] must be a 2-dim array of real numbers '
+                 "with a row for each gate."),
+                ("control_value", [[1, 1], [1, 1]],
+                 "control_qubit and control_value must have the same "
+                 "shape."),
+                ("control_value", None,
+                 "gates must contain 'control_value' as a key.")]:
+            malformed_arrays = dict(arrays, **{key: value})
+            if value is None:
+                del malformed_arrays[key]
+            qc = QuantestPyCircuit(2)
+            with self.assertRaises(QuantestPyCircuitError) as cm:
+                qc.add_gates(malformed_arrays, validate=False)
+            self.assertEqual(cm.exception.args[0], error_msg)
+            self.assertEqual(qc.gates, [])
+
+    def test_gates_of_columnar_circuit(self,):
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        qc.add_gates(_GATES)
+
+        for gate_storage in ["list", "columnar"]:
+            svc = StateVectorCircuit(3)
+            svc.set_gate_storage(gate_storage)
+            svc.add_gates(qc.gates)
+            self.assertEqual(svc.gates, _GATES)
+
+            # the qubits out of range are found as well
+            svc = StateVectorCircuit(2)
+            svc.set_gate_storage(gate_storage)
+            with self.assertRaises(QuantestPyCircuitError) as cm:
+                svc.add_gates(qc.gates)
+            self.assertEqual(
+                cm.exception.args[0],
+                "Index 2 in target_qubit out of range for circuit size 2.")
+            self.assertEqual(len(svc.gates), 0)
@@ -0,0 +1,113 @@
+import copy
+import unittest
+from unittest.mock import patch
+
+from quantestpy import PauliCircuit, QuantestPyCircuit
+
+_GATES = [
+    {"name": "h", "target_qubit": [1], "control_qubit": [],
+     "control_value": [], "parameter": []},
+    {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+     "control_value": [1, 0], "parameter": []},
+    {"name": "rx", "target_qubit": [0], "control_qubit": [2],
+     "control_value": [1], "parameter": [1]}
+]
+
+
+class TestQuantestPyCircuitEq(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.simulator.quantestpy_circuit.test_eq
+    .....
+    ----------------------------------------------------------------------
+    Ran 5 tests in 0.002s
+
+    OK
+    $
+    """
+
+    def test_equal(self,):
+        qc_a = QuantestPyCircuit(3)
+        qc_a.add_gates(_GATES)
+        qc_b = QuantestPyCircuit(3)
+        qc_b.set_gate_storage("columnar")
+        for gate in _GATES:
+            qc_b.add_gate(gate)
+
+        self.assertEqual(qc_a, qc_b)
+        self.assertEqual(qc_a._get_structural_hash(),
+                         qc_b._get_structural_hash())
+        self.assertEqual(qc_a, copy.deepcopy(qc_a))
+
+    def test_not_equal(self,):
+        qc_a = QuantestPyCircuit(3)
+        qc_a.add_gates(_GATES)
+
+        qc_b = QuantestPyCircuit(4)
+        qc_b.add_gates(_GATES)
+        self.assertNotEqual(qc_a, qc_b)
+
+        qc_b = QuantestPyCircuit(3)
+        qc_b.add_gates(_GATES[::-1])
+        self.assertNotEqual(qc_a, qc_b)
+
+        qc_b = QuantestPyCircuit(3)
+        qc_b.add_gates(_GATES[:2])
+        qc_b.add_gate({"name": "rx", "target_qubit": [0],
+                       "control_qubit": [2], "control_value": [1],
+                       "parameter": [1.5]})
+        self.assertNotEqual(qc_a, qc_b)
+
+        pc_a = PauliCircuit(3)
+        pc_a.add_gate(_GATES[1])
+        qc_b = QuantestPyCircuit(3)
+        qc_b.add_gate(_GATES[1])
+        self.assertNotEqual(pc_a, qc_b)
+        self.assertNotEqual(qc_a, "qc_a")
+
+    @patch("quantestpy.simulator.quantestpy_circuit."
+           "_STRUCTURAL_HASH_BLOCK_SIZE", 2)
+    def test_equal_over_blocks(self,):
+        qc_a = QuantestPyCircuit(3)
+        qc_a.add_gates(_GATES[:2])
+        qc_b = qc_a._copy()
+        qc_a.add_gates(_GATES[2:] * 3)
+
+        qc_c = QuantestPyCircuit(3)
+        qc_c.set_gate_storage("columnar")
+        qc_c.add_gates(_GATES + _GATES[2:] * 2)
+        self.assertEqual(qc_a._get_structural_hash(),
+                         qc_c._get_structural_hash())
+
+        # the copy is not affected
+        self.assertNotEqual(qc_b, qc_c)
+        qc_b.add_gates(_GATES[2:] * 3)
+        self.assertEqual(qc_b, qc_c)
+
+    def test_not_equal_after_gate_modified(self,):
+        qc_a = QuantestPyCircuit(3)
+        qc_a.add_gates(copy.deepcopy(_GATES))
+        qc_b = QuantestPyCircuit(3)
+        qc_b.add_gates(copy.deepcopy(_GATES))
+        self.assertEqual(qc_a, qc_b)
+
+        # the gates of the list storage are the dicts added
+        qc_a.gates[0]["target_qubit"][0] = 0
+        self.assertNotEqual(qc_a, qc_b)
+        qc_a.gates[0]["target_qubit"][0] = 1
+        self.assertEqual(qc_a, qc_b)
+
+        qc_a.gates[2]["parameter"] = [2]
+        self.assertNotEqual(qc_a, qc_b)
+
+    def test_hashable_by_identity(self,):
+        qc_a = QuantestPyCircuit(3)
+        qc_a.add_gates(_GATES)
+        qc_b = qc_a._copy()
+        self.assertEqual(qc_a, qc_b)
+
+        self.assertEqual(hash(qc_a), hash(qc_a))
+        self.assertEqual(len({qc_a, qc_b, PauliCircuit(3)}), 3)
+        self.assertEqual({qc_a: 0}[qc_a], 0)
@@ -0,0 +1,168 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import PauliCircuit, QuantestPyCircuit
+from quantestpy.simulator.exceptions import QuantestPyCircuitError
+from quantestpy.simulator.pauli_circuit import \
+    cvt_quantestpy_circuit_to_pauli_circuit
+
+_GATES = [
+    {"name": "h", "target_qubit": [1], "control_qubit": [],
+     "control_value": [], "parameter": []},
+    {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+     "control_value": [1, 0], "parameter": []},
+    {"name": "u", "target_qubit": [0], "control_qubit": [2],
+     "control_value": [1], "parameter": [0.1, 0.2, 0.3, 0.4]},
+    {"name": "swap", "target_qubit": [0, 2], "control_qubit": [],
+     "control_value": [], "parameter": []}
+]
+
+
+class TestQuantestPyCircuitSetGateStorage(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.quantestpy_circuit.test_set_gate_storage
+    ........
+    ----------------------------------------------------------------------
+    Ran 8 tests in 0.005s
+
+    OK
+    $
+    """
+
+    def test_same_gates_as_list(self,):
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        for gate in _GATES:
+            qc.add_gate(dict(gate))
+
+        self.assertEqual(qc.gate_storage, "columnar")
+        self.assertEqual(len(qc.gates), 4)
+        self.assertEqual(qc.gates, _GATES)
+        self.assertEqual(list(qc.gates), _GATES)
+        self.assertEqual(qc.gates[-1], _GATES[-1])
+        self.assertEqual(qc.gates[1:3], _GATES[1:3])
+        with self.assertRaises(IndexError):
+            qc.gates[4]
+        with self.assertRaises(IndexError):
+            qc.gates[-5]
+
+    def test_empty_circuit(self,):
+        qc = QuantestPyCircuit(2)
+        qc.set_gate_storage("columnar")
+
+        self.assertEqual(len(qc.gates), 0)
+        self.assertEqual(qc.gates, [])
+        self.assertEqual(list(qc.gates), [])
+        self.assertEqual(qc.gates[:], [])
+        self.assertEqual(qc.gates.target_offset.tolist(), [0])
+        with self.assertRaises(IndexError):
+            qc.gates[0]
+
+        qc.set_gate_storage("list")
+        self.assertEqual(qc.gates, [])
+
+    @patch("quantestpy.simulator.quantestpy_circuit."
+           "_COLUMNAR_ITER_CHUNK_SIZE", 3)
+    def test_iterate_over_chunks(self,):
+        # chunks of gates of the same shape and of different shapes
+        gates = _GATES[1:2] * 4 + _GATES + _GATES[2:3] * 2
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        qc.add_gates(gates)
+
+        self.assertEqual(list(qc.gates), gates)
+        for index in [slice(2, 9), slice(None, None, 2), slice(-4, None),
+                      slice(5, 2), slice(20, None)]:
+            self.assertEqual(qc.gates[index], gates[index])
+
+    def test_columns(self,):
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        qc.add_gates(_GATES)
+        gates = qc.gates
+
+        self.assertEqual(gates.names, ["h", "x", "u", "swap"])
+        self.assertEqual(gates.name_code.tolist(), [0, 1, 2, 3])
+        self.assertEqual(gates.target_offset.tolist(), [0, 1, 2, 3, 5])
+        self.assertEqual(gates.target_qubit.tolist(), [1, 2, 0, 0, 2])
+        self.assertEqual(gates.control_offset.tolist(), [0, 0, 2, 3, 3])
+        self.assertEqual(gates.control_qubit.tolist(), [0, 1, 2])
+        self.assertEqual(gates.control_value.tolist(), [1, 0, 1])
+        self.assertEqual(gates.parameter_offset.tolist(), [0, 0, 0, 4, 4])
+        self.assertEqual(gates.parameter.tolist(), [0.1, 0.2, 0.3, 0.4])
+
+    def test_read_only(self,):
+        qc = QuantestPyCircuit(3)
+        qc.set_gate_storage("columnar")
+        qc.add_gates(_GATES)
+
+        qc.gates[0]["target_qubit"].append(2)
+        self.assertEqual(qc.gates[0], _GATES[0])
+        with self.assertRaises(AttributeError):
+            qc.gates.append(_GATES[0])
+        with self.assertRaises(ValueError):
+            qc.gates.target_qubit[0] = 2
+
+    def test_switch_gate_storage(self,):
+        qc = QuantestPyCircuit(3)
+        for gate in _GATES[:2]:
+            qc.add_gate(dict(gate))
+        qc.set_gate_storage("columnar")
+        self.assertEqual(qc.gates, _GATES[:2])
+
+        # gates added after switching are kept in the new storage
+        for gate in _GATES[2:]:
+            qc.add_gate(dict(gate))
+        self.assertEqual(qc.gates, _GATES)
+        qc.set_gate_storage("columnar")
+        self.assertEqual(qc.gates, _GATES)
+
+        qc.set_gate_storage("list")
+        self.assertEqual(qc.gate_storage, "list")
+        self.assertIsInstance(qc.gates, list)
+        self.assertEqual(qc.gates, _GATES)
+
+    def test_pauli_circuit(self,):
+        qc = QuantestPyCircuit(4)
+        qc.set_gate_storage("columnar")
+        qc.add_gate({"name": "x", "target_qubit": [0], "control_qubit": [],
+                     "control_value": [], "parameter": []})
+        qc.add_gate({"name": "y", "target_qubit": [3], "control_qubit": [0],
+                     "control_value": [1], "parameter": []})
+        qc.add_gate({"name": "swap", "target_qubit": [1, 3],
+                     "control_qubit": [2], "control_value": [0],
+                     "parameter": []})
+
+        pc = cvt_quantestpy_circuit_to_pauli_circuit(qc)
+        self.assertIsInstance(pc, PauliCircuit)
+        self.assertEqual(pc.gate_storage, "columnar")
+        pc._execute_all_gates()
+        self.assertEqual(pc.qubit_value.tolist(), [1, 1, 0, 0])
+        self.assertIsNone(np.testing.assert_allclose(
+            pc.qubit_phase, [0., np.pi/2, 0., 0.]))
+
+    def test_raise_from_invalid_gate_storage(self,):
+        qc = QuantestPyCircuit(2)
+        with self.assertRaises(QuantestPyCircuitError) as cm:
+            qc.set_gate_storage("dict")
+        self.assertEqual(
+            cm.exception.args[0],
+            "gate_storage must be one of ['list', 'columnar']."
+        )
+
+        qc.set_gate_storage("columnar")
+        with self.assertRaises(QuantestPyCircuitError) as cm:
+            qc.add_gate({"name": "rx", "target_qubit": [0],
+                         "control_qubit": [], "control_value": [],
+                         "parameter": ["theta"]})
+        self.assertEqual(
+            cm.exception.args[0],
+            "parameter must be a list of real numbers "
+            "in the columnar gate storage."
+        )
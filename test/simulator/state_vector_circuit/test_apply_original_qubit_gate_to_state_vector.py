@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+
+
+class TestApplyOriginalQubitGateToStateVector(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_apply_original_qubit_gate_to_state_vector
+    ....
+    ----------------------------------------------------------------------
+    Ran 4 tests in 0.006s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.circ = StateVectorCircuit(3)
+        self.circ.add_gate(
+            {"name": "h", "target_qubit": [0, 2], "control_qubit": [],
+             "control_value": [], "parameter": []})
+        self.circ.add_gate(
+            {"name": "u", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [0], "parameter": [0.1, 0.2, 0.3, 0.4]})
+        self.circ.add_gate(
+            {"name": "swap", "target_qubit": [2, 0], "control_qubit": [1],
+             "control_value": [1], "parameter": []})
+        self.circ.add_gate(
+            {"name": "iswap", "target_qubit": [0, 1], "control_qubit": [],
+             "control_value": [], "parameter": []})
+        self.circ.add_gate(
+            {"name": "ry", "target_qubit": [0], "control_qubit": [1, 2],
+             "control_value": [1, 0], "parameter": [0.5]})
+
+    def tearDown(self) -> None:
+        del self.circ
+
+    def test_state_vector_equals_first_column_of_whole_gates(self,):
+        actual_vec = self.circ._get_state_vector()
+        expected_vec = self.circ._get_whole_gates()[:, 0]
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_vec, expected_vec))
+
+    def test_from_right_to_left_for_qubit_ids(self,):
+        self.circ._from_right_to_left_for_qubit_ids = True
+        actual_vec = self.circ._get_state_vector()
+        expected_vec = self.circ._get_whole_gates()[:, 0]
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_vec, expected_vec))
+
+    def test_initial_state_vector(self,):
+        init_vec = np.array([1, 1j, -1, -1j, 0, 0, 1, 1]) / np.sqrt(6.)
+        self.circ.set_initial_state_vector(init_vec)
+        actual_vec = self.circ._get_state_vector()
+        expected_vec = np.matmul(self.circ._get_whole_gates(), init_vec)
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_vec, expected_vec))
+
+    def test_batch_of_state_vectors(self,):
+        state_vec = np.eye(8, dtype=np.complex128)
+        for gate in self.circ.gates:
+            for original_qubit_gate, control_qubit, target_qubit, \
+                    control_value in self.circ._get_original_qubit_gates(gate):
+                self.circ._apply_original_qubit_gate_to_state_vector(
+                    state_vec,
+                    original_qubit_gate,
+                    control_qubit,
+                    target_qubit,
+                    control_value
+                )
+        expected_gate = self.circ._get_whole_gates()
+
+        self.assertIsNone(
+            np.testing.assert_allclose(state_vec, expected_gate))
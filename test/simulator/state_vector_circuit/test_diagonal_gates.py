@@ -0,0 +1,129 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.state_vector_circuit import (_H, _S, _T, _X, _Z,
+                                                       _is_diagonal,
+                                                       _merge_diagonal_gates)
+
+
+class TestStateVectorCircuitDiagonalGates(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_diagonal_gates
+    .....
+    ----------------------------------------------------------------------
+    Ran 5 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def test_is_diagonal(self,):
+        self.assertTrue(_is_diagonal(_Z))
+        self.assertTrue(_is_diagonal(np.array([1, 1j, -1, 1])))
+        self.assertFalse(_is_diagonal(_X))
+        self.assertFalse(_is_diagonal(_H))
+
+    def test_merge_diagonal_gates(self,):
+        original_qubit_gates = [
+            (_H, [], [0], []),
+            (_Z, [1], [0], [1]),
+            (_S, [], [2], []),
+            (_H, [], [1], []),
+            (_T, [], [1], [])
+        ]
+
+        merged_gates, num_merged_gates = _merge_diagonal_gates(
+            original_qubit_gates)
+        self.assertEqual(num_merged_gates, 2)
+        self.assertEqual(len(merged_gates), 4)
+
+        phase, control_qubit, target_qubit, control_value = merged_gates[1]
+        self.assertEqual(
+            (control_qubit, target_qubit, control_value), ([], [1, 0, 2], []))
+        # |q1 q0 q2>: z on q0 if q1 = 1, then s on q2
+        expect = np.array([1, 1j, 1, 1j, 1, 1j, -1, -1j])
+        self.assertIsNone(np.testing.assert_allclose(phase, expect))
+
+    def test_merge_only_runs_of_diagonal_gates(self,):
+        self.assertEqual(_merge_diagonal_gates([]), ([], 0))
+
+        # single diagonal gates between other gates are left as they are
+        original_qubit_gates = [
+            (_Z, [], [0], []),
+            (_H, [], [0], []),
+            (_S, [], [1], []),
+            (_X, [], [1], []),
+            (_T, [0], [1], [0]),
+            (_Z, [], [2], [])
+        ]
+
+        merged_gates, num_merged_gates = _merge_diagonal_gates(
+            original_qubit_gates)
+        self.assertEqual(num_merged_gates, 2)
+        self.assertEqual(len(merged_gates), 5)
+        for actual, expect in zip(merged_gates[:4], original_qubit_gates):
+            self.assertIs(actual, expect)
+
+        phase, control_qubit, target_qubit, control_value = merged_gates[4]
+        self.assertEqual(
+            (control_qubit, target_qubit, control_value), ([], [0, 1, 2], []))
+        # |q0 q1 q2>: t on q1 if q0 = 0, then z on q2
+        t = np.exp(1j * np.pi / 4)
+        expect = np.array([1, -1, t, -t, 1, -1, 1, -1])
+        self.assertIsNone(np.testing.assert_allclose(phase, expect))
+
+    def test_same_results_with_and_without_merging(self,):
+        for from_right_to_left_for_qubit_ids in [False, True]:
+            circ = StateVectorCircuit(3)
+            circ._from_right_to_left_for_qubit_ids = \
+                from_right_to_left_for_qubit_ids
+            circ.add_gate({"name": "h", "target_qubit": [0, 1, 2],
+                           "control_qubit": [], "control_value": [],
+                           "parameter": []})
+            circ.add_gate({"name": "p", "target_qubit": [0],
+                           "control_qubit": [2], "control_value": [1],
+                           "parameter": [0.3]})
+            circ.add_gate({"name": "rz", "target_qubit": [2, 1],
+                           "control_qubit": [], "control_value": [],
+                           "parameter": [0.5]})
+            circ.add_gate({"name": "t", "target_qubit": [1],
+                           "control_qubit": [0], "control_value": [0],
+                           "parameter": []})
+            circ.add_gate({"name": "scalar", "target_qubit": [0],
+                           "control_qubit": [], "control_value": [],
+                           "parameter": [0.7]})
+            actual_state_vec = circ._get_state_vector()
+            actual_whole_gates = circ._get_whole_gates()
+            self.assertEqual(circ._num_merged_diagonal_gates, 4)
+
+            # apply each gate without merging
+            expect_whole_gates = np.eye(8, dtype=np.complex128)
+            for gate in circ.gates:
+                for original_qubit_gate, control_qubit, target_qubit, \
+                        control_value in circ._get_original_qubit_gates(gate):
+                    expect_whole_gates = \
+                        circ._create_all_qubit_gate_from_original_qubit_gate(
+                            original_qubit_gate,
+                            control_qubit,
+                            target_qubit,
+                            control_value
+                        ) @ expect_whole_gates
+
+            self.assertIsNone(np.testing.assert_allclose(
+                actual_whole_gates, expect_whole_gates, atol=1e-12))
+            self.assertIsNone(np.testing.assert_allclose(
+                actual_state_vec, expect_whole_gates[:, 0], atol=1e-12))
+
+    def test_all_qubit_gate_of_phase_vector(self,):
+        circ = StateVectorCircuit(2)
+        actual = circ._create_all_qubit_gate_from_original_qubit_gate(
+            np.array([1, 1j]), control_qubit=[0], target_qubit=[1],
+            control_value=[0])
+        expect = np.diag([1, 1j, 1, 1])
+        self.assertIsNone(np.testing.assert_allclose(actual, expect))
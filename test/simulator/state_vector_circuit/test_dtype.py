@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.exceptions import StateVectorCircuitError
+
+
+class TestStateVectorCircuitDtype(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_dtype
+    ....
+    ----------------------------------------------------------------------
+    Ran 4 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def test_complex128_by_default(self,):
+        circ = StateVectorCircuit(1)
+        circ.add_gate({"name": "x", "target_qubit": [0], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        self.assertEqual(circ._get_state_vector().dtype, np.complex128)
+        self.assertEqual(circ._get_whole_gates().dtype, np.complex128)
+
+    def test_complex64(self,):
+        circ = StateVectorCircuit(3)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "iswap", "target_qubit": [0, 1],
+                       "control_qubit": [2], "control_value": [1],
+                       "parameter": []})
+        circ.add_gate({"name": "p", "target_qubit": [1], "control_qubit": [0],
+                       "control_value": [0], "parameter": [0.4]})
+        circ.add_gate({"name": "u", "target_qubit": [2], "control_qubit": [],
+                       "control_value": [],
+                       "parameter": [0.1, 0.2, 0.3, 0.4]})
+        expect_state_vec = circ._get_state_vector()
+        expect_whole_gates = circ._get_whole_gates()
+
+        # the gates cached in complex128 are cast again
+        circ.set_dtype(np.complex64)
+        for actual, expect in [
+                (circ._get_state_vector(), expect_state_vec),
+                (circ._get_whole_gates(), expect_whole_gates),
+                (circ._get_whole_gates(sparse=True).toarray(),
+                 expect_whole_gates)]:
+            self.assertEqual(actual.dtype, np.complex64)
+            self.assertIsNone(np.testing.assert_allclose(
+                actual, expect, atol=1e-6))
+
+        circ.set_dtype("complex128")
+        self.assertEqual(circ._get_whole_gates().dtype, np.complex128)
+        self.assertIsNone(np.testing.assert_allclose(
+            circ._get_whole_gates(), expect_whole_gates, rtol=0, atol=0))
+
+    def test_initial_state_vector_in_complex64(self,):
+        circ = StateVectorCircuit(2)
+        circ.add_gate({"name": "rx", "target_qubit": [1], "control_qubit": [],
+                       "control_value": [], "parameter": [1e-4]})
+        initial_state_vec = np.array([0., 1., 0., 0.], dtype=np.complex128)
+        circ.set_initial_state_vector(initial_state_vec)
+        circ.set_dtype(np.dtype(np.complex64))
+
+        actual = circ._get_state_vector()
+        self.assertEqual(actual.dtype, np.complex64)
+        self.assertIsNone(np.testing.assert_allclose(
+            actual, [-1j * np.sin(5e-5), np.cos(5e-5), 0., 0.], atol=1e-7))
+        # the initial state vector given is not cast in place
+        self.assertEqual(circ._initial_state_vector.dtype, np.complex128)
+
+    def test_raise_from_invalid_dtype(self,):
+        circ = StateVectorCircuit(1)
+        for dtype in [np.float32, "foo"]:
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                circ.set_dtype(dtype)
+            self.assertEqual(
+                cm.exception.args[0],
+                "dtype must be complex64 or complex128."
+            )
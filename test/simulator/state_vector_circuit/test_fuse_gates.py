@@ -0,0 +1,137 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.exceptions import StateVectorCircuitError
+from quantestpy.simulator.state_vector_circuit import (
+    _H, _X, _fuse_original_qubit_gates, _get_fused_gate)
+
+
+class TestStateVectorCircuitFuseGates(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_fuse_gates
+    ......
+    ----------------------------------------------------------------------
+    Ran 6 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def test_fused_gate(self,):
+        # cx with control qubit 1 followed by h on qubit 0, where qubit 1
+        # is the most significant.
+        actual = _get_fused_gate(
+            [(_X, [1], [0], [1]), (_H, [], [0], [])], qubits=[1, 0])
+        cx = np.array([[1, 0, 0, 0],
+                       [0, 1, 0, 0],
+                       [0, 0, 0, 1],
+                       [0, 0, 1, 0]])
+        expect = np.kron(np.eye(2), _H) @ cx
+        self.assertIsNone(np.testing.assert_allclose(actual, expect))
+
+    def test_number_of_fused_gates(self,):
+        original_qubit_gates = [
+            (_H, [], [0], []),
+            (_H, [], [1], []),
+            (_X, [0, 1], [2], [1, 1]),
+            (_H, [], [2], []),
+            (_H, [], [2], [])
+        ]
+
+        expect = [(0, 5), (2, 4), (4, 3), (5, 1), (5, 1)]
+        for max_fused_qubit in range(5):
+            fused_gates, num_fused_gates = _fuse_original_qubit_gates(
+                original_qubit_gates, max_fused_qubit)
+            self.assertEqual((num_fused_gates, len(fused_gates)),
+                             expect[max_fused_qubit])
+
+    def test_same_results_with_and_without_fusion(self,):
+        circ = StateVectorCircuit(3)
+        circ.add_gate({"name": "h", "target_qubit": [0], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [0], "control_qubit": [],
+                       "control_value": [], "parameter": [0.3]})
+        circ.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [0],
+                       "control_value": [1], "parameter": []})
+        circ.add_gate({"name": "iswap", "target_qubit": [1, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+
+        circ.set_max_fused_qubit(0)
+        expect_state_vec = circ._get_state_vector()
+        expect_whole_gates = circ._get_whole_gates()
+        self.assertEqual(circ._num_fused_gates, 0)
+
+        for max_fused_qubit in range(1, 5):
+            circ.set_max_fused_qubit(max_fused_qubit)
+            self.assertIsNone(np.testing.assert_allclose(
+                circ._get_state_vector(), expect_state_vec, atol=1e-12))
+            self.assertIsNone(np.testing.assert_allclose(
+                circ._get_whole_gates(), expect_whole_gates, atol=1e-12))
+            self.assertGreater(circ._num_fused_gates, 0)
+
+    def test_gates_wider_than_max_fused_qubit(self,):
+        # a gate on more qubits than max_fused_qubit splits the runs of
+        # gates around it and is applied as it is
+        circ = StateVectorCircuit(4)
+        circ.set_max_fused_qubit(2)
+        circ.add_gate({"name": "h", "target_qubit": [0], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [1], "control_qubit": [0],
+                       "control_value": [0], "parameter": [0.4]})
+        circ.add_gate({"name": "x", "target_qubit": [3],
+                       "control_qubit": [0, 1, 2], "control_value": [1, 0, 1],
+                       "parameter": []})
+        circ.add_gate({"name": "h", "target_qubit": [1], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        circ.add_gate({"name": "s", "target_qubit": [1], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+
+        actual_whole_gates = circ._get_whole_gates()
+        self.assertEqual(len(circ._get_fused_gates()), 3)
+        self.assertEqual(circ._num_fused_gates, 4)
+
+        circ.set_max_fused_qubit(0)
+        self.assertEqual(len(circ._get_fused_gates()), 5)
+        self.assertIsNone(np.testing.assert_allclose(
+            actual_whole_gates, circ._get_whole_gates(), atol=1e-12))
+
+    def test_fused_gates_updated(self,):
+        circ = StateVectorCircuit(3)
+        self.assertEqual(circ._get_fused_gates(), [])
+        self.assertEqual(circ._num_fused_gates, 0)
+
+        circ.add_gate({"name": "h", "target_qubit": [0], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        circ.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [0],
+                       "control_value": [1], "parameter": []})
+        self.assertEqual(len(circ._get_fused_gates()), 1)
+
+        # by add_gate
+        circ.add_gate({"name": "x", "target_qubit": [0, 1, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        self.assertEqual(len(circ._get_fused_gates()), 2)
+
+        # by set_max_fused_qubit
+        circ.set_max_fused_qubit(0)
+        self.assertEqual(len(circ._get_fused_gates()), 3)
+
+    def test_raise_from_invalid_max_fused_qubit(self,):
+        circ = StateVectorCircuit(3)
+        for max_fused_qubit in [-1, 5, 2.]:
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                circ.set_max_fused_qubit(max_fused_qubit)
+            self.assertEqual(
+                cm.exception.args[0],
+                "max_fused_qubit must be an integer from 0 to 4."
+            )
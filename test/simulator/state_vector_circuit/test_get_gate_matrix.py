@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.state_vector_circuit import (
+    _X, _get_gate_matrix, _get_parametric_gate_matrix, _rx, _Sdg, _u)
+
+
+class TestStateVectorCircuitGetGateMatrix(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_get_gate_matrix
+    ....
+    ----------------------------------------------------------------------
+    Ran 4 tests in 0.002s
+
+    OK
+    $
+    """
+
+    def test_constant_gate(self,):
+        self.assertIs(_get_gate_matrix("x", []), _X)
+        self.assertIs(_get_gate_matrix("sdg", []), _Sdg)
+        self.assertFalse(_X.flags.writeable)
+
+    def test_parametric_gate(self,):
+        actual = _get_gate_matrix("u", [0.1, 0.2, 0.3, 0.4])
+        expect = _u([0.1, 0.2, 0.3, 0.4])
+        self.assertIsNone(np.testing.assert_allclose(actual, expect))
+        self.assertFalse(actual.flags.writeable)
+
+    def test_parametric_gate_cached_for_same_parameter(self,):
+        _get_parametric_gate_matrix.cache_clear()
+
+        actual_0 = _get_gate_matrix("rx", [0.3])
+        actual_1 = _get_gate_matrix("rx", [np.float64(0.3)])
+        self.assertIs(actual_0, actual_1)
+        self.assertEqual(_get_parametric_gate_matrix.cache_info().hits, 1)
+
+        # parameters are not rounded
+        for parameter in [0.3 + 1e-15, 0.31]:
+            actual_2 = _get_gate_matrix("rx", [parameter])
+            self.assertIsNot(actual_0, actual_2)
+            self.assertIsNone(np.testing.assert_allclose(
+                actual_2, _rx([parameter]), rtol=0, atol=0))
+        self.assertEqual(_get_parametric_gate_matrix.cache_info().hits, 1)
+
+        actual_3 = _get_gate_matrix("rx", [1e-13])
+        self.assertIsNone(np.testing.assert_allclose(
+            actual_3[0, 1], -0.5e-13j, rtol=1e-12))
+
+    def test_shared_among_circuits(self,):
+        gate = {"name": "ry", "target_qubit": [0], "control_qubit": [],
+                "control_value": [], "parameter": [0.7]}
+        circ_0 = StateVectorCircuit(1)
+        circ_0.add_gate(gate)
+        circ_1 = StateVectorCircuit(2)
+        circ_1.add_gate(gate)
+
+        matrix_0 = circ_0._get_original_qubit_gates(gate)[0][0]
+        matrix_1 = circ_1._get_original_qubit_gates(gate)[0][0]
+        self.assertIs(matrix_0, matrix_1)
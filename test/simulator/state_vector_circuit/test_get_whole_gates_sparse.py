@@ -0,0 +1,74 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.state_vector_circuit import _H, _X
+
+
+@unittest.skipIf(importlib.util.find_spec("scipy") is None,
+                 "SciPy is not installed.")
+class TestStateVectorCircuitGetWholeGatesSparse(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_get_whole_gates_sparse
+    ...
+    ----------------------------------------------------------------------
+    Ran 3 tests in 0.006s
+
+    OK
+    $
+    """
+
+    def test_all_qubit_gate_nonzero_elements(self,):
+        circ = StateVectorCircuit(3)
+        actual_gate = circ._create_all_qubit_gate_from_original_qubit_gate(
+            _X, control_qubit=[0, 1], target_qubit=[2], control_value=[1, 0],
+            sparse=True)
+
+        # only one element per column for a controlled x gate
+        self.assertEqual(actual_gate.nnz, 8)
+
+        expected_gate = \
+            circ._create_all_qubit_gate_from_original_qubit_gate(
+                _X, control_qubit=[0, 1], target_qubit=[2],
+                control_value=[1, 0])
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_gate.toarray(), expected_gate))
+
+    def test_all_qubit_gate_multiple_targets(self,):
+        circ = StateVectorCircuit(3)
+        circ._from_right_to_left_for_qubit_ids = True
+        actual_gate = circ._create_all_qubit_gate_from_original_qubit_gate(
+            _H, control_qubit=[1], target_qubit=[0, 2], control_value=[1],
+            sparse=True)
+        expected_gate = \
+            circ._create_all_qubit_gate_from_original_qubit_gate(
+                _H, control_qubit=[1], target_qubit=[0, 2],
+                control_value=[1])
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_gate.toarray(), expected_gate))
+
+    def test_whole_gates(self,):
+        circ = StateVectorCircuit(3)
+        circ.add_gate(
+            {"name": "h", "target_qubit": [0], "control_qubit": [],
+             "control_value": [], "parameter": []})
+        circ.add_gate(
+            {"name": "swap", "target_qubit": [0, 2], "control_qubit": [1],
+             "control_value": [0], "parameter": []})
+        circ.add_gate(
+            {"name": "rz", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [1], "parameter": [np.pi/3]})
+
+        actual_gate = circ._get_whole_gates(sparse=True)
+        expected_gate = circ._get_whole_gates()
+
+        self.assertIsNone(
+            np.testing.assert_allclose(actual_gate.toarray(), expected_gate))
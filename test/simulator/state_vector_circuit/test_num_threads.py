@@ -0,0 +1,118 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.exceptions import StateVectorCircuitError
+from quantestpy.simulator.state_vector_circuit import (
+    _H, _ISWAP, _apply_gate_to_state_tensor)
+
+
+class TestStateVectorCircuitNumThreads(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_num_threads
+    ......
+    ----------------------------------------------------------------------
+    Ran 6 tests in 0.200s
+
+    OK
+    $
+    """
+
+    def test_apply_gate_with_threads(self,):
+        rng = np.random.default_rng(0)
+        state_tensor = rng.normal(size=(2,) * 16 + (3,)) + 0j
+        for gate, control_axis, target_axis, control_value in [
+                (_H, [2], [0, 5], [0]),
+                (_ISWAP, [], [15, 1], []),
+                (np.array([1, 1j]), [0, 1], [7], [1, 1])]:
+            expect = state_tensor.copy()
+            _apply_gate_to_state_tensor(
+                expect, gate, control_axis, target_axis, control_value)
+            for num_threads in [2, 3, 4]:
+                actual = state_tensor.copy()
+                _apply_gate_to_state_tensor(
+                    actual, gate, control_axis, target_axis, control_value,
+                    num_threads)
+                self.assertIsNone(np.testing.assert_allclose(actual, expect))
+
+    def test_apply_gate_without_axes_to_split(self,):
+        rng = np.random.default_rng(1)
+
+        # the gate acts on all the qubit axes
+        state_tensor = rng.normal(size=(2,) * 16 + (3,)) + 0j
+        expect = state_tensor.copy()
+        _apply_gate_to_state_tensor(
+            expect, _H, [], list(range(16)), [])
+        actual = state_tensor.copy()
+        _apply_gate_to_state_tensor(
+            actual, _H, [], list(range(16)), [], 4)
+        self.assertIsNone(np.testing.assert_allclose(actual, expect))
+
+        # more threads than the free axes of a small tensor
+        state_tensor = rng.normal(size=(2,) * 3) + 0j
+        expect = state_tensor.copy()
+        _apply_gate_to_state_tensor(expect, _H, [0], [2], [0])
+        for min_amplitudes_per_thread in [1, 2**20]:
+            with patch("quantestpy.simulator.state_vector_circuit."
+                       "_MIN_AMPLITUDES_PER_THREAD",
+                       min_amplitudes_per_thread):
+                actual = state_tensor.copy()
+                _apply_gate_to_state_tensor(
+                    actual, _H, [0], [2], [0], 64)
+                self.assertIsNone(np.testing.assert_allclose(actual, expect))
+
+    def test_same_state_vector_with_threads(self,):
+        circ = StateVectorCircuit(16)
+        circ.add_gate({"name": "h", "target_qubit": list(range(16)),
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3], "control_qubit": [0],
+                       "control_value": [1], "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 15],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        circ.add_gate({"name": "x", "target_qubit": [14],
+                       "control_qubit": list(range(14)),
+                       "control_value": [0, 1] * 7, "parameter": []})
+        expect = circ._get_state_vector()
+
+        for num_threads in [2, 3, 64]:
+            circ.set_num_threads(num_threads)
+            self.assertIsNone(np.testing.assert_allclose(
+                circ._get_state_vector(), expect, atol=1e-12))
+
+    def test_num_threads_from_environment_variable(self,):
+        with patch.dict(os.environ, {"QUANTESTPY_NUM_THREADS": "3"}):
+            self.assertEqual(StateVectorCircuit(2)._num_threads, 3)
+
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(StateVectorCircuit(2)._num_threads, 1)
+
+    def test_raise_from_invalid_environment_variable(self,):
+        with patch.dict(os.environ, {"QUANTESTPY_NUM_THREADS": "0"}):
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                StateVectorCircuit(2)
+            self.assertEqual(
+                cm.exception.args[0],
+                "QUANTESTPY_NUM_THREADS must be a positive integer."
+            )
+
+    def test_raise_from_invalid_num_threads(self,):
+        circ = StateVectorCircuit(2)
+        for num_threads in [0, 2.]:
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                circ.set_num_threads(num_threads)
+            self.assertEqual(
+                cm.exception.args[0],
+                "num_threads must be a positive integer."
+            )
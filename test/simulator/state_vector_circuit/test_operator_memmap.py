@@ -0,0 +1,264 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from quantestpy import (QuantestPyCircuit, StateVectorCircuit,
+                        assert_circuit_equivalent_to_operator,
+                        assert_equivalent_operators)
+from quantestpy.exceptions import QuantestPyAssertionError, QuantestPyError
+from quantestpy.simulator.exceptions import StateVectorCircuitError
+from quantestpy.simulator.state_vector_circuit import \
+    cvt_quantestpy_circuit_to_state_vector_circuit
+
+
+class TestStateVectorCircuitOperatorMemmap(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_operator_memmap
+    ..........
+    ----------------------------------------------------------------------
+    Ran 10 tests in 0.050s
+
+    OK
+    $
+    """
+
+    def setUp(self) -> None:
+        self.memmap_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.memmap_dir.cleanup()
+
+    def test_same_operator_by_tiles(self,):
+        circ = StateVectorCircuit(4)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3],
+                       "control_qubit": [0], "control_value": [1],
+                       "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 3],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        expect = circ._get_whole_gates()
+
+        for tile_size in [1, 3, 16, 100]:
+            circ.set_operator_memmap(self.memmap_dir.name, tile_size)
+            actual = circ._get_whole_gates()
+            self.assertIsInstance(actual, np.memmap)
+            self.assertIsNone(np.testing.assert_allclose(
+                actual, expect, atol=1e-12))
+            del actual
+
+        # the temporary files are removed
+        self.assertEqual(os.listdir(self.memmap_dir.name), [])
+
+    def test_empty_circuit_by_tiles(self,):
+        circ = StateVectorCircuit(3)
+        circ.set_operator_memmap(self.memmap_dir.name, 3)
+        actual = circ._get_whole_gates()
+        self.assertIsInstance(actual, np.memmap)
+        self.assertIsNone(np.testing.assert_allclose(actual, np.eye(8)))
+        del actual
+
+    def test_operator_memmap_from_environment_variables(self,):
+        with patch.dict(os.environ,
+                        {"QUANTESTPY_OPERATOR_MEMMAP_DIR":
+                         self.memmap_dir.name,
+                         "QUANTESTPY_OPERATOR_TILE_SIZE": "5"}):
+            circ = StateVectorCircuit(2)
+            self.assertEqual(circ._operator_memmap_dir, self.memmap_dir.name)
+            self.assertEqual(circ._operator_tile_size, 5)
+
+        with patch.dict(os.environ, clear=True):
+            circ = StateVectorCircuit(2)
+            self.assertIsNone(circ._operator_memmap_dir)
+            self.assertEqual(circ._operator_tile_size, 256)
+
+    def test_raise_from_invalid_environment_variable(self,):
+        with patch.dict(os.environ, {"QUANTESTPY_OPERATOR_TILE_SIZE": "0"}):
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                StateVectorCircuit(2)
+            self.assertEqual(
+                cm.exception.args[0],
+                "QUANTESTPY_OPERATOR_TILE_SIZE must be a positive integer."
+            )
+
+    def test_raise_from_invalid_arguments(self,):
+        circ = StateVectorCircuit(2)
+        with self.assertRaises(StateVectorCircuitError) as cm:
+            circ.set_operator_memmap(
+                os.path.join(self.memmap_dir.name, "missing"))
+        self.assertEqual(
+            cm.exception.args[0],
+            "directory must be an existing directory or None."
+        )
+
+        for tile_size in [0, 2.]:
+            with self.assertRaises(StateVectorCircuitError) as cm:
+                circ.set_operator_memmap(self.memmap_dir.name, tile_size)
+            self.assertEqual(
+                cm.exception.args[0],
+                "tile_size must be a positive integer."
+            )
+
+    def test_equivalent_operators_by_tiles(self,):
+        circ = StateVectorCircuit(4)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3],
+                       "control_qubit": [0], "control_value": [1],
+                       "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 3],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        expect = circ._get_whole_gates()
+        circ.set_operator_memmap(self.memmap_dir.name, 3)
+
+        with patch.dict(os.environ, {"QUANTESTPY_OPERATOR_TILE_SIZE": "3"}):
+            self.assertIsNone(assert_equivalent_operators(
+                circ._get_whole_gates(), expect * 1j,
+                up_to_global_phase=True))
+
+            wrong = expect.copy()
+            wrong[:, 7] *= -1
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_equivalent_operators(
+                    circ._get_whole_gates(), wrong, msg="tiles")
+            self.assertIn("Columns: 6 to 8", cm.exception.args[0])
+            self.assertIn("tiles", cm.exception.args[0])
+
+    def test_circuit_equivalent_to_operator_by_tiles(self,):
+        qc = QuantestPyCircuit(4)
+        qc.add_gate({"name": "h", "target_qubit": [0, 2],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": []})
+        qc.add_gate({"name": "ry", "target_qubit": [3],
+                     "control_qubit": [0], "control_value": [1],
+                     "parameter": [0.3]})
+        qc.add_gate({"name": "swap", "target_qubit": [1, 3],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": []})
+        qc.add_gate({"name": "rz", "target_qubit": [2],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": [0.7]})
+        circ = StateVectorCircuit(4)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3],
+                       "control_qubit": [0], "control_value": [1],
+                       "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 3],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        operator_ = circ._get_whole_gates()
+
+        with patch.dict(os.environ,
+                        {"QUANTESTPY_OPERATOR_MEMMAP_DIR":
+                         self.memmap_dir.name,
+                         "QUANTESTPY_OPERATOR_TILE_SIZE": "4"}):
+            self.assertIsNone(
+                assert_circuit_equivalent_to_operator(qc, operator_))
+
+            with self.assertRaises(QuantestPyAssertionError):
+                assert_circuit_equivalent_to_operator(qc, np.eye(16))
+
+    def test_tile_size_of_comparison(self,):
+        circ = StateVectorCircuit(4)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3],
+                       "control_qubit": [0], "control_value": [1],
+                       "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 3],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        wrong = circ._get_whole_gates()
+        wrong[:, 7] *= -1
+        circ.set_operator_memmap(self.memmap_dir.name)
+
+        with patch.dict(os.environ, {"QUANTESTPY_OPERATOR_TILE_SIZE": "4"}):
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_equivalent_operators(
+                    circ._get_whole_gates(), wrong, tile_size=5)
+            self.assertIn("Columns: 5 to 9", cm.exception.args[0])
+
+            for tile_size in [0, 2.]:
+                with self.assertRaises(QuantestPyError) as cm:
+                    assert_equivalent_operators(
+                        circ._get_whole_gates(), wrong, tile_size=tile_size)
+                self.assertEqual(
+                    cm.exception.args[0],
+                    "tile_size must be a positive integer or None."
+                )
+
+    def test_tile_size_set_for_circuit(self,):
+        circ = StateVectorCircuit(4)
+        circ.add_gate({"name": "h", "target_qubit": [0, 2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "ry", "target_qubit": [3],
+                       "control_qubit": [0], "control_value": [1],
+                       "parameter": [0.3]})
+        circ.add_gate({"name": "swap", "target_qubit": [1, 3],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "rz", "target_qubit": [2],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": [0.7]})
+        wrong = circ._get_whole_gates()
+        wrong[:, 7] *= -1
+        circ.set_operator_memmap(self.memmap_dir.name, 3)
+
+        # the tile size set for the circuit overrides the environment
+        # variable in the comparison as well
+        with patch.dict(os.environ, {"QUANTESTPY_OPERATOR_TILE_SIZE": "8"}):
+            with self.assertRaises(QuantestPyAssertionError) as cm:
+                assert_circuit_equivalent_to_operator(circ, wrong)
+        self.assertIn("Columns: 6 to 8", cm.exception.args[0])
+
+    def test_converted_circuit_follows_environment_variables(self,):
+        qc = QuantestPyCircuit(4)
+        qc.add_gate({"name": "h", "target_qubit": [0, 2],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": []})
+        qc.add_gate({"name": "ry", "target_qubit": [3],
+                     "control_qubit": [0], "control_value": [1],
+                     "parameter": [0.3]})
+        qc.add_gate({"name": "swap", "target_qubit": [1, 3],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": []})
+        qc.add_gate({"name": "rz", "target_qubit": [2],
+                     "control_qubit": [], "control_value": [],
+                     "parameter": [0.7]})
+        with patch.dict(os.environ,
+                        {"QUANTESTPY_OPERATOR_MEMMAP_DIR":
+                         self.memmap_dir.name}):
+            svc = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+            self.assertEqual(svc._operator_memmap_dir, self.memmap_dir.name)
+
+        # not the settings of the circuit cached by the conversion
+        with patch.dict(os.environ, clear=True):
+            svc = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+            self.assertIsNone(svc._operator_memmap_dir)
@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+
+from quantestpy import StateVectorCircuit
+from quantestpy.simulator.state_vector_circuit import (
+    _H, _ISWAP, _SWAP, _X, _Y, _get_permutation_and_phase)
+
+
+class TestStateVectorCircuitPermutationGates(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest \
+        test.simulator.state_vector_circuit.test_permutation_gates
+    ....
+    ----------------------------------------------------------------------
+    Ran 4 tests in 0.010s
+
+    OK
+    $
+    """
+
+    def test_get_permutation_and_phase(self,):
+        permutation, phase = _get_permutation_and_phase(_X)
+        self.assertEqual(permutation.tolist(), [1, 0])
+        self.assertEqual(phase.tolist(), [1, 1])
+
+        permutation, phase = _get_permutation_and_phase(_Y)
+        self.assertEqual(permutation.tolist(), [1, 0])
+        self.assertEqual(phase.tolist(), [-1j, 1j])
+
+        permutation, phase = _get_permutation_and_phase(_ISWAP)
+        self.assertEqual(permutation.tolist(), [0, 2, 1, 3])
+        self.assertEqual(phase.tolist(), [1, 1j, 1j, 1])
+
+        self.assertIsNone(_get_permutation_and_phase(_H))
+
+    def test_swap_as_one_gate(self,):
+        circ = StateVectorCircuit(3)
+        gate = {"name": "swap", "target_qubit": [0, 2],
+                "control_qubit": [1], "control_value": [0],
+                "parameter": []}
+        self.assertEqual(
+            circ._get_original_qubit_gates(gate),
+            [(_SWAP, [1], [0, 2], [0])]
+        )
+
+    def test_controlled_swap_and_iswap(self,):
+        # |q0 q1 q2> = |1 0 0>: cswap(q1 = 0) moves q0 to q2, then
+        # ciswap(q0 = 0) moves q2 back to q1 with a phase i.
+        circ = StateVectorCircuit(3)
+        circ.add_gate({"name": "x", "target_qubit": [0],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+        circ.add_gate({"name": "swap", "target_qubit": [0, 2],
+                       "control_qubit": [1], "control_value": [0],
+                       "parameter": []})
+        circ.add_gate({"name": "iswap", "target_qubit": [1, 2],
+                       "control_qubit": [0], "control_value": [0],
+                       "parameter": []})
+
+        expect = np.zeros(8, dtype=np.complex128)
+        expect[0b010] = 1j
+        self.assertIsNone(np.testing.assert_allclose(
+            circ._get_state_vector(), expect))
+
+    def test_whole_gates_by_gather(self,):
+        circ = StateVectorCircuit(3)
+        circ.set_max_fused_qubit(0)
+        circ.add_gate({"name": "iswap", "target_qubit": [2, 0],
+                       "control_qubit": [1], "control_value": [1],
+                       "parameter": []})
+        circ.add_gate({"name": "y", "target_qubit": [0, 1],
+                       "control_qubit": [], "control_value": [],
+                       "parameter": []})
+
+        expect = np.eye(8, dtype=np.complex128)
+        for original_qubit_gate, control_qubit, target_qubit, \
+                control_value in circ._get_fused_gates():
+            expect = circ._create_all_qubit_gate_from_original_qubit_gate(
+                original_qubit_gate,
+                control_qubit,
+                target_qubit,
+                control_value
+            ) @ expect
+
+        self.assertIsNone(np.testing.assert_allclose(
+            circ._get_whole_gates(), expect))
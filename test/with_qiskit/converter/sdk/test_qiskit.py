@@ -1,11 +1,14 @@
 import unittest
 
 import numpy as np
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import MCXGate
 
 from quantestpy.converter.converter_to_quantestpy_circuit import \
     cvt_input_circuit_to_quantestpy_circuit
-from quantestpy.converter.sdk.qiskit import _IMPLEMENTED_QISKIT_GATES
+from quantestpy.converter.sdk.qiskit import (_IMPLEMENTED_QISKIT_GATES,
+                                             _cvt_qiskit_to_quantestpy_circuit,
+                                             _parse_qiskit_gate_name)
 from quantestpy.exceptions import QuantestPyError
 from quantestpy.simulator.state_vector_circuit import \
     cvt_quantestpy_circuit_to_state_vector_circuit
@@ -17,9 +20,9 @@ class TestQiskit(unittest.TestCase):
     $ pwd
     {Your directory where you git-cloned quantestpy}/quantestpy
     $ python -m unittest test.with_qiskit.converter.sdk.test_qiskit
-    .
+    ....
     ----------------------------------------------------------------------
-    Ran 1 test in 0.001s
+    Ran 4 tests in 0.010s
 
     OK
     """
@@ -38,3 +41,40 @@ class TestQiskit(unittest.TestCase):
             return svc
 
         self.assertEqual(cm.exception.args[0], expected_error_msg)
+
+    def test_parse_qiskit_gate_name(self,):
+        self.assertEqual(_parse_qiskit_gate_name("ccx_o1"), ("ccx", 1))
+        self.assertEqual(_parse_qiskit_gate_name("mcx_o10"), ("mcx", 10))
+        self.assertEqual(_parse_qiskit_gate_name("mcphase"), ("mcphase", None))
+        self.assertEqual(_parse_qiskit_gate_name("x_ox"), ("x_ox", None))
+
+    def test_control_value_from_ctrl_state(self,):
+        qc = QuantumCircuit(5)
+        qc.ccx(0, 1, 2, ctrl_state=1)
+        qc.append(MCXGate(3, ctrl_state=5), [4, 1, 3, 0])
+        qc.cp(0.5, 3, 2, ctrl_state=0)
+
+        actual_gates = _cvt_qiskit_to_quantestpy_circuit(qc).gates
+        expected_gates = [
+            {"name": "x", "target_qubit": [2], "control_qubit": [0, 1],
+             "control_value": [1, 0], "parameter": []},
+            {"name": "x", "target_qubit": [0], "control_qubit": [4, 1, 3],
+             "control_value": [1, 0, 1], "parameter": []},
+            {"name": "p", "target_qubit": [2], "control_qubit": [3],
+             "control_value": [0], "parameter": [0.5]}
+        ]
+        self.assertEqual(actual_gates, expected_gates)
+
+    def test_qubits_of_registers_and_global_phase(self,):
+        qc = QuantumCircuit(QuantumRegister(2, "a"), QuantumRegister(2, "b"))
+        qc.cx(qc.qregs[1][0], qc.qregs[0][1])
+        qc.global_phase = np.pi / 4
+
+        actual_gates = _cvt_qiskit_to_quantestpy_circuit(qc).gates
+        expected_gates = [
+            {"name": "x", "target_qubit": [1], "control_qubit": [2],
+             "control_value": [1], "parameter": []},
+            {"name": "scalar", "target_qubit": [0], "control_qubit": [],
+             "control_value": [], "parameter": [np.pi / 4]}
+        ]
+        self.assertEqual(actual_gates, expected_gates)
@@ -0,0 +1,160 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from quantestpy import QuantestPyCircuit, StateVectorCircuit
+from quantestpy.converter.converter_to_quantestpy_circuit import (
+    _QUANTESTPY_CIRCUIT_CACHE, cvt_input_circuit_to_quantestpy_circuit)
+from quantestpy.simulator.pauli_circuit import (
+    _PAULI_CIRCUIT_CACHE, cvt_quantestpy_circuit_to_pauli_circuit)
+from quantestpy.simulator.quantestpy_circuit import _ConversionCache
+from quantestpy.simulator.state_vector_circuit import (
+    _STATE_VECTOR_CIRCUIT_CACHE,
+    cvt_quantestpy_circuit_to_state_vector_circuit)
+
+
+class TestConversionCache(unittest.TestCase):
+    """
+    How to execute this test:
+    $ pwd
+    {Your directory where you git-cloned quantestpy}/quantestpy
+    $ python -m unittest test.with_qiskit.test_conversion_cache
+    .......
+    ----------------------------------------------------------------------
+    Ran 7 tests in 0.050s
+
+    OK
+    """
+
+    def setUp(self) -> None:
+        _QUANTESTPY_CIRCUIT_CACHE.clear()
+        _PAULI_CIRCUIT_CACHE.clear()
+        _STATE_VECTOR_CIRCUIT_CACHE.clear()
+
+    def test_cvt_qiskit_from_cache(self,):
+        input_circuit = QuantumCircuit(3)
+        input_circuit.h(0)
+        input_circuit.cx(0, 2, ctrl_state=0)
+
+        qc_a = cvt_input_circuit_to_quantestpy_circuit(input_circuit)
+        qc_a.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [],
+                       "control_value": [], "parameter": []})
+        qc_a.gates[0]["target_qubit"].append(1)
+        qc_b = cvt_input_circuit_to_quantestpy_circuit(input_circuit)
+
+        self.assertEqual(_QUANTESTPY_CIRCUIT_CACHE._num_hit, 1)
+        self.assertIsNot(qc_a, qc_b)
+        self.assertEqual(
+            qc_b.gates,
+            [{"name": "h", "target_qubit": [0], "control_qubit": [],
+              "control_value": [], "parameter": []},
+             {"name": "x", "target_qubit": [2], "control_qubit": [0],
+              "control_value": [0], "parameter": []}])
+
+    def test_cvt_qiskit_modified_in_place(self,):
+        input_circuit = QuantumCircuit(2)
+        input_circuit.rx(0.5, 0)
+        qc_a = cvt_input_circuit_to_quantestpy_circuit(input_circuit)
+
+        input_circuit.data[0].operation.params[0] = 0.25
+        input_circuit.x(1)
+        qc_b = cvt_input_circuit_to_quantestpy_circuit(input_circuit)
+
+        self.assertEqual(_QUANTESTPY_CIRCUIT_CACHE._num_hit, 0)
+        self.assertEqual(qc_a.gates[0]["parameter"], [0.5])
+        self.assertEqual(qc_b.gates[0]["parameter"], [0.25])
+        self.assertEqual(len(qc_b.gates), 2)
+
+    def test_cvt_qasm_from_cache(self,):
+        qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\nx q[0];\n'
+        qc_a = cvt_input_circuit_to_quantestpy_circuit(qasm)
+        qc_b = cvt_input_circuit_to_quantestpy_circuit(qasm)
+
+        self.assertEqual(_QUANTESTPY_CIRCUIT_CACHE._num_hit, 1)
+        self.assertIsNot(qc_a, qc_b)
+        self.assertEqual(qc_a.gates, qc_b.gates)
+
+    def test_cvt_pauli_circuit_from_cache(self,):
+        qc = QuantestPyCircuit(2)
+        qc.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [0],
+                     "control_value": [1], "parameter": []})
+        pc_a = cvt_quantestpy_circuit_to_pauli_circuit(qc)
+        pc_a.set_qubit_value([0], [1])
+        pc_b = cvt_quantestpy_circuit_to_pauli_circuit(qc)
+
+        self.assertEqual(_PAULI_CIRCUIT_CACHE._num_hit, 1)
+        self.assertEqual(pc_b.qubit_value.tolist(), [0, 0])
+        # the compiled program is shared
+        self.assertIs(pc_a._program, pc_b._program)
+
+        qc.add_gate({"name": "z", "target_qubit": [0], "control_qubit": [],
+                     "control_value": [], "parameter": []})
+        pc_c = cvt_quantestpy_circuit_to_pauli_circuit(qc)
+        self.assertEqual(_PAULI_CIRCUIT_CACHE._num_hit, 1)
+        self.assertEqual(len(pc_c.gates), 2)
+
+    def test_cvt_state_vector_circuit_from_cache(self,):
+        qc = QuantestPyCircuit(2)
+        qc.add_gate({"name": "h", "target_qubit": [0], "control_qubit": [],
+                     "control_value": [], "parameter": []})
+        qc.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [0],
+                     "control_value": [1], "parameter": []})
+        svc_a = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+        svc_b = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+
+        self.assertEqual(_STATE_VECTOR_CIRCUIT_CACHE._num_hit, 1)
+        # the gates are fused once for all the copies
+        entry = _STATE_VECTOR_CIRCUIT_CACHE._circuits[qc._get_fingerprint()]
+        self.assertIsNotNone(entry._fused_gates)
+        self.assertIs(svc_a._fused_gates, entry._fused_gates)
+        self.assertIs(svc_b._fused_gates, entry._fused_gates)
+
+        svc_b.add_gate({"name": "z", "target_qubit": [1],
+                        "control_qubit": [], "control_value": [],
+                        "parameter": []})
+        self.assertIsNot(svc_b._get_fused_gates(), entry._fused_gates)
+        self.assertIs(svc_a._fused_gates, entry._fused_gates)
+
+    def test_cvt_state_vector_circuit_follows_settings(self,):
+        qc = QuantestPyCircuit(2)
+        qc.add_gate({"name": "x", "target_qubit": [1], "control_qubit": [],
+                     "control_value": [], "parameter": []})
+
+        with patch.dict(os.environ, {"QUANTESTPY_NUM_THREADS": "1"}):
+            svc = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+        self.assertEqual(svc._num_threads, 1)
+        with patch.dict(os.environ, {"QUANTESTPY_NUM_THREADS": "4"}):
+            svc = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+        self.assertEqual(svc._num_threads, 4)
+        self.assertEqual(_STATE_VECTOR_CIRCUIT_CACHE._num_hit, 1)
+
+        # the settings of an input StateVectorCircuit are carried over
+        input_svc = StateVectorCircuit(2)
+        input_svc.add_gates(qc.gates)
+        input_svc.set_dtype("complex64")
+        input_svc.set_num_threads(2)
+        input_svc.set_max_fused_qubit(0)
+        for _ in range(2):
+            svc = cvt_quantestpy_circuit_to_state_vector_circuit(input_svc)
+            self.assertEqual(svc._dtype, np.complex64)
+            self.assertEqual(svc._num_threads, 2)
+            self.assertEqual(svc._max_fused_qubit, 0)
+            self.assertEqual(svc._get_fused_gates()[0][0].dtype,
+                             np.complex64)
+
+        # and the fused gates of the default settings are kept
+        svc = cvt_quantestpy_circuit_to_state_vector_circuit(qc)
+        self.assertEqual(svc._dtype, np.complex128)
+        self.assertEqual(svc._max_fused_qubit, 2)
+        self.assertIsNotNone(svc._fused_gates)
+
+    def test_least_recently_used_evicted(self,):
+        cache = _ConversionCache(maxsize=2)
+        for key in ["a", "b", "a", "c"]:
+            cache.get(key, lambda: QuantestPyCircuit(1))
+
+        self.assertEqual(list(cache._circuits.keys()), ["a", "c"])
+        self.assertEqual((cache._num_hit, cache._num_miss), (1, 3))